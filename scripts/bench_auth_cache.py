@@ -0,0 +1,94 @@
+"""
+Benchmark — latency of a protected endpoint (GET /favourites/ for a user with none) with AUTH_CACHE_ENABLED off
+and on, and with the lower(username) index dropped, so the uncached lookup scans users as it did before.
+
+Runs the app in-process against a throwaway SQLite file of --users users; a networked Postgres adds a round trip
+to every uncached lookup on top of these numbers.
+
+Usage:
+    python scripts/bench_auth_cache.py [--users 50000] [--requests 2000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from src.core.security import create_access_token
+from src.db.database import Base, get_db
+from src.db.tables import User
+from src.main import app
+from src.services.auth_cache import auth_cache, clear_auth_cache
+from src.utils import config
+
+
+def seed(engine, users: int) -> str:
+    rows = [{"id": str(uuid.uuid4()), "firstname": "Bench", "lastname": "User", "username": f"Bench{i}",
+             "email": f"bench{i}@example.com"} for i in range(users)]
+    with engine.begin() as conn:
+        conn.execute(insert(User), rows)
+    return rows[-1]["username"]
+
+
+def measure(client: TestClient, headers: dict, requests: int) -> list:
+    client.get("/favourites/", headers=headers)
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.get("/favourites/", headers=headers)
+        timings.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.text
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': seed(engine, args.users)})}"}
+        session_factory = sessionmaker(bind=engine)
+
+        def override_get_db():
+            with session_factory() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        print(f"{'mode':<32} {'p50 (ms)':>9} {'p95 (ms)':>9}")
+        with TestClient(app) as client:
+            modes = [("no cache, no lower() index", False, True), ("no cache", False, False), ("cache", True, False)]
+            for label, enabled, drop_index in modes:
+                if drop_index:
+                    with engine.begin() as conn:
+                        conn.execute(text("DROP INDEX ix_users_username_lower"))
+                config.AUTH_CACHE_ENABLED = enabled
+                clear_auth_cache()
+                timings = sorted(measure(client, headers, args.requests))
+                print(f"{label:<32} {statistics.median(timings) * 1000:>9.3f} "
+                      f"{timings[int(len(timings) * 0.95)] * 1000:>9.3f}")
+                if drop_index:
+                    with engine.begin() as conn:
+                        conn.execute(text("CREATE INDEX ix_users_username_lower ON users (lower(username))"))
+        print(f"cache hit rate: {auth_cache.stats()['hit_rate']:.3f}")
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
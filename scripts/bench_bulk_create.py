@@ -0,0 +1,94 @@
+"""
+Benchmark — games created per second through POST /games/ one at a time versus POST /games/bulk.
+
+Runs the app against a throwaway in-memory SQLite database with the current user overridden.
+
+Usage:
+    python scripts/bench_bulk_create.py [--games 5000] [--batch 1000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.users import get_current_active_user
+from src.db.database import Base, get_db
+from src.db.tables import Game, User
+from src.main import app
+from tests.utils import valid_public_game_payload
+
+
+def make_client():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with session_factory() as session:
+        user = User(id=str(uuid.uuid4()), firstname="Bench", lastname="User", username="bench",
+                    email="bench@example.com", country_of_origin="GB")
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        session.expunge(user)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    return TestClient(app), session_factory
+
+
+def count_games(session_factory) -> int:
+    with session_factory() as session:
+        return session.query(func.count(Game.id)).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    payloads = [valid_public_game_payload({"name": f"Imported {i}"}) for i in range(args.games)]
+
+    client, session_factory = make_client()
+    started = time.perf_counter()
+    for payload in payloads:
+        assert client.post("/games/", json=payload).status_code == 201
+    single = time.perf_counter() - started
+    assert count_games(session_factory) == args.games
+
+    client, session_factory = make_client()
+    started = time.perf_counter()
+    for start in range(0, args.games, args.batch):
+        response = client.post("/games/bulk", json=payloads[start:start + args.batch])
+        assert response.status_code == 200 and response.json()["failed"] == 0
+    bulk = time.perf_counter() - started
+    assert count_games(session_factory) == args.games
+
+    app.dependency_overrides.clear()
+    print(f"{args.games} games, bulk batches of {args.batch}\n")
+    print(f"{'path':<12} {'seconds':>8} {'games/s':>9}")
+    print(f"{'single':<12} {single:>8.2f} {args.games / single:>9.0f}")
+    print(f"{'bulk':<12} {bulk:>8.2f} {args.games / bulk:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark — rows transferred and statements issued by the GET /games listing query,
+comparing the old joinedload + DISTINCT query with the two-phase id page + batched children fetch.
+
+Runs against a throwaway in-memory SQLite catalog where every game has 12 equipment and 12 setting tags.
+
+Usage:
+    python scripts/bench_catalog_listing.py [--games 2000] [--tags 12] [--runs 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker, joinedload
+
+from src.api.games import GAME_SORT_KEYS, fetch_games_in_order
+from src.db.database import Base
+from src.db.tables import Game, GameEquipment, GameSetting, User
+from src.models.enums.equipment_enum import GameEquipmentEnum
+from src.models.enums.game_setting_enum import GameSettingEnum
+from src.models.enums.game_sort_enum import GameSortEnum
+from src.utils.pagination import paginate_keyset
+
+
+def seed(session, games: int, tags: int):
+    user_id = str(uuid.uuid4())
+    session.execute(insert(User), [{
+        "id": user_id, "firstname": "Bench", "lastname": "User", "username": "bench", "email": "bench@example.com",
+    }])
+
+    equipment = [e.value for e in GameEquipmentEnum]
+    settings = [s.value for s in GameSettingEnum]
+    now = datetime.now(timezone.utc)
+    game_rows, equipment_rows, setting_rows = [], [], []
+    for i in range(games):
+        game_id = str(uuid.uuid4())
+        game_rows.append({
+            "id": game_id, "name": f"Game {i}", "description": "A benchmark game " * 10, "age_rating": "7+",
+            "game_type": "Card", "min_players": 2, "max_players": 6, "duration": "15-30 minutes",
+            "objective": "Win " * 50, "setup": "Set up " * 50, "rules": "Play by the rules " * 100,
+            "is_public": True, "contributor_id": user_id, "created_at": now - timedelta(seconds=i),
+        })
+        equipment_rows += [{"game_id": game_id, "equipment_name": equipment[(i + t) % len(equipment)]}
+                           for t in range(tags)]
+        setting_rows += [{"game_id": game_id, "setting_name": settings[(i + t) % len(settings)]}
+                         for t in range(tags)]
+
+    session.execute(insert(Game), game_rows)
+    session.execute(insert(GameEquipment), equipment_rows)
+    session.execute(insert(GameSetting), setting_rows)
+    session.commit()
+
+
+def joinedload_listing(session, limit: int, offset: int, setting: str):
+    query = session.query(Game).options(
+        joinedload(Game.equipment_items),
+        joinedload(Game.setting_items),
+        joinedload(Game.contributor),
+    ).filter(Game.is_public == True)
+    if setting:
+        query = query.join(Game.setting_items).filter(GameSetting.setting_name.ilike(f"%{setting}%"))
+    return query.distinct().limit(limit).offset(offset).all()
+
+
+def two_phase_listing(session, limit: int, offset: int, setting: str):
+    key_columns = GAME_SORT_KEYS[GameSortEnum.newest]
+    query = session.query(Game.id, Game.created_at).filter(Game.is_public == True)
+    if setting:
+        query = query.filter(Game.setting_items.any(GameSetting.setting_name.ilike(f"%{setting}%")))
+    rows, _ = paginate_keyset(query, "newest", key_columns, None, limit,
+                              lambda row: [row.created_at, row.id], offset)
+    return fetch_games_in_order(session, [row.id for row in rows])
+
+
+def measure(engine, session_factory, listing, limit: int, offset: int, setting: str, runs: int):
+    statements = []
+
+    def record(_conn, _cursor, statement, parameters, _context, _executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    session = session_factory()
+    try:
+        games = listing(session, limit, offset, setting)
+    finally:
+        session.close()
+        event.remove(engine, "before_cursor_execute", record)
+
+    with engine.connect() as conn:
+        raw = conn.connection.driver_connection
+        rows = sum(raw.execute(f"SELECT COUNT(*) FROM ({statement})", parameters).fetchone()[0]
+                   for statement, parameters in statements)
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        session = session_factory()
+        listing(session, limit, offset, setting)
+        session.close()
+    elapsed_ms = (time.perf_counter() - started) / runs * 1000
+
+    return len(games), len(statements), rows, elapsed_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--tags", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    session_factory = sessionmaker(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with session_factory() as session:
+        seed(session, args.games, args.tags)
+
+    print(f"{args.games} games, {args.tags} equipment + {args.tags} setting tags each\n")
+    print(f"{'query':<12} {'limit':>5} {'offset':>6} {'setting':>8} {'games':>6} {'stmts':>6} {'rows':>7} {'ms':>8}")
+    for limit, offset, setting in ((20, 0, ""), (100, 0, ""), (100, 1000, ""), (20, 0, "party")):
+        for label, listing in (("joinedload", joinedload_listing), ("two-phase", two_phase_listing)):
+            games, statements, rows, elapsed_ms = measure(engine, session_factory, listing, limit, offset,
+                                                          setting, args.runs)
+            print(f"{label:<12} {limit:>5} {offset:>6} {setting or '-':>8} {games:>6} {statements:>6} "
+                  f"{rows:>7} {elapsed_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Micro-benchmark — serialising pages of games for the listing endpoints at page sizes 20 and 100.
+
+Compares the previous path (fully validated GameRead models, then FastAPI's validate + dump + json.dumps for
+response_model=List[GameRead]) with map_game_to_read + game_list_response, and checks both produce the same bytes.
+
+Usage:
+    python scripts/bench_game_serialization.py [--repeat 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.api.games import fetch_games_in_order, game_list_response, map_game_to_read
+from src.db.database import Base
+from src.db.tables import Game, GameEquipment, GameSetting, User
+from src.models.game_models.game import GameRead
+from src.models.game_models.player_count import PlayerCount
+from src.models.user_models.user import UserPublicRead
+
+PAGE_SIZES = (20, 100)
+GAME_LIST_ADAPTER = TypeAdapter(List[GameRead])
+
+
+def load_games(count: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    user_id = str(uuid.uuid4())
+    session.execute(insert(User), [{"id": user_id, "firstname": "Bench", "lastname": "User", "username": "bench",
+                                    "email": "bench@example.com", "country_of_origin": "GB"}])
+    now = datetime.now(timezone.utc)
+    game_ids = [str(uuid.uuid4()) for _ in range(count)]
+    session.execute(insert(Game), [{
+        "id": game_id, "name": f"Game {i}", "description": "A benchmark game " * 10, "age_rating": "7+",
+        "game_type": "Card", "min_players": 2, "max_players": 6, "duration": "15-30 minutes", "difficulty": "Easy",
+        "objective": "Win " * 50, "setup": "Set up " * 50, "rules": "Play by the rules " * 100, "is_public": True,
+        "contributor_id": user_id, "created_at": now - timedelta(seconds=i),
+    } for i, game_id in enumerate(game_ids)])
+    session.execute(insert(GameEquipment), [{"game_id": game_id, "equipment_name": name}
+                                            for game_id in game_ids for name in ("Pen", "Paper", "Coins")])
+    session.execute(insert(GameSetting), [{"game_id": game_id, "setting_name": name}
+                                          for game_id in game_ids for name in ("Party", "Chill")])
+    session.commit()
+    return fetch_games_in_order(session, game_ids)
+
+
+def validated_map_game_to_read(db_game: Game) -> GameRead:
+    """map_game_to_read as it was before the fast path: every nested model validated."""
+    return GameRead(
+        id=db_game.id,
+        name=db_game.name,
+        description=db_game.description,
+        age_rating=db_game.age_rating,
+        game_type=db_game.game_type,
+        player_count=PlayerCount(min_players=db_game.min_players, max_players=db_game.max_players),
+        duration=db_game.duration,
+        difficulty=db_game.difficulty,
+        equipment=[item.equipment_name for item in db_game.equipment_items],
+        game_setting=[s.setting_name for s in db_game.setting_items],
+        objective=db_game.objective,
+        setup=db_game.setup,
+        rules=db_game.rules,
+        image_url=db_game.image_url,
+        is_public=db_game.is_public,
+        upvotes=db_game.upvotes,
+        contributor=UserPublicRead(username=db_game.contributor.username,
+                                   country_of_origin=db_game.contributor.country_of_origin),
+        created_at=db_game.created_at,
+        is_whats_that_game_certified=db_game.is_whats_that_game_verified,
+    )
+
+
+def validated_path(games) -> bytes:
+    models = [validated_map_game_to_read(game) for game in games]
+    # What FastAPI does for response_model=List[GameRead]
+    value = GAME_LIST_ADAPTER.validate_python(models)
+    content = GAME_LIST_ADAPTER.dump_python(value, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def fast_path(games) -> bytes:
+    return game_list_response([map_game_to_read(game, validate=False) for game in games]).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    games = load_games(max(PAGE_SIZES))
+    print(f"{'page':>5} {'validated (ms)':>15} {'fast path (ms)':>15} {'speed-up':>9}")
+    for page_size in PAGE_SIZES:
+        page = games[:page_size]
+        assert validated_path(page) == fast_path(page), "fast path output differs"
+
+        validated = min(timeit.repeat(lambda: validated_path(page), number=args.repeat, repeat=3)) / args.repeat
+        fast = min(timeit.repeat(lambda: fast_path(page), number=args.repeat, repeat=3)) / args.repeat
+        print(f"{page_size:>5} {validated * 1000:>15.3f} {fast * 1000:>15.3f} {validated / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark — the players=N filter ("playable with exactly N people") on a large synthetic catalog.
+
+Times the first page of GET /games?players=N and a count of every match, as issued by apply_game_filters, with
+and without the (is_public, min_players, max_players) index, and the same mask in the catalog snapshot.
+Runs against a throwaway SQLite file; the Postgres int4range GiST index needs a real server to measure.
+
+Usage:
+    python scripts/bench_players_filter.py [--games 1000000] [--runs 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, func, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from src.api.games import _page_public_game_ids, apply_game_filters
+from src.db.database import Base
+from src.db.tables import Game, User
+from src.models.enums.game_sort_enum import GameSortEnum
+from src.models.game_models.game_filters import GameFilters
+from src.services.catalog_snapshot import CatalogSnapshot
+
+PLAYER_COUNTS = (2, 6, 15)
+
+
+def seed(session, games: int):
+    user_id = str(uuid.uuid4())
+    session.execute(insert(User), [{"id": user_id, "firstname": "Bench", "lastname": "User", "username": "bench",
+                                    "email": "bench@example.com"}])
+    rng = random.Random(14)
+    now = datetime.now(timezone.utc)
+    for start in range(0, games, 50_000):
+        rows = []
+        for i in range(start, min(start + 50_000, games)):
+            min_players = rng.randint(1, 8)
+            rows.append({
+                "id": str(uuid.uuid4()), "name": f"Game {i}", "description": "", "age_rating": "7+",
+                "game_type": "Card", "min_players": min_players, "max_players": min_players + rng.randint(0, 12),
+                "duration": "15-30 minutes", "objective": "", "setup": "", "rules": "", "is_public": i % 10 != 0,
+                "is_whats_that_game_verified": False, "upvotes": 0, "contributor_id": user_id,
+                "created_at": now - timedelta(seconds=i), "last_updated": now,
+            })
+        session.execute(insert(Game.__table__), rows)
+    session.commit()
+
+
+def timed(runs: int, fn):
+    result = fn()
+    started = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return result, (time.perf_counter() - started) / runs * 1000
+
+
+def measure_sql(session, runs: int):
+    results = {}
+    for players in PLAYER_COUNTS:
+        filters = GameFilters(players=players)
+        count_query = apply_game_filters(session, session.query(func.count(Game.id)).filter(Game.is_public == True),
+                                         filters)
+        matches, count_ms = timed(runs, count_query.scalar)
+        _, page_ms = timed(runs, lambda: _page_public_game_ids(session, filters, GameSortEnum.newest, None, 20, 0))
+        results[players] = (matches, count_ms, page_ms)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/catalog.db")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, args.games)
+        session.execute(text("ANALYZE"))
+
+        indexed = measure_sql(session, args.runs)
+        session.execute(text("DROP INDEX ix_games_public_players"))
+        session.execute(text("ANALYZE"))
+        unindexed = measure_sql(session, args.runs)
+
+        snapshot = CatalogSnapshot()
+        snapshot.build(session)
+        session.close()
+
+    print(f"{args.games} games, 90% public\n")
+    print(f"{'players':>7} {'matches':>8} {'count ms':>9} {'(no index)':>11} {'page ms':>8} {'(no index)':>11} "
+          f"{'snapshot ms':>12}")
+    for players in PLAYER_COUNTS:
+        matches, count_ms, page_ms = indexed[players]
+        _, count_unindexed_ms, page_unindexed_ms = unindexed[players]
+        _, mask_ms = timed(args.runs, lambda: snapshot.mask(GameFilters(players=players)))
+        print(f"{players:>7} {matches:>8} {count_ms:>9.1f} {count_unindexed_ms:>11.1f} {page_ms:>8.2f} "
+              f"{page_unindexed_ms:>11.2f} {mask_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark — picking a random public game (GET /games/random) as the catalog grows.
+
+Compares SQL ORDER BY random() LIMIT 1 and the endpoint's SQL fallback (count, then OFFSET to the drawn
+position) with CatalogSnapshot.random_game, unseeded and seeded, unfiltered and with a game_type filter. Runs
+against a throwaway SQLite file with 10% of the games private.
+
+Both SQL draws grow with the catalog; only the snapshot's stay flat, so GET /games/random is only constant
+time with CATALOG_SNAPSHOT_ENABLED=true.
+
+Usage:
+    python scripts/bench_random_game.py [--sizes 10000,100000,500000] [--runs 50]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, func, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.api.games import _random_public_game_id
+from src.db.database import Base
+from src.db.tables import Game, User
+from src.models.game_models.game_filters import GameFilters
+from src.services.catalog_snapshot import CatalogSnapshot
+
+GAME_TYPES = ("Card", "Dice", "Drinking", "Word", "Party")
+
+
+def seed(session, games: int):
+    user_id = str(uuid.uuid4())
+    session.execute(insert(User), [{"id": user_id, "firstname": "Bench", "lastname": "User", "username": "bench",
+                                    "email": "bench@example.com"}])
+    now = datetime.now(timezone.utc)
+    for start in range(0, games, 50_000):
+        session.execute(insert(Game.__table__), [{
+            "id": str(uuid.uuid4()), "name": f"Game {i}", "description": "", "age_rating": "7+",
+            "game_type": GAME_TYPES[i % len(GAME_TYPES)], "min_players": 2, "max_players": 6,
+            "duration": "15-30 minutes", "objective": "", "setup": "", "rules": "", "is_public": i % 10 != 0,
+            "is_whats_that_game_verified": False, "upvotes": 0, "contributor_id": user_id,
+            "created_at": now - timedelta(seconds=i), "last_updated": now,
+        } for i in range(start, min(start + 50_000, games))])
+    session.commit()
+
+
+def timed_ms(runs: int, fn) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def measure(games: int, runs: int):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/catalog.db")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, games)
+
+        order_by_random = session.query(Game.id).filter(Game.is_public == True).order_by(func.random()).limit(1)
+        sql_ms = timed_ms(runs, order_by_random.scalar)
+        offsets = iter(range(10 ** 9))
+        offset_ms = timed_ms(runs, lambda: _random_public_game_id(session, GameFilters(), 42, next(offsets)))
+
+        snapshot = CatalogSnapshot()
+        snapshot.build(session)
+        session.close()
+        engine.dispose()
+
+    unfiltered, dice = GameFilters(), GameFilters(game_type="Dice")
+    steps = iter(range(10 ** 9))
+    return (
+        sql_ms,
+        offset_ms,
+        timed_ms(runs, lambda: snapshot.random_game(unfiltered)),
+        timed_ms(runs, lambda: snapshot.random_game(unfiltered, 42, next(steps))),
+        timed_ms(runs, lambda: snapshot.random_game(dice)),
+        timed_ms(runs, lambda: snapshot.random_game(dice, 42, next(steps))),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,500000")
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'games':>8} {'ORDER BY random() ms':>21} {'count+OFFSET ms':>16} {'snapshot ms':>12} {'seeded':>8} "
+          f"{'filtered':>9} {'seeded':>8}")
+    for games in (int(size) for size in args.sizes.split(",")):
+        sql_ms, offset_ms, random_ms, seeded_ms, filtered_ms, filtered_seeded_ms = measure(games, args.runs)
+        print(f"{games:>8} {sql_ms:>21.2f} {offset_ms:>16.2f} {random_ms:>12.4f} {seeded_ms:>8.4f} "
+              f"{filtered_ms:>9.3f} {filtered_seeded_ms:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark — rebuilding game_neighbours from a synthetic user_favourites table, and serving
+recommendations from it, as GET /users/me/recommendations does.
+
+Favourites follow a popularity skew: a few games are favourited far more often than the rest.
+Runs against a throwaway SQLite file.
+
+Usage:
+    python scripts/bench_recommendations.py [--users 50000] [--games 20000] [--favourites 20] [--runs 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from src.db.database import Base
+from src.db.tables import Game, User, UserFavourites
+from src.services.recommendations import rebuild_game_neighbours, recommended_game_ids
+
+
+def seed(session, users: int, games: int, favourites: int):
+    now = datetime.now(timezone.utc)
+    contributor = str(uuid.uuid4())
+    session.execute(insert(User), [{"id": contributor, "firstname": "Bench", "lastname": "User",
+                                    "username": "bench", "email": "bench@example.com"}])
+    game_ids = [str(uuid.uuid4()) for _ in range(games)]
+    session.execute(insert(Game.__table__), [{
+        "id": game_id, "name": f"Game {i}", "description": "", "age_rating": "7+", "game_type": "Card",
+        "min_players": 2, "max_players": 6, "duration": "15-30 minutes", "objective": "", "setup": "", "rules": "",
+        "is_public": True, "is_whats_that_game_verified": False, "upvotes": 0, "contributor_id": contributor,
+        "created_at": now, "last_updated": now,
+    } for i, game_id in enumerate(game_ids)])
+
+    rng = random.Random(17)
+    weights = [1 / (rank + 1) for rank in range(games)]
+    user_ids = [str(uuid.uuid4()) for _ in range(users)]
+    for start in range(0, users, 5000):
+        rows = []
+        for user_id in user_ids[start:start + 5000]:
+            for game_id in set(rng.choices(game_ids, weights, k=favourites)):
+                rows.append({"user_id": user_id, "game_id": game_id, "created_at": now})
+        session.execute(insert(UserFavourites), rows)
+    session.commit()
+    return user_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--favourites", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/catalog.db")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        user_ids = seed(session, args.users, args.games, args.favourites)
+        rows = session.execute(text("SELECT COUNT(*) FROM user_favourites")).scalar()
+
+        started = time.perf_counter()
+        neighbours = rebuild_game_neighbours(session)
+        rebuild_s = time.perf_counter() - started
+
+        sample = random.Random(1).sample(user_ids, args.runs)
+        started = time.perf_counter()
+        for user_id in sample:
+            recommended_game_ids(session, user_id)
+        query_ms = (time.perf_counter() - started) / args.runs * 1000
+        session.close()
+
+    print(f"{args.users} users, {args.games} games, {rows} favourites\n")
+    print(f"rebuild:          {rebuild_s:.1f} s, {neighbours} neighbour rows")
+    print(f"recommendations:  {query_ms:.2f} ms per user")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark — payload size and latency of GET /games?limit=100 for different fields= selections.
+
+Runs the app against a throwaway in-memory SQLite catalog with the catalog snapshot disabled, so every
+request goes through SQL. Each game carries long objective/setup/rules text and several equipment and setting tags.
+
+Usage:
+    python scripts/bench_sparse_fields.py [--games 2000] [--runs 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.db.database import Base, get_db
+from src.db.tables import Game, GameEquipment, GameSetting, User
+from src.main import app
+from src.utils import config
+
+FIELD_SETS = {
+    "all": None,
+    "card": "name,game_type,player_count,upvotes",
+    "card+tags": "name,game_type,player_count,upvotes,equipment,game_setting",
+    "detail text": "name,objective,setup,rules",
+}
+
+
+def make_client(games: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with session_factory() as session:
+        user_id = str(uuid.uuid4())
+        session.execute(insert(User), [{"id": user_id, "firstname": "Bench", "lastname": "User", "username": "bench",
+                                        "email": "bench@example.com", "country_of_origin": "GB"}])
+        now = datetime.now(timezone.utc)
+        game_ids = [str(uuid.uuid4()) for _ in range(games)]
+        session.execute(insert(Game), [{
+            "id": game_id, "name": f"Game {i}", "description": "A benchmark game " * 10, "age_rating": "7+",
+            "game_type": "Card", "min_players": 2, "max_players": 6, "duration": "15-30 minutes",
+            "objective": "Win " * 100, "setup": "Set up " * 100, "rules": "Play by the rules " * 300,
+            "is_public": True, "contributor_id": user_id, "created_at": now - timedelta(seconds=i),
+        } for i, game_id in enumerate(game_ids)])
+        session.execute(insert(GameEquipment), [{"game_id": game_id, "equipment_name": name} for game_id in game_ids
+                                                for name in ("Pen", "Paper", "Coins", "Dice Cup")])
+        session.execute(insert(GameSetting), [{"game_id": game_id, "setting_name": name} for game_id in game_ids
+                                              for name in ("Party", "Chill", "Team")])
+        session.commit()
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    config.CATALOG_SNAPSHOT_ENABLED = False
+    client = make_client(args.games)
+
+    print(f"{args.games} games, GET /games?limit=100\n")
+    print(f"{'fields':<12} {'bytes':>8} {'ms':>8}")
+    for label, fields in FIELD_SETS.items():
+        params = {"limit": 100}
+        if fields:
+            params["fields"] = fields
+        size = len(client.get("/games/", params=params).content)
+
+        started = time.perf_counter()
+        for _ in range(args.runs):
+            client.get("/games/", params=params)
+        elapsed_ms = (time.perf_counter() - started) / args.runs * 1000
+        print(f"{label:<12} {size:>8} {elapsed_ms:>8.2f}")
+
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Load test — many users toggling votes on one hot game at once, checking that no vote is lost.
+
+Runs POST /games/{id}/upvote's handler from a thread pool, once with the previous read-modify-write of
+Game.upvotes, once with the atomic UPDATE and once with UPVOTE_BUFFER_ENABLED, then compares the final
+counter with the user_favourites rows it should equal. Uses a throwaway SQLite file unless --database-url
+points at a scratch Postgres database (its tables are created and left behind).
+
+Usage:
+    python scripts/load_test_upvotes.py [--users 200] [--votes 5] [--threads 32] [--database-url URL]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.api.games import flush_vote_buffer, upvote_game
+from src.db.database import Base
+from src.db.tables import Game, User, UserFavourites
+from src.services.votes import reset_vote_buffer
+from src.utils import config
+from tests.utils import valid_public_game_payload
+
+
+def read_modify_write_upvote(db, game_id: str, current_user: User):
+    """upvote_game as it was before the atomic UPDATE."""
+    db_game = db.query(Game).filter(Game.id == game_id).first()
+    existing_favourite = db.query(UserFavourites).filter(
+        UserFavourites.game_id == game_id,
+        UserFavourites.user_id == current_user.id
+    ).first()
+    if existing_favourite:
+        db.delete(existing_favourite)
+        db_game.upvotes -= 1
+    else:
+        db.add(UserFavourites(game_id=game_id, user_id=current_user.id))
+        db_game.upvotes += 1
+    db.commit()
+
+
+def seed(session_factory, users: int):
+    with session_factory() as session:
+        user_rows = [{"id": str(uuid.uuid4()), "firstname": "Load", "lastname": "Test", "username": f"load{i}",
+                      "email": f"load{i}@example.com"} for i in range(users)]
+        session.execute(insert(User), user_rows)
+        payload = valid_public_game_payload()
+        game = Game(name=payload["name"], description=payload["description"], age_rating=payload["age_rating"],
+                    game_type=payload["game_type"], min_players=2, max_players=6, duration=payload["duration"],
+                    objective=payload["objective"], setup=payload["setup"], rules=payload["rules"],
+                    contributor_id=user_rows[0]["id"])
+        session.add(game)
+        session.commit()
+        return game.id, [User(id=row["id"]) for row in user_rows]
+
+
+def run(session_factory, handler, users, votes: int, threads: int):
+    game_id, voters = seed(session_factory, users)
+    failures = []
+
+    def vote(user):
+        for _ in range(votes):
+            with session_factory() as session:
+                try:
+                    handler(session, game_id, user)
+                except Exception as e:
+                    session.rollback()
+                    failures.append(type(e).__name__)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(vote, voters))
+    with session_factory() as session:
+        flush_vote_buffer(session)
+        elapsed = time.perf_counter() - started
+        upvotes = session.query(Game.upvotes).filter(Game.id == game_id).scalar()
+        favourites = session.query(UserFavourites).filter(UserFavourites.game_id == game_id).count()
+    return users * votes, len(failures), upvotes, favourites, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--votes", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    modes = (
+        ("read-modify-write", read_modify_write_upvote, False),
+        ("atomic", lambda db, game_id, user: upvote_game(db, game_id, user), False),
+        ("buffered", lambda db, game_id, user: upvote_game(db, game_id, user), True),
+    )
+    print(f"{args.users} users x {args.votes} toggles on one game, {args.threads} threads\n")
+    print(f"{'mode':<18} {'votes':>6} {'failed':>7} {'upvotes':>8} {'favourites':>11} {'lost':>5} {'votes/s':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, handler, buffered in modes:
+            url = args.database_url or f"sqlite:///{directory}/{label}.db"
+            # SQLite serialises writers; wait for the lock like Postgres does rather than failing at once
+            engine = create_engine(url, pool_size=args.threads, max_overflow=0,
+                                   connect_args={"timeout": 60} if url.startswith("sqlite") else {})
+            Base.metadata.create_all(bind=engine)
+            config.UPVOTE_BUFFER_ENABLED = buffered
+            reset_vote_buffer()
+
+            votes, failed, upvotes, favourites, elapsed = run(sessionmaker(bind=engine), handler, args.users,
+                                                              args.votes, args.threads)
+            print(f"{label:<18} {votes:>6} {failed:>7} {upvotes:>8} {favourites:>11} {favourites - upvotes:>5} "
+                  f"{votes / elapsed:>8.0f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Migration — adds the game_id indexes on game_equipment and game_settings that the batched equipment and
+setting loads of the game listings look up by. Safe to run more than once.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_child_game_indexes.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.database import engine
+from src.db.tables import GameEquipment, GameSetting
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        for table in (GameEquipment.__table__, GameSetting.__table__):
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+                print(f"Index {index.name} present")
+    print("Done.")
@@ -0,0 +1,72 @@
+"""
+Migration — adds the games.duration_min_minutes / duration_max_minutes columns and their indexes,
+then backfills them from the duration strings. Safe to run more than once.
+
+Durations that aren't DurationEnum values are left NULL, so range filters never match them.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_duration_minutes.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import inspect, text
+
+from src.db.database import engine
+from src.db.tables import Game
+from src.models.enums.duration_enum import DURATION_MINUTES
+
+COLUMNS = ("duration_min_minutes", "duration_max_minutes")
+INDEXES = ("ix_games_public_duration_max", "ix_games_public_duration_min")
+
+
+def add_columns(conn):
+    existing = {column["name"] for column in inspect(conn).get_columns("games")}
+    for column in COLUMNS:
+        if column not in existing:
+            conn.execute(text(f"ALTER TABLE games ADD COLUMN {column} INTEGER"))
+            print(f"Added games.{column}")
+
+
+def add_indexes(conn):
+    for index in Game.__table__.indexes:
+        if index.name in INDEXES:
+            index.create(conn, checkfirst=True)
+            print(f"Index {index.name} present")
+
+
+def backfill(conn):
+    for duration, (minimum, maximum) in DURATION_MINUTES.items():
+        result = conn.execute(
+            text("UPDATE games SET duration_min_minutes = :minimum, duration_max_minutes = :maximum "
+                 "WHERE duration = :duration"),
+            {"minimum": minimum, "maximum": maximum, "duration": duration.value},
+        )
+        print(f"  {duration.value:<16} {result.rowcount} games")
+
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        add_columns(conn)
+        add_indexes(conn)
+        backfill(conn)
+    print("Done.")
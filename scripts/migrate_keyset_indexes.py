@@ -0,0 +1,47 @@
+"""
+Migration — adds the composite indexes behind the keyset (cursor) pagination of the game listings,
+contributor pages and favourites. Safe to run more than once.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_keyset_indexes.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.database import engine
+from src.db.tables import Game, UserFavourites
+
+INDEXES = {
+    "ix_games_public_created_at",
+    "ix_games_public_upvotes",
+    "ix_games_contributor_created_at",
+    "ix_user_favourites_user_created_at",
+}
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        for table in (Game.__table__, UserFavourites.__table__):
+            for index in table.indexes:
+                if index.name in INDEXES:
+                    index.create(conn, checkfirst=True)
+                    print(f"Index {index.name} present")
+    print("Done.")
@@ -0,0 +1,63 @@
+"""
+Migration — adds the games.last_updated column behind GET /games/export?since=, backfilled from created_at,
+with its indexes, and the game_tombstones table of deleted games. Safe to run more than once.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_last_updated.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import inspect, text
+
+from src.db.database import engine
+from src.db.tables import Game, GameTombstone
+
+INDEXES = {"ix_games_public_last_updated", "ix_games_last_updated"}
+
+
+def add_column(conn):
+    existing = {column["name"] for column in inspect(conn).get_columns("games")}
+    if "last_updated" not in existing:
+        conn.execute(text("ALTER TABLE games ADD COLUMN last_updated TIMESTAMP"))
+        print("Added games.last_updated")
+    backfilled = conn.execute(text("UPDATE games SET last_updated = created_at WHERE last_updated IS NULL")).rowcount
+    print(f"Backfilled last_updated of {backfilled} games")
+    if conn.dialect.name == "postgresql":
+        # SQLite can't add the constraint to an existing column; the ORM always sets it there anyway
+        conn.execute(text("ALTER TABLE games ALTER COLUMN last_updated SET NOT NULL"))
+
+
+def add_index(conn):
+    for index in Game.__table__.indexes:
+        if index.name in INDEXES:
+            index.create(conn, checkfirst=True)
+            print(f"Index {index.name} present")
+
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        add_column(conn)
+        add_index(conn)
+        GameTombstone.__table__.create(conn, checkfirst=True)
+        print("Table game_tombstones present")
+    print("Done.")
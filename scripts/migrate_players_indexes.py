@@ -0,0 +1,41 @@
+"""
+Migration — adds the indexes behind the player-count filter: the btree on public games by player range,
+and on PostgreSQL the GiST index over the range itself. Safe to run more than once.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_players_indexes.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.database import engine
+from src.db.tables import Game
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        for index in Game.__table__.indexes:
+            if index.name == "ix_games_player_range" and conn.dialect.name != "postgresql":
+                print(f"Index {index.name} skipped, it needs PostgreSQL")
+            elif index.name in {"ix_games_public_players", "ix_games_player_range"}:
+                index.create(conn, checkfirst=True)
+                print(f"Index {index.name} present")
+    print("Done.")
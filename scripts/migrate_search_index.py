@@ -0,0 +1,42 @@
+"""
+Migration — adds the GIN index over the games full-text search vector. PostgreSQL only, other databases
+search through the in-process index. Safe to run more than once.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_search_index.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.database import engine
+from src.db.tables import Game
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        if conn.dialect.name != "postgresql":
+            print("ix_games_search_vector skipped, it needs PostgreSQL")
+        else:
+            for index in Game.__table__.indexes:
+                if index.name == "ix_games_search_vector":
+                    index.create(conn, checkfirst=True)
+                    print(f"Index {index.name} present")
+    print("Done.")
@@ -0,0 +1,59 @@
+"""
+Migration — adds the games.trending_score column behind sort=trending and its index, then fills it
+from user_favourites. Safe to run more than once.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_trending_score.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import inspect, text
+
+from src.db.database import SessionLocal, engine
+from src.db.tables import Game
+from src.services.trending import recompute_trending_scores
+
+INDEX = "ix_games_public_trending"
+
+
+def add_column(conn):
+    existing = {column["name"] for column in inspect(conn).get_columns("games")}
+    if "trending_score" not in existing:
+        conn.execute(text("ALTER TABLE games ADD COLUMN trending_score FLOAT NOT NULL DEFAULT 0"))
+        print("Added games.trending_score")
+
+
+def add_index(conn):
+    for index in Game.__table__.indexes:
+        if index.name == INDEX:
+            index.create(conn, checkfirst=True)
+            print(f"Index {index.name} present")
+
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        add_column(conn)
+        add_index(conn)
+    with SessionLocal() as session:
+        print(f"Backfilled {recompute_trending_scores(session)} trending scores")
+    print("Done.")
@@ -0,0 +1,39 @@
+"""
+Migration — adds the lower(username) and lower(email) indexes behind the case-insensitive user lookups of
+token authentication, login and registration. Safe to run more than once.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_user_lookup_indexes.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.database import engine
+from src.db.tables import User
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        for index in User.__table__.indexes:
+            if index.name in {"ix_users_username_lower", "ix_users_email_lower"}:
+                index.create(conn, checkfirst=True)
+                print(f"Index {index.name} present")
+    print("Done.")
@@ -0,0 +1,61 @@
+"""
+Migration — adds the games.votes_changed_at column, the job_watermarks table and the indexes behind
+incremental upvote reconciliation, then runs a full reconciliation to set the first watermark.
+Safe to run more than once.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/migrate_votes_changed_at.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "migration")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import inspect, text
+
+from src.db.database import SessionLocal, engine
+from src.db.tables import Game, JobWatermark, UserFavourites
+from src.services.upvote_counts import reconcile_upvote_counts
+
+INDEXES = {"ix_games_votes_changed_at", "ix_user_favourites_created_at"}
+
+
+def add_column(conn):
+    existing = {column["name"] for column in inspect(conn).get_columns("games")}
+    if "votes_changed_at" not in existing:
+        conn.execute(text("ALTER TABLE games ADD COLUMN votes_changed_at TIMESTAMP"))
+        print("Added games.votes_changed_at")
+
+
+def add_indexes(conn):
+    for index in [*Game.__table__.indexes, *UserFavourites.__table__.indexes]:
+        if index.name in INDEXES:
+            index.create(conn, checkfirst=True)
+            print(f"Index {index.name} present")
+
+
+if __name__ == "__main__":
+    with engine.begin() as conn:
+        add_column(conn)
+        add_indexes(conn)
+        JobWatermark.__table__.create(conn, checkfirst=True)
+    with SessionLocal() as session:
+        print(f"Corrected {len(reconcile_upvote_counts(session, full=True))} upvote counts")
+    print("Done.")
@@ -0,0 +1,43 @@
+"""
+Job — rebuilds the game_neighbours table behind GET /users/me/recommendations from user_favourites.
+Meant to run periodically (e.g. nightly cron); the work happens inside the database.
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/rebuild_recommendations.py [--top-n 50]
+    or if .env is present it will be loaded automatically.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "job")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.database import SessionLocal
+from src.services.recommendations import NEIGHBOURS_PER_GAME, rebuild_game_neighbours
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top-n", type=int, default=NEIGHBOURS_PER_GAME)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with SessionLocal() as session:
+        rows = rebuild_game_neighbours(session, args.top_n)
+    print(f"Wrote {rows} neighbours in {time.perf_counter() - started:.1f}s")
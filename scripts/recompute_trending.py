@@ -0,0 +1,44 @@
+"""
+Job — recomputes games.trending_score (sort=trending) from user_favourites. The vote endpoints keep the
+scores current incrementally; this corrects their drift and applies a changed TRENDING_HALF_LIFE_HOURS.
+Meant to run periodically (e.g. nightly cron).
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/recompute_trending.py
+    or if .env is present it will be loaded automatically.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "job")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.database import SessionLocal
+from src.services.trending import recompute_trending_scores
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter).parse_args()
+
+    started = time.perf_counter()
+    with SessionLocal() as session:
+        rows = recompute_trending_scores(session)
+    print(f"Updated {rows} trending scores in {time.perf_counter() - started:.1f}s")
+    # The job moves last_updated of the games it changed, so running API processes refresh their catalog
+    # snapshot and listing ETags within CATALOG_VERSION_TTL_SECONDS
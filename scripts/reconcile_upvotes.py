@@ -0,0 +1,47 @@
+"""
+Job — sets games.upvotes back to each game's user_favourites count, correcting counters that drifted (votes
+lost from an UPVOTE_BUFFER_ENABLED buffer, rows changed by hand). Checks the games voted on since its last run
+unless --full is given. Meant to run periodically (e.g. hourly cron).
+
+Usage:
+    DATABASE_URL=<railway_url> python scripts/reconcile_upvotes.py [--full] [--batch-size 1000]
+    or if .env is present it will be loaded automatically.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Load .env if present
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip())
+
+if not os.getenv("DATABASE_URL"):
+    print("ERROR: DATABASE_URL not set.")
+    sys.exit(1)
+os.environ.setdefault("SECRET_KEY", "job")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.database import SessionLocal
+from src.services.upvote_counts import BATCH_SIZE, reconcile_upvote_counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--full", action="store_true", help="check every game, not just those voted on since")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with SessionLocal() as session:
+        corrected = reconcile_upvote_counts(session, full=args.full, batch_size=args.batch_size)
+    print(f"Corrected {len(corrected)} upvote counts in {time.perf_counter() - started:.1f}s")
+    # The corrected games' last_updated moved, so running API processes refresh their catalog snapshot and
+    # ETags within CATALOG_VERSION_TTL_SECONDS
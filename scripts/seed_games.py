@@ -26,6 +26,10 @@ import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.models.enums.duration_enum import duration_minutes
+from src.utils.trending import vote_weight
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     print("ERROR: DATABASE_URL not set.")
@@ -124,20 +128,23 @@ def seed(session, contributor_id: str):
     inserted = 0
     for _, row in df.iterrows():
         game_id = str(uuid.uuid4())
+        duration = map_duration(row["Duration"])
+        duration_min, duration_max = duration_minutes(duration)
+        created_at = datetime.now(timezone.utc)
 
         session.execute(text("""
             INSERT INTO games (
                 id, name, description, age_rating, game_type,
-                min_players, max_players, duration, difficulty,
+                min_players, max_players, duration, duration_min_minutes, duration_max_minutes, difficulty,
                 objective, setup, rules,
                 image_url, is_public, is_whats_that_game_verified,
-                upvotes, contributor_id, created_at
+                upvotes, trending_score, contributor_id, created_at, last_updated
             ) VALUES (
                 :id, :name, :description, :age_rating, :game_type,
-                :min_players, :max_players, :duration, :difficulty,
+                :min_players, :max_players, :duration, :duration_min_minutes, :duration_max_minutes, :difficulty,
                 :objective, :setup, :rules,
                 NULL, TRUE, TRUE,
-                0, :contributor_id, :created_at
+                0, :trending_score, :contributor_id, :created_at, :created_at
             )
         """), {
             "id": game_id,
@@ -147,13 +154,16 @@ def seed(session, contributor_id: str):
             "game_type": map_game_type(row["Game Type"]),
             "min_players": int(row["Min Players"]),
             "max_players": int(row["Max Players"]),
-            "duration": map_duration(row["Duration"]),
+            "duration": duration,
+            "duration_min_minutes": duration_min,
+            "duration_max_minutes": duration_max,
             "difficulty": map_difficulty(row.get("Difficulty")),
             "objective": str(row["Objective"]).strip(),
             "setup": str(row["Setup"]).strip(),
             "rules": str(row["Rules"]).strip(),
             "contributor_id": contributor_id,
-            "created_at": datetime.now(timezone.utc),
+            "trending_score": vote_weight(created_at),
+            "created_at": created_at,
         })
 
         for item in parse_list(row.get("Equipment")):
@@ -0,0 +1,91 @@
+# src/api/admin.py
+from typing import Annotated, Dict
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from src.api.games import after_game_vote, flush_vote_buffer
+from src.api.users import get_current_admin_user
+from src.db.database import get_db
+from src.db.tables import User
+from src.models.admin_models.cache_stats import CacheStats
+from src.models.admin_models.job_result import JobResult
+from src.services.auth_cache import auth_cache
+from src.services.catalog_version import bump_catalog_version
+from src.services.game_cache import game_detail_cache
+from src.services.recommendations import rebuild_game_neighbours
+from src.services.trending import recompute_trending_scores
+from src.services.upvote_counts import reconcile_upvote_counts
+
+router = APIRouter()
+
+
+def admin_required():
+    return Depends(get_current_admin_user)
+
+
+@router.get("/cache-stats", response_model=Dict[str, CacheStats], status_code=200,
+            responses={401: {"description": "Authentication required"},
+                       403: {"description": "Admin role required"}})
+def get_cache_stats(_current_user: User = admin_required()):
+    return {
+        "game_detail": game_detail_cache.stats(),
+        "auth": auth_cache.stats(),
+    }
+
+
+@router.post("/jobs/rebuild-recommendations", response_model=JobResult, status_code=200,
+             responses={401: {"description": "Authentication required"},
+                        403: {"description": "Admin role required"}})
+def run_rebuild_recommendations(
+        db: Annotated[Session, Depends(get_db)],
+        _current_user: User = admin_required(),
+):
+    """Runs the game neighbour rebuild now; normally scripts/rebuild_recommendations.py runs it on a schedule."""
+    return JobResult(job="rebuild-recommendations", rows=rebuild_game_neighbours(db))
+
+
+@router.post("/jobs/recompute-trending", response_model=JobResult, status_code=200,
+             responses={401: {"description": "Authentication required"},
+                        403: {"description": "Admin role required"}})
+def run_recompute_trending(
+        db: Annotated[Session, Depends(get_db)],
+        _current_user: User = admin_required(),
+):
+    """Runs the trending score recompute now; normally scripts/recompute_trending.py runs it on a schedule."""
+    rows = recompute_trending_scores(db)
+    if rows:
+        # The changed games' last_updated moved, so the snapshot refreshes them on next use
+        bump_catalog_version()
+    return JobResult(job="recompute-trending", rows=rows)
+
+
+@router.post("/jobs/flush-votes", response_model=JobResult, status_code=200,
+             responses={401: {"description": "Authentication required"},
+                        403: {"description": "Admin role required"}})
+def run_flush_votes(
+        db: Annotated[Session, Depends(get_db)],
+        _current_user: User = admin_required(),
+):
+    """Writes this worker's buffered upvotes (UPVOTE_BUFFER_ENABLED) now rather than at the next due vote."""
+    return JobResult(job="flush-votes", rows=flush_vote_buffer(db))
+
+
+@router.post("/jobs/reconcile-upvotes", response_model=JobResult, status_code=200,
+             responses={401: {"description": "Authentication required"},
+                        403: {"description": "Admin role required"}})
+def run_reconcile_upvotes(
+        db: Annotated[Session, Depends(get_db)],
+        _current_user: User = admin_required(),
+        full: bool = False,
+):
+    """
+    Runs the upvote counter reconciliation now, over the games voted on since its last run or every game with
+    full=true; normally scripts/reconcile_upvotes.py runs it on a schedule.
+    """
+    # This worker's own buffered votes aren't drift
+    flush_vote_buffer(db)
+    corrected = reconcile_upvote_counts(db, full=full)
+    for game_id, upvotes, trending_score in corrected:
+        after_game_vote(db, game_id, upvotes, trending_score)
+    return JobResult(job="reconcile-upvotes", rows=len(corrected))
@@ -1,18 +1,27 @@
 # src/api/favourites.py
-from typing import List, Annotated
+from datetime import datetime, timezone
+from typing import List, Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
 
-from src.api.games import map_game_to_read
+from src.api.games import after_game_vote, game_list_response, game_load_options, map_game_to_read
 from src.api.users import get_current_active_user
-from src.db.database import get_db
+from src.db.database import get_db, insert_or_ignore
 from src.db.tables import User, Game, UserFavourites
 from src.models import GameRead
+from src.models.user_models.favourite_bulk import FavouriteBulkRequest, FavouriteBulkResponse, \
+    FavouriteSyncRequest
 from src.models.user_models.user import UserFavouriteBase
+from src.services import votes
+from src.utils.pagination import NEXT_CURSOR_HEADER, paginate_keyset
+from src.utils.trending import vote_weight
 
 router = APIRouter()
 
+FAVOURITES_BULK_MAX_IDS = 5000
+
 
 def auth_required():
     return Depends(get_current_active_user)
@@ -21,38 +30,121 @@ def auth_required():
 @router.get("/", response_model=List[GameRead], status_code=200)
 def get_all_favourites(
         db: Annotated[Session, Depends(get_db)],
+        response: Response,
         current_user: User = auth_required(),
+        cursor: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
 ):
     limit = min(limit, 100)
     offset = max(offset, 0)
 
-    favourite_game_ids = (
-        db.query(UserFavourites.game_id)
+    # One join in favourite order, the user_favourites (user_id, created_at, game_id) index driving it;
+    # equipment and settings follow in one statement each
+    query = (
+        db.query(Game, UserFavourites.created_at)
+        .join(UserFavourites, UserFavourites.game_id == Game.id)
         .filter(UserFavourites.user_id == current_user.id)
-        .limit(limit)
-        .offset(offset)
-        .all()
+        .options(*game_load_options())
+    )
+    rows, next_cursor = paginate_keyset(
+        query, "favourites", (UserFavourites.created_at, UserFavourites.game_id), cursor, limit,
+        lambda row: [row.created_at, row.Game.id], offset,
     )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
-    game_ids = [fav.game_id for fav in favourite_game_ids]
+    # Everything listed here is favourited, so no need for mark_favourited's lookup
+    games = [map_game_to_read(row.Game, validate=False).model_copy(update={"is_favourited": True}) for row in rows]
+    return game_list_response(games, response)
 
-    if not game_ids:
-        return []
 
-    games = (
-        db.query(Game)
-        .filter(Game.id.in_(game_ids))
-        .options(
-            joinedload(Game.equipment_items),
-            joinedload(Game.setting_items),
-            joinedload(Game.contributor)
-        )
-        .all()
+@router.put("/", response_model=FavouriteBulkResponse, status_code=200,
+            responses={400: {"description": "Too many ids in one request"},
+                       401: {"description": "Authentication required"}})
+def sync_favourites(
+        db: Annotated[Session, Depends(get_db)],
+        sync: FavouriteSyncRequest,
+        current_user: User = auth_required()
+):
+    """Makes the user's favourites exactly sync.game_ids, adding and removing only the difference."""
+    wanted = list(dict.fromkeys(sync.game_ids))
+    if len(wanted) > FAVOURITES_BULK_MAX_IDS:
+        raise HTTPException(status_code=400,
+                            detail=f"At most {FAVOURITES_BULK_MAX_IDS} favourites can be changed at once")
+
+    current = {game_id for game_id, in db.query(UserFavourites.game_id)
+               .filter(UserFavourites.user_id == current_user.id)}
+    return _change_favourites(db, current_user, [game_id for game_id in wanted if game_id not in current],
+                              list(current.difference(wanted)))
+
+
+@router.post("/bulk", response_model=FavouriteBulkResponse, status_code=200,
+             responses={400: {"description": "Too many ids, or an id both added and removed"},
+                        401: {"description": "Authentication required"}})
+def change_favourites_in_bulk(
+        db: Annotated[Session, Depends(get_db)],
+        changes: FavouriteBulkRequest,
+        current_user: User = auth_required()
+):
+    """
+    Adds and removes many favourites in one transaction. Adding a favourite the user already has, or
+    removing one they don't, is not an error; ids of games that don't exist are reported in not_found.
+    """
+    add, remove = list(dict.fromkeys(changes.add)), list(dict.fromkeys(changes.remove))
+    if len(add) + len(remove) > FAVOURITES_BULK_MAX_IDS:
+        raise HTTPException(status_code=400,
+                            detail=f"At most {FAVOURITES_BULK_MAX_IDS} favourites can be changed at once")
+    if not set(add).isdisjoint(remove):
+        raise HTTPException(status_code=400, detail="A game can't be both added and removed")
+
+    return _change_favourites(db, current_user, add, remove)
+
+
+def _change_favourites(db: Session, current_user: User, add: List[str], remove: List[str]) -> FavouriteBulkResponse:
+    """
+    Set-based favourite changes: one INSERT ... ON CONFLICT DO NOTHING, one DELETE ... IN, and the counters
+    of the games that actually changed updated together by votes.commit_votes.
+    """
+    floors = {game_id: vote_weight(created_at) for game_id, created_at in
+              db.query(Game.id, Game.created_at).filter(Game.id.in_(add + remove))} if add or remove else {}
+
+    changes = []
+    to_add = [game_id for game_id in add if game_id in floors]
+    if to_add:
+        voted_at = datetime.now(timezone.utc)
+        weight = vote_weight(voted_at)
+        inserted = db.execute(_insert_favourites(db, current_user.id, to_add, voted_at)).scalars().all()
+        changes += [votes.VoteChange(game_id, 1, floors[game_id], added=weight) for game_id in inserted]
+
+    if remove:
+        removed = db.execute(
+            delete(UserFavourites)
+            .where(UserFavourites.user_id == current_user.id, UserFavourites.game_id.in_(remove))
+            .returning(UserFavourites.game_id, UserFavourites.created_at)
+        ).all()
+        changes += [votes.VoteChange(game_id, -1, floors[game_id], removed=vote_weight(created_at))
+                    for game_id, created_at in removed if game_id in floors]
+
+    for game_id, upvotes, trending_score in votes.commit_votes(db, changes):
+        after_game_vote(db, game_id, upvotes, trending_score)
+
+    return FavouriteBulkResponse(
+        added=sum(change.upvotes > 0 for change in changes),
+        removed=sum(change.upvotes < 0 for change in changes),
+        not_found=[game_id for game_id in add + remove if game_id not in floors],
     )
 
-    return [map_game_to_read(game) for game in games]
+
+def _insert_favourites(db: Session, user_id: str, game_ids: List[str], favourited_at: datetime):
+    """
+    One multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING game_id of the favourites actually added. Not an
+    executemany: Postgres would match its RETURNING rows back to the parameter sets, and rows skipped as
+    conflicts make that fail.
+    """
+    return (insert_or_ignore(db, UserFavourites)
+            .values([{"game_id": game_id, "user_id": user_id, "created_at": favourited_at} for game_id in game_ids])
+            .returning(UserFavourites.game_id))
 
 
 @router.post("/{game_id}", response_model=UserFavouriteBase, status_code=201,
@@ -63,27 +155,19 @@ def add_favourite(
         game_id: str,
         current_user: User = auth_required()
 ):
-    game = db.query(Game).filter(Game.id == game_id).first()
-    if not game:
+    created_at = db.query(Game.created_at).filter(Game.id == game_id).scalar()
+    if created_at is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    existing = db.query(UserFavourites).filter(
-        UserFavourites.user_id == current_user.id,
-        UserFavourites.game_id == game_id
-    ).first()
-
-    if existing:
+    # A favourite is a vote, so the counters move with it just as in upvote_game
+    favourited_at = datetime.now(timezone.utc)
+    inserted = db.execute(insert_or_ignore(db, UserFavourites).values(
+        game_id=game_id, user_id=current_user.id, created_at=favourited_at)).rowcount
+    if not inserted:
         raise HTTPException(status_code=400, detail="Game is already favourited by this user")
 
-    db_favourite_relationship = UserFavourites(
-        game_id=game_id,
-        user_id=current_user.id
-    )
-
-    db.add(db_favourite_relationship)
-    db.commit()
-    db.refresh(db_favourite_relationship)
-    return db_favourite_relationship
+    _commit_vote(db, votes.VoteChange(game_id, 1, vote_weight(created_at), added=vote_weight(favourited_at)))
+    return UserFavouriteBase(user_id=current_user.id, game_id=game_id, created_at=favourited_at)
 
 
 @router.delete("/{game_id}", status_code=204, responses={404: {"description": "Favourite not found"}})
@@ -92,13 +176,19 @@ def remove_favourite(
         game_id: str,
         current_user: User = auth_required()
 ):
-    existing = db.query(UserFavourites).filter(
-        UserFavourites.user_id == current_user.id,
-        UserFavourites.game_id == game_id
-    ).first()
-
-    if not existing:
+    favourited_at = db.execute(
+        delete(UserFavourites)
+        .where(UserFavourites.user_id == current_user.id, UserFavourites.game_id == game_id)
+        .returning(UserFavourites.created_at)
+    ).scalar()
+    if favourited_at is None:
         raise HTTPException(status_code=404, detail="Favourite not found")
 
-    db.delete(existing)
-    db.commit()
\ No newline at end of file
+    created_at = db.query(Game.created_at).filter(Game.id == game_id).scalar()
+    _commit_vote(db, votes.VoteChange(game_id, -1, vote_weight(created_at), removed=vote_weight(favourited_at)))
+
+
+def _commit_vote(db: Session, change: votes.VoteChange) -> None:
+    counts = votes.commit_vote(db, change)
+    if counts:
+        after_game_vote(db, change.game_id, *counts)
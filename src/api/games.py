@@ -1,30 +1,77 @@
 from __future__ import annotations
 
+import csv
+import heapq
+import io
+import logging
+import uuid
 from datetime import datetime, timezone
-from typing import Optional, List, Annotated
+from typing import Any, Dict, Optional, List, Tuple, Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import Integer, and_, column, delete, func, insert, or_, select
 from sqlalchemy.orm import Session
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
 from src.api.users import get_current_active_user, get_current_user_optional
 from src.core.exceptions import GAME_NOT_FOUND_EXCEPTION, UNAUTHORIZED_EXCEPTION, FORBIDDEN_EXCEPTION
-from src.db.database import get_db
-from src.db.tables import Game, GameEquipment, GameSetting, User, UserFavourites
-from src.models.enums.age_rating_enum import AgeRatingEnum
+from src.db.database import get_db, insert_or_ignore, is_postgres
+from src.db.tables import Game, GameEquipment, GameNeighbour, GameSetting, GameTombstone, User, UserFavourites, \
+    player_range
+from src.models.enums.age_rating_enum import AGE_RATING_MIN_AGE, AgeRatingEnum
+from src.models.enums.duration_enum import DurationEnum, duration_minutes
+from src.models.enums.equipment_enum import GameEquipmentEnum
+from src.models.enums.export_format_enum import ExportFormatEnum
 from src.models.enums.game_difficulty_enum import GameDifficultyEnum
+from src.models.enums.game_setting_enum import GameSettingEnum
+from src.models.enums.game_sort_enum import GameSortEnum
 from src.models.enums.game_type_enum import GameTypeEnum
 from src.models.error_models.error import ErrorDetail
-from src.models.game_models.game import GameCreate, GameRead, GameUpdate
+from src.models.game_models.game import GameCreate, GameExport, GameExportRemoval, GameRead, GameUpdate
+from src.models.game_models.game_bulk import GameBulkCreateResponse, GameBulkItemResult
+from src.models.game_models.game_facets import GameFacets
+from src.models.game_models.game_filters import GameFilters
+from src.models.game_models.game_plan import GamePlan, GamePlanRequest
 from src.models.game_models.game_report import GameReportRequest, GameReportResponse
 from src.models.game_models.game_visibility import GameVisibility
 from src.models.game_models.game_vote import GameVoteRead
 from src.models.game_models.player_count import PlayerCount
 from src.models.user_models.user import UserPublicRead
+from src.services import catalog_snapshot, game_cache, search_index, votes
+from src.services.catalog_version import bump_catalog_version, get_catalog_version
+from src.utils import config
+from src.utils.http_cache import NO_STORE, REVALIDATE_PRIVATE, REVALIDATE_PUBLIC, etag_matches, make_etag, \
+    not_modified, set_cache_headers
+from src.utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, paginate_keyset
+from src.utils.trending import vote_weight
+
+logger = logging.getLogger(__name__)
 
 protected_router = APIRouter()
 public_router = APIRouter()
 
+# Descending keyset orderings; each must end in a unique column and be backed by an index in tables.py
+GAME_SORT_KEYS = {
+    GameSortEnum.newest: (Game.created_at, Game.id),
+    GameSortEnum.top: (Game.upvotes, Game.id),
+    GameSortEnum.trending: (Game.trending_score, Game.id),
+}
+# GET /games/random cursors carry the seed and the next step of its permutation
+RANDOM_CURSOR_KEYS = (column("seed", Integer), column("step", Integer))
+# Draws GET /games/random makes before giving up on games the snapshot still has but that are gone or private
+RANDOM_MAX_DRAWS = 8
+
+BATCH_FETCH_MAX_IDS = 300
+BULK_CREATE_MAX_GAMES = 5000
+EXPORT_BATCH_SIZE = 500
+EXPORT_CSV_COLUMNS = [
+    "id", "name", "description", "age_rating", "game_type", "min_players", "max_players", "duration", "difficulty",
+    "equipment", "game_setting", "objective", "setup", "rules", "image_url", "is_whats_that_game_certified",
+    "upvotes", "contributor_username", "contributor_country_of_origin", "created_at", "last_updated", "deleted",
+]
+
 
 def auth_required():
     return Depends(get_current_active_user)
@@ -67,10 +114,87 @@ def create_new_game(
 
     db.commit()
     db.refresh(db_new_game)
+    _after_game_write(db, db_new_game)
 
     return map_game_to_read(db_new_game)
 
 
+@protected_router.post("/bulk", response_model=GameBulkCreateResponse, status_code=200,
+                       responses={400: {"description": "Too many games in one request"},
+                                  401: {"description": "Authentication required"}})
+def create_games_in_bulk(
+        db: Annotated[Session, Depends(get_db)],
+        new_games: Annotated[List[Dict[str, Any]], Body()],
+        current_user: User = auth_required()
+):
+    """
+    Creates many games in one transaction. Each item is validated as a GameCreate on its own, so invalid
+    items are reported by index alongside the ids of the games that were created.
+    """
+    if len(new_games) > BULK_CREATE_MAX_GAMES:
+        raise HTTPException(status_code=400, detail=f"At most {BULK_CREATE_MAX_GAMES} games can be created at once")
+
+    now = datetime.now(timezone.utc)
+    results: List[GameBulkItemResult] = []
+    game_rows, equipment_rows, setting_rows = [], [], []
+    for index, item in enumerate(new_games):
+        try:
+            new_game = GameCreate.model_validate(item)
+        except ValidationError as e:
+            results.append(GameBulkItemResult(index=index, errors=e.errors(include_url=False, include_context=False,
+                                                                           include_input=False)))
+            continue
+
+        game_id = str(uuid.uuid4())
+        # Core inserts skip Game.set_duration_minutes, so derive the range here
+        duration_min, duration_max = duration_minutes(new_game.duration)
+        game_rows.append({
+            "id": game_id,
+            "name": new_game.name,
+            "description": new_game.description,
+            "age_rating": new_game.age_rating.value,
+            "game_type": new_game.game_type.value,
+            "min_players": new_game.player_count.min_players,
+            "max_players": new_game.player_count.max_players,
+            "duration": new_game.duration,
+            "duration_min_minutes": duration_min,
+            "duration_max_minutes": duration_max,
+            "difficulty": new_game.difficulty.value if new_game.difficulty else None,
+            "objective": new_game.objective,
+            "setup": new_game.setup,
+            "rules": new_game.rules,
+            "image_url": new_game.image_url,
+            "is_public": new_game.is_public,
+            "is_whats_that_game_verified": new_game.is_whats_that_game_certified,
+            "upvotes": 0,
+            "created_at": now,
+            "last_updated": now,
+            "contributor_id": current_user.id,
+        })
+        equipment_rows += [{"game_id": game_id, "equipment_name": str(eq)} for eq in new_game.equipment]
+        setting_rows += [{"game_id": game_id, "setting_name": s} for s in (new_game.game_setting or [])]
+        results.append(GameBulkItemResult(index=index, id=game_id))
+
+    # One multi-row INSERT per table (executemany where the driver can't batch), committed together
+    if game_rows:
+        db.execute(insert(Game), game_rows)
+        if equipment_rows:
+            db.execute(insert(GameEquipment), equipment_rows)
+        if setting_rows:
+            db.execute(insert(GameSetting), setting_rows)
+        db.commit()
+
+        # The new games only need loading back for the in-process search index and catalog snapshot, if built;
+        # none of them can be in the detail cache yet, and the catalog version moves once for the batch
+        if search_index.is_index_built(db) or catalog_snapshot.is_snapshot_built():
+            for db_game in fetch_games_in_order(db, [row["id"] for row in game_rows]):
+                search_index.index_game(db, db_game)
+                catalog_snapshot.snapshot_game(db_game)
+        bump_catalog_version()
+
+    return GameBulkCreateResponse(created=len(game_rows), failed=len(results) - len(game_rows), results=results)
+
+
 @protected_router.post("/{game_id}/upvote", status_code=200, response_model=GameVoteRead,
                        responses={404: {"description": "Game not found"},
                                   401: {"description": "Authentication required"}})
@@ -79,28 +203,38 @@ def upvote_game(
         game_id: str,
         current_user: User = auth_required()
 ):
-    db_game: Game = db.query(Game).filter(Game.id == game_id).first()
-    if not db_game:
+    created_at = db.query(Game.created_at).filter(Game.id == game_id).scalar()
+    if created_at is None:
         raise GAME_NOT_FOUND_EXCEPTION
 
-    existing_favourite = db.query(UserFavourites).filter(
-        UserFavourites.game_id == game_id,
-        UserFavourites.user_id == current_user.id
-    ).first()
-
-    if existing_favourite:
-        db.delete(existing_favourite)
-        db_game.upvotes -= 1
+    # The favourite insert/delete decides whether the count moves, so concurrent toggles can't double count;
+    # the counter itself is then changed in place by votes.commit_vote
+    floor = vote_weight(created_at)
+    removed_at = db.execute(
+        delete(UserFavourites)
+        .where(UserFavourites.game_id == game_id, UserFavourites.user_id == current_user.id)
+        .returning(UserFavourites.created_at)
+    ).scalar()
+    if removed_at is not None:
+        change = votes.VoteChange(game_id, -1, floor, removed=vote_weight(removed_at))
     else:
-        db.add(UserFavourites(game_id=game_id, user_id=current_user.id))
-        db_game.upvotes += 1
+        voted_at = datetime.now(timezone.utc)
+        inserted = db.execute(insert_or_ignore(db, UserFavourites).values(
+            game_id=game_id, user_id=current_user.id, created_at=voted_at)).rowcount
+        change = votes.VoteChange(game_id, 1, floor, added=vote_weight(voted_at)) if inserted else None
 
-    db.commit()
-    db.refresh(db_game)
+    counts = votes.commit_vote(db, change)
+    if counts:
+        upvotes, trending_score = counts
+        after_game_vote(db, game_id, upvotes, trending_score)
+    else:
+        upvotes = votes.current_upvotes(db, game_id)
+    if votes.flush_due():
+        flush_vote_buffer(db)
 
     return GameVoteRead(
-        game_id=db_game.id,
-        upvotes=db_game.upvotes,
+        game_id=game_id,
+        upvotes=upvotes,
     )
 
 
@@ -122,99 +256,517 @@ def report_game(
                    responses={401: {"description": "Authentication required for non-public access"}})
 def get_all_games(
         db: Annotated[Session, Depends(get_db)],
-        name: Optional[str] = None,
-        game_type: Optional[GameTypeEnum] = None,
-        age_rating: Optional[AgeRatingEnum] = None,
-        min_players: Optional[int] = None,
-        max_players: Optional[int] = None,
-        duration: Optional[str] = None,
-        difficulty: Optional[GameDifficultyEnum] = None,
-        setting: Optional[str] = None,
-        equipment: Optional[str] = None,
+        request: Request,
+        response: Response,
+        filters: Annotated[GameFilters, Depends()],
+        sort: GameSortEnum = GameSortEnum.newest,
+        cursor: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        fields: Optional[str] = None,
+        current_user: Annotated[User | None, Depends(get_current_user_optional)] = None,
 ):
+    """fields takes a comma-separated subset of the GameRead fields to return, e.g. fields=name,player_count."""
+    read_fields = parse_game_fields(fields)
+    # Buffered votes (UPVOTE_BUFFER_ENABLED) don't move the catalog version until they are flushed, so the
+    # signed-in user's is_favourited flags are covered by their own favourites version
+    favourites = (favourites_version(db, current_user.id)
+                  if current_user and (read_fields is None or "is_favourited" in read_fields) else None)
+    etag = make_etag("games", get_catalog_version(db), sorted(request.query_params.multi_items()),
+                     current_user.id if current_user else None, favourites)
+    cache_control = REVALIDATE_PRIVATE if current_user else REVALIDATE_PUBLIC
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+    set_cache_headers(response, etag, cache_control)
+
     limit = min(limit, 100)
     offset = max(offset, 0)
-    query = db.query(Game).options(
-        joinedload(Game.equipment_items),  # eager-load equipment
-        joinedload(Game.setting_items),  # eager-load settings
-        joinedload(Game.contributor)  # eager-load contributor
-    ).filter(Game.is_public == True)
 
-    if name:
-        query = query.filter(Game.name.ilike(f"%{name}%"))
+    if filters.q:
+        # Relevance order has no stable key to resume from, so search results page by offset
+        search = search_index.search_clauses(db, filters.q)
+        query = apply_game_filters(db, db.query(Game.id).filter(Game.is_public == True), filters, search)
+        _, search_order = search
+        if search_order is not None:
+            query = query.order_by(search_order)
+        rows = query.order_by(Game.id).limit(limit).offset(offset).all()
+        games = fetch_games_in_order(db, [row.id for row in rows], read_fields)
+        page = [map_game_to_read(game, read_fields, validate=False) for game in games]
+        return game_list_response(mark_favourited(db, page, current_user, read_fields), response, read_fields)
 
-    if game_type:
-        query = query.filter(Game.game_type == game_type)
+    if config.CATALOG_SNAPSHOT_ENABLED:
+        games, next_cursor = _page_snapshot_games(db, filters, sort, cursor, limit, offset, read_fields)
+    else:
+        game_ids, next_cursor = _page_public_game_ids(db, filters, sort, cursor, limit, offset)
+        games = fetch_games_in_order(db, game_ids, read_fields)
 
-    if age_rating:
-        query = query.filter(Game.age_rating == age_rating)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
-    if min_players:
-        query = query.filter(Game.min_players >= min_players)
+    page = [map_game_to_read(game, read_fields, validate=False) for game in games]
+    return game_list_response(mark_favourited(db, page, current_user, read_fields), response, read_fields)
 
-    if max_players:
-        query = query.filter(Game.max_players <= max_players)
 
-    if duration:
-        query = query.filter(Game.duration.ilike(f"%{duration}%"))
+def _page_public_game_ids(db: Session, filters: GameFilters, sort: GameSortEnum, cursor: Optional[str], limit: int,
+                          offset: int):
+    key_columns = GAME_SORT_KEYS[sort]
+    # Page over ids only; the rows and their children are loaded afterwards by fetch_games_in_order
+    query = apply_game_filters(db, db.query(Game.id, *key_columns[:-1]).filter(Game.is_public == True), filters)
+    rows, next_cursor = paginate_keyset(query, sort.value, key_columns, cursor, limit,
+                                        lambda row: [getattr(row, c.key) for c in key_columns], offset)
+    return [row.id for row in rows], next_cursor
 
-    if difficulty:
-        query = query.filter(Game.difficulty == difficulty)
 
-    if setting:
-        query = query.join(Game.setting_items).filter(GameSetting.setting_name.ilike(f"%{setting}%"))
+def _page_snapshot_games(db: Session, filters: GameFilters, sort: GameSortEnum, cursor: Optional[str], limit: int,
+                         offset: int, fields: Optional[frozenset] = None):
+    """
+    get_all_games' page, and its next cursor, paged by the catalog snapshot. The snapshot can lag deletes and
+    privacy changes made by other processes, so games that turn out to be hidden once loaded are dropped from it
+    and the page taken again, which fills their places.
+    """
+    snapshot = catalog_snapshot.get_catalog_snapshot(db)
+    cursor_values = decode_cursor(cursor, sort.value, GAME_SORT_KEYS[sort]) if cursor else None
+    while True:
+        game_ids, next_cursor = snapshot.page(filters, sort, cursor_values, limit, offset)
+        if config.CATALOG_SNAPSHOT_VERIFY:
+            expected = _page_public_game_ids(db, filters, sort, cursor, limit, offset)
+            if (game_ids, next_cursor) != expected:
+                logger.warning("Catalog snapshot diverged from SQL for %s sort=%s cursor=%s: %s != %s",
+                               filters.model_dump(exclude_none=True), sort.value, cursor,
+                               (game_ids, next_cursor), expected)
+                game_ids, next_cursor = expected
 
-    if equipment:
-        query = query.join(Game.equipment_items).filter(GameEquipment.equipment_name.ilike(f"%{equipment}%"))
+        games = fetch_games_in_order(db, game_ids, fields)
+        hidden = set(game_ids).difference(game.id for game in games if game.is_public)
+        if not hidden:
+            return games, next_cursor
+        for game_id in hidden:
+            snapshot.remove_game(game_id)
 
-    games = (query.distinct()
-             .limit(limit)
-             .offset(offset)
-             .all())
 
-    return [map_game_to_read(game) for game in games]
+@public_router.get("/facets", response_model=GameFacets, status_code=200)
+def get_game_facets(
+        db: Annotated[Session, Depends(get_db)],
+        filters: Annotated[GameFilters, Depends()],
+):
+    """
+    Counts of public games per filter value, under the same filters as GET /games except the facet's own: each
+    count is how many games switching that filter to the value would list. total is under every filter.
+    """
+    matching_ids = _facet_matching_ids(db, filters)
+
+    # Scalar facets come back as one grouped pass over their combinations and are rolled up here
+    combinations = (db.query(Game.game_type, Game.age_rating, Game.difficulty, Game.duration, func.count())
+                    .filter(Game.id.in_(select(matching_ids.c.id)))
+                    .group_by(Game.game_type, Game.age_rating, Game.difficulty, Game.duration)
+                    .all())
+
+    facets = GameFacets(
+        total=0,
+        game_types=dict.fromkeys((gt.value for gt in GameTypeEnum), 0),
+        age_ratings=dict.fromkeys((ar.value for ar in AgeRatingEnum), 0),
+        game_equipment=dict.fromkeys((eq.value for eq in GameEquipmentEnum), 0),
+        game_settings=dict.fromkeys((gs.value for gs in GameSettingEnum), 0),
+        durations=dict.fromkeys((d.value for d in DurationEnum), 0),
+        difficulty=dict.fromkeys((gd.value for gd in GameDifficultyEnum), 0),
+    )
+    for game_type, age_rating, difficulty, duration, count in combinations:
+        facets.total += count
+        facets.game_types[game_type] = facets.game_types.get(game_type, 0) + count
+        facets.age_ratings[age_rating] = facets.age_ratings.get(age_rating, 0) + count
+        facets.durations[duration] = facets.durations.get(duration, 0) + count
+        if difficulty:
+            facets.difficulty[difficulty] = facets.difficulty.get(difficulty, 0) + count
+
+    # A facet whose own filter is set is counted again without it, one grouped query each
+    for field, column, counts in (
+            ("game_type", Game.game_type, facets.game_types),
+            ("age_rating", Game.age_rating, facets.age_ratings),
+            ("duration", Game.duration, facets.durations),
+            ("difficulty", Game.difficulty, facets.difficulty),
+    ):
+        if not getattr(filters, field):
+            continue
+        counts.update(dict.fromkeys(counts, 0))
+        for value, count in (db.query(column, func.count())
+                             .filter(Game.id.in_(select(_facet_matching_ids(db, filters, field).c.id)),
+                                     column.isnot(None))
+                             .group_by(column)):
+            counts[value] = count
+
+    for field, tag_column, game_id_column, counts in (
+            ("equipment", GameEquipment.equipment_name, GameEquipment.game_id, facets.game_equipment),
+            ("setting", GameSetting.setting_name, GameSetting.game_id, facets.game_settings),
+    ):
+        tag_ids = _facet_matching_ids(db, filters, field) if getattr(filters, field) else matching_ids
+        tag_counts = (db.query(tag_column, func.count(func.distinct(game_id_column)))
+                      .filter(game_id_column.in_(select(tag_ids.c.id)))
+                      .group_by(tag_column)
+                      .all())
+        for value, count in tag_counts:
+            counts[value] = count
+
+    return facets
+
+
+def _facet_matching_ids(db: Session, filters: GameFilters, exclude: Optional[str] = None):
+    """Subquery of the public game ids matching filters, leaving out the filter named exclude."""
+    if exclude:
+        filters = filters.model_copy(update={exclude: None})
+    return apply_game_filters(db, db.query(Game.id).filter(Game.is_public == True), filters).subquery()
+
+
+@public_router.get("/export", status_code=200, response_class=StreamingResponse,
+                   responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}},
+                                    "description": "Every public game, least recently updated first"}})
+def export_games(
+        db: Annotated[Session, Depends(get_db)],
+        format: ExportFormatEnum = ExportFormatEnum.ndjson,
+        since: Optional[datetime] = None,
+):
+    """
+    Streams the whole public catalog for mirroring elsewhere. Pass the greatest last_updated already
+    seen as since to pull only games created, edited or voted on from then on; games deleted or made
+    private since then come out as removal records ({"id", "deleted": true, "last_updated"}).
+    """
+    if is_postgres(db):
+        # One snapshot for the scan and for the children loaded with each batch, whatever is written meanwhile
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    query = select(Game).options(
+        selectinload(Game.equipment_items),
+        selectinload(Game.setting_items),
+        joinedload(Game.contributor),
+    )
+    if since:
+        if since.tzinfo:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        # Private games too, which come out as removals for the mirror
+        query = query.filter(Game.last_updated >= since)
+    else:
+        query = query.filter(Game.is_public == True)
+    # yield_per streams from a server-side cursor where the driver has one, so memory is bounded by the batch
+    query = query.order_by(Game.last_updated, Game.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    batches = _export_batches(db, query, since)
+
+    if format == ExportFormatEnum.csv:
+        return StreamingResponse(_csv_export(batches), media_type="text/csv",
+                                 headers={"Content-Disposition": 'attachment; filename="games.csv"'})
+    return StreamingResponse(_ndjson_export(batches), media_type="application/x-ndjson")
+
+
+def _export_batches(db: Session, query, since: Optional[datetime] = None):
+    # The session only holds clean rows weakly, so each batch is freed once serialised
+    records = (_export_record(game) for batch in db.scalars(query).partitions() for game in batch)
+    if since:
+        tombstones = (db.query(GameTombstone.game_id, GameTombstone.deleted_at)
+                      .filter(GameTombstone.deleted_at >= since)
+                      .order_by(GameTombstone.deleted_at, GameTombstone.game_id).all())
+        removals = [GameExportRemoval(id=game_id, last_updated=deleted_at) for game_id, deleted_at in tombstones]
+        records = heapq.merge(records, removals, key=lambda record: record.last_updated)
+
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _export_record(db_game: Game):
+    if db_game.is_public:
+        return map_game_to_export(db_game)
+    return GameExportRemoval(id=db_game.id, last_updated=db_game.last_updated)
+
+
+def _ndjson_export(batches):
+    for games in batches:
+        yield "".join(game.model_dump_json(exclude={"is_favourited"}) + "\n" for game in games)
+
+
+def _csv_export(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    for games in batches:
+        for game in games:
+            row = game.model_dump(mode="json")
+            if isinstance(game, GameExportRemoval):
+                writer.writerow([row["id"], *[""] * (len(EXPORT_CSV_COLUMNS) - 3), row["last_updated"], True])
+                continue
+            writer.writerow([
+                row["id"], row["name"], row["description"], row["age_rating"], row["game_type"],
+                row["player_count"]["min_players"], row["player_count"]["max_players"], row["duration"],
+                row["difficulty"], "|".join(row["equipment"]), "|".join(row["game_setting"] or []),
+                row["objective"], row["setup"], row["rules"], row["image_url"], row["is_whats_that_game_certified"],
+                row["upvotes"], row["contributor"]["username"], row["contributor"]["country_of_origin"],
+                row["created_at"], row["last_updated"], False,
+            ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@public_router.get("/batch", response_model=List[GameRead], status_code=200,
+                   responses={400: {"description": "Too many ids in one request"}})
+def get_games_by_ids(
+        db: Annotated[Session, Depends(get_db)],
+        ids: Annotated[List[str], Query()],
+        current_user: Annotated[User | None, Depends(get_current_user_optional)],
+):
+    """
+    The games for ids, in the order requested. Ids that don't exist, or are private games of another user,
+    are left out rather than failing the whole batch.
+    """
+    game_ids = list(dict.fromkeys(ids))
+    if len(game_ids) > BATCH_FETCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_FETCH_MAX_IDS} games can be fetched at once")
+
+    cached_games = _get_cached_games(db, game_ids)
+    games = [cached_games[game_id] for game_id in game_ids if game_id in cached_games]
+    visible = [cached.payload for cached in games if _can_view(cached, current_user)]
+    return game_list_response(mark_favourited(db, visible, current_user))
+
+
+@public_router.post("/plan", response_model=GamePlan, status_code=200)
+def plan_game_night(
+        db: Annotated[Session, Depends(get_db)],
+        plan: GamePlanRequest,
+):
+    """
+    Public games the group can play with what they have, best first, and a schedule of the best of them
+    that can be played back to back within the time available.
+    """
+    if config.CATALOG_SNAPSHOT_ENABLED:
+        candidates = catalog_snapshot.get_catalog_snapshot(db).plan(plan)
+    else:
+        candidates = _plan_candidates(db, plan)
+
+    # The snapshot can lag deletes and privacy changes made by other processes, so games that turn out to be
+    # hidden once loaded are left out and the plan made again without them
+    games: Dict[str, GameRead] = {}
+    hidden = set()
+    while True:
+        suggestions, schedule, schedule_minutes = _plan_schedule(
+            [candidate for candidate in candidates if candidate[0] not in hidden], plan)
+        missing = [game_id for game_id in dict.fromkeys(suggestions + schedule) if game_id not in games]
+        loaded = {game.id: game for game in fetch_games_in_order(db, missing)}
+        for game_id in missing:
+            if game_id in loaded and loaded[game_id].is_public:
+                games[game_id] = map_game_to_read(loaded[game_id], validate=False)
+            else:
+                hidden.add(game_id)
+        if not hidden.intersection(missing):
+            break
+
+    return GamePlan(games=[games[game_id] for game_id in suggestions],
+                    schedule=[games[game_id] for game_id in schedule],
+                    schedule_minutes=schedule_minutes)
+
+
+def _plan_schedule(candidates: List[Tuple[str, int, Optional[int]]], plan: GamePlanRequest):
+    """The suggestions, schedule and schedule length of plan_game_night from its ranked candidates."""
+    suggestions = [game_id for game_id, _, _ in candidates[:plan.limit]]
+
+    # Greedy by rank: take each game in turn while its longest duration still fits in the time left. A game
+    # with no upper bound fits when its shortest does, and is given the rest of the evening
+    schedule, schedule_minutes = [], 0
+    for game_id, shortest, longest in candidates:
+        time_left = plan.time_available_minutes - schedule_minutes
+        if len(schedule) == plan.limit or not time_left:
+            break
+        if shortest <= time_left and (longest is None or longest <= time_left):
+            schedule.append(game_id)
+            schedule_minutes += time_left if longest is None else longest
+    return suggestions, schedule, schedule_minutes
+
+
+def _plan_candidates(db: Session, plan: GamePlanRequest) -> List[Tuple[str, int, Optional[int]]]:
+    """CatalogSnapshot.plan in SQL, for when CATALOG_SNAPSHOT_ENABLED is off."""
+    owned = [item.value for item in plan.equipment] + [GameEquipmentEnum.none.value, GameEquipmentEnum.nothing.value]
+    minutes = plan.time_available_minutes
+    query = db.query(Game.id, Game.duration_min_minutes, Game.duration_max_minutes).filter(
+        Game.is_public == True,
+        player_count_contains(db, plan.players),
+        or_(Game.duration_max_minutes <= minutes,
+            and_(Game.duration_max_minutes.is_(None), Game.duration_min_minutes <= minutes)),
+        # Needs nothing the group lacks
+        ~Game.equipment_items.any(GameEquipment.equipment_name.notin_(owned)),
+    )
+    if plan.setting:
+        query = query.filter(Game.setting_items.any(GameSetting.setting_name == plan.setting.value))
+    if plan.youngest_age is not None:
+        query = query.filter(Game.age_rating.in_(
+            [rating.value for rating, age in AGE_RATING_MIN_AGE.items() if age <= plan.youngest_age]))
+    if plan.max_difficulty:
+        levels = list(GameDifficultyEnum)
+        query = query.filter(or_(Game.difficulty.is_(None), Game.difficulty.in_(
+            [level.value for level in levels[:levels.index(plan.max_difficulty) + 1]])))
+    return [tuple(row) for row in query.order_by(Game.upvotes.desc(), Game.id.desc())]
+
+
+@public_router.get("/random", response_model=GameRead, status_code=200,
+                   responses={404: {"description": "No public game matches the filters"},
+                              400: {"description": "Invalid cursor"}})
+def get_random_game(
+        db: Annotated[Session, Depends(get_db)],
+        response: Response,
+        filters: Annotated[GameFilters, Depends()],
+        seed: Optional[int] = None,
+        cursor: Optional[str] = None,
+):
+    """
+    A uniformly random public game matching the same filters as GET /games. Passing a seed returns an
+    X-Next-Cursor; following the cursors walks the matching games in a shuffled order without repeats
+    until every one has been shown.
+    """
+    step = 0
+    if cursor:
+        seed, step = decode_cursor(cursor, "random", RANDOM_CURSOR_KEYS)
+
+    snapshot = catalog_snapshot.get_catalog_snapshot(db) if config.CATALOG_SNAPSHOT_ENABLED else None
+    within = None
+    if filters.q and snapshot is not None:
+        query = apply_game_filters(db, db.query(Game.id).filter(Game.is_public == True), filters)
+        within = [row.id for row in query.limit(search_index.MAX_SEARCH_RESULTS)]
+
+    cached = None
+    for _ in range(RANDOM_MAX_DRAWS):
+        if snapshot is None:
+            game_id = _random_public_game_id(db, filters, seed, step)
+        else:
+            game_id, step = snapshot.random_game(filters, seed, step, within)
+        if game_id is None:
+            break
+        cached = _get_cached_games(db, [game_id]).get(game_id)
+        if cached is None or not cached.is_public:
+            # The detail cache may be the stale one, so ask the database before trusting it
+            game_cache.invalidate_game(game_id)
+            cached = _get_cached_games(db, [game_id]).get(game_id)
+        if cached is not None and cached.is_public:
+            break
+        if snapshot is not None:
+            # Deleted or made private by another process before this one's snapshot caught up
+            snapshot.remove_game(game_id)
+        cached = None
+        step += 1
+    if cached is None:
+        raise HTTPException(status_code=404, detail="No public game matches the filters")
+
+    response.headers["Cache-Control"] = NO_STORE
+    if seed is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor("random", [seed, step + 1])
+    return Response(content=cached.body, media_type="application/json", headers=response.headers)
+
+
+def _random_public_game_id(db: Session, filters: GameFilters, seed: Optional[int], step: int) -> Optional[str]:
+    """
+    get_random_game's draw without the catalog snapshot: step of seed's permutation of the matches in id order.
+    Counting the matches and seeking to the position with OFFSET both scan them, so a draw costs O(matches);
+    draws only take constant time from the snapshot (CATALOG_SNAPSHOT_ENABLED). A seek on id >= a random
+    pivot would be indexed, but could neither pick uniformly nor walk a seed's permutation without repeats.
+    """
+    query = apply_game_filters(db, db.query(Game.id).filter(Game.is_public == True), filters)
+    size = query.count()
+    if not size:
+        return None
+    return query.order_by(Game.id).offset(catalog_snapshot.shuffled_position(seed, step, size)).limit(1).scalar()
 
 
 @protected_router.get("/mine", response_model=List[GameRead], status_code=200,
                       responses={401: {"description": "Authentication required"}})
 def get_my_games(
         db: Annotated[Session, Depends(get_db)],
+        response: Response,
         current_user: User = auth_required(),
+        cursor: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
 ):
     limit = min(limit, 100)
     offset = max(offset, 0)
-    games = (db.query(Game).options(
-        joinedload(Game.equipment_items),
-        joinedload(Game.setting_items),
-        joinedload(Game.contributor),
-    ).filter(Game.contributor_id == current_user.id)
-             .limit(limit)
-             .offset(offset)
-             .all())
+    query = db.query(Game.id, Game.created_at).filter(Game.contributor_id == current_user.id)
 
-    return [map_game_to_read(game) for game in games]
+    rows, next_cursor = paginate_keyset(query, "mine", GAME_SORT_KEYS[GameSortEnum.newest], cursor, limit,
+                                        lambda row: [row.created_at, row.id], offset)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    games = [map_game_to_read(game, validate=False) for game in fetch_games_in_order(db, [row.id for row in rows])]
+    return game_list_response(mark_favourited(db, games, current_user), response)
+
+
+@public_router.get("/{game_id}/similar", response_model=List[GameRead], status_code=200,
+                   responses={404: {"description": "Game not found"}, 403: {"description": "Game is private"}})
+def get_similar_games(
+        db: Annotated[Session, Depends(get_db)],
+        game_id: str,
+        current_user: Annotated[User | None, Depends(get_current_user_optional)],
+        limit: int = 10,
+):
+    """
+    The public games most similar to game_id by type, age rating, difficulty, players, duration and tags.
+    Scored over the catalog snapshot, which is built on first use even without CATALOG_SNAPSHOT_ENABLED: the
+    ranking compares every public game, which SQL could only do by loading them all on each request.
+    """
+    cached = _get_cached_games(db, [game_id]).get(game_id)
+    if cached is None:
+        raise GAME_NOT_FOUND_EXCEPTION
+    if not _can_view(cached, current_user):
+        raise FORBIDDEN_EXCEPTION
+
+    snapshot = catalog_snapshot.get_catalog_snapshot(db)
+    limit = min(max(limit, 1), 50)
+    # The snapshot can lag deletes and privacy changes made by other processes, so games that turn out to be
+    # hidden once loaded are left out and the next most similar asked for in their place
+    games: Dict[str, GameRead] = {}
+    hidden = set()
+    while True:
+        game_ids = [game_id for game_id in snapshot.similar(cached.payload, limit + len(hidden))
+                    if game_id not in hidden]
+        missing = [game_id for game_id in game_ids if game_id not in games]
+        for db_game in fetch_games_in_order(db, missing):
+            if db_game.is_public:
+                games[db_game.id] = map_game_to_read(db_game, validate=False)
+        hidden.update(game_id for game_id in missing if game_id not in games)
+        if not hidden.intersection(missing):
+            break
+    return game_list_response([games[game_id] for game_id in game_ids])
 
 
 @public_router.get("/{game_id}", response_model=GameRead, status_code=200,
                    responses={404: {"description": "Game not found"}, 401: {"description": "Authentication required"}})
 def get_game_by_id(
         db: Annotated[Session, Depends(get_db)],
+        request: Request,
+        response: Response,
         game_id: str,
         current_user: Annotated[User | None, Depends(get_current_user_optional)],
 ):
-    game: Game | None = db.query(Game).filter(Game.id == game_id).first()
-    if not game:
+    cached = _get_cached_games(db, [game_id]).get(game_id)
+    if cached is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    if not game.is_public:
-        if not current_user or game.contributor_id != current_user.id:
-            raise FORBIDDEN_EXCEPTION
+    if not _can_view(cached, current_user):
+        raise FORBIDDEN_EXCEPTION
+
+    if current_user is None:
+        etag, cache_control = cached.etag, REVALIDATE_PUBLIC if cached.is_public else REVALIDATE_PRIVATE
+    else:
+        is_favourited = bool(favourited_game_ids(db, current_user.id, [game_id]))
+        etag, cache_control = make_etag(cached.etag, is_favourited), REVALIDATE_PRIVATE
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+    set_cache_headers(response, etag, cache_control)
 
-    return map_game_to_read(game)
+    if current_user is None:
+        return Response(content=cached.body, media_type="application/json", headers=response.headers)
+    return Response(content=cached.payload.model_copy(update={"is_favourited": is_favourited}).model_dump_json(),
+                    media_type="application/json", headers=response.headers)
 
 
 # UPDATE
@@ -234,6 +786,10 @@ def update_game(
     if db_game.contributor_id != current_user.id:
         raise UNAUTHORIZED_EXCEPTION
     update_data = updates.model_dump(exclude_unset=True)
+    # Only one end of the range may have been sent, so check it against the other end as stored
+    min_players = update_data.get("min_players") or db_game.min_players
+    if min_players > (update_data.get("max_players") or db_game.max_players):
+        raise HTTPException(status_code=400, detail="min_players must not exceed max_players")
     for key, value in update_data.items():
         if key in ["equipment", "game_setting"]:
             continue
@@ -263,8 +819,10 @@ def update_game(
                 setting_name=s
             ))
 
+    db_game.last_updated = datetime.now(timezone.utc)
     db.commit()
     db.refresh(db_game)
+    _after_game_write(db, db_game)
 
     return map_game_to_read(db_game)
 
@@ -285,41 +843,278 @@ def change_game_visibility(
         raise UNAUTHORIZED_EXCEPTION
 
     setattr(db_game, "is_public", game_visibility.is_public)
+    db_game.last_updated = datetime.now(timezone.utc)
 
     db.commit()
     db.refresh(db_game)
+    _after_game_write(db, db_game)
 
     return map_game_to_read(db_game)
 
 
-def map_game_to_read(db_game: Game) -> GameRead:
-    return GameRead(
-        id=db_game.id,
-        name=db_game.name,
-        description=db_game.description,
-        age_rating=db_game.age_rating,
-        game_type=db_game.game_type,
-        player_count=PlayerCount(
-            min_players=db_game.min_players,
-            max_players=db_game.max_players
-        ),
-        duration=db_game.duration,
-        difficulty=db_game.difficulty,
-        equipment=[item.equipment_name for item in db_game.equipment_items],
-        game_setting=[s.setting_name for s in db_game.setting_items],
-        objective=db_game.objective,
-        setup=db_game.setup,
-        rules=db_game.rules,
-        image_url=db_game.image_url,
-        is_public=db_game.is_public,
-        upvotes=db_game.upvotes,
-        contributor=UserPublicRead(
-            username=db_game.contributor.username,
-            country_of_origin=db_game.contributor.country_of_origin,
-        ),
-        created_at=db_game.created_at,
-        is_whats_that_game_certified=db_game.is_whats_that_game_verified
-    )
+def apply_game_filters(db: Session, query, filters: GameFilters, search=None):
+    """Applies filters to a Game query; search takes precomputed search_clauses() for filters.q."""
+    if filters.q:
+        search_filter, _ = search or search_index.search_clauses(db, filters.q)
+        query = query.filter(search_filter)
+
+    # Text filters match as plain substrings, % and _ included, like the catalog snapshot's matching
+    if filters.name:
+        query = query.filter(Game.name.icontains(filters.name, autoescape=True))
+
+    if filters.game_type:
+        query = query.filter(Game.game_type == filters.game_type)
+
+    if filters.age_rating:
+        query = query.filter(Game.age_rating == filters.age_rating)
+
+    if filters.min_players:
+        query = query.filter(Game.min_players >= filters.min_players)
+
+    if filters.max_players:
+        query = query.filter(Game.max_players <= filters.max_players)
+
+    if filters.players is not None:
+        query = query.filter(player_count_contains(db, filters.players))
+
+    if filters.duration:
+        query = query.filter(Game.duration.icontains(filters.duration, autoescape=True))
+
+    # Games with no known range (NULL) never match a range filter
+    if filters.min_duration is not None:
+        query = query.filter(Game.duration_min_minutes >= filters.min_duration)
+
+    if filters.max_duration is not None:
+        query = query.filter(Game.duration_max_minutes <= filters.max_duration)
+
+    if filters.difficulty:
+        query = query.filter(Game.difficulty == filters.difficulty)
+
+    # EXISTS rather than JOIN + DISTINCT, so the query can still be ordered by search rank
+    if filters.setting:
+        query = query.filter(Game.setting_items.any(
+            GameSetting.setting_name.icontains(filters.setting, autoescape=True)))
+
+    if filters.equipment:
+        query = query.filter(Game.equipment_items.any(
+            GameEquipment.equipment_name.icontains(filters.equipment, autoescape=True)))
+
+    return query
+
+
+def player_count_contains(db: Session, players: int):
+    """Games playable with exactly players people, written to match the players index of the dialect."""
+    if is_postgres(db):
+        return player_range(Game.min_players, Game.max_players).op("@>")(players)
+    return and_(Game.min_players <= players, Game.max_players >= players)
+
+
+def game_load_options(fields: Optional[frozenset] = None) -> list:
+    """
+    Loader options for Game rows about to go through map_game_to_read: the children come in one extra
+    statement each however many games there are. With fields, only what those GameRead fields need.
+    """
+    if fields is None:
+        return [
+            selectinload(Game.equipment_items),
+            selectinload(Game.setting_items),
+            joinedload(Game.contributor),  # many-to-one, so joining doesn't multiply rows
+        ]
+    columns = [column for field in fields for column in _columns_for_field(field)]
+    # is_public as well, which the listings check the rows they load against
+    relationships = [load() for field, load in GAME_READ_RELATIONSHIPS.items() if field in fields]
+    return [load_only(Game.is_public, *columns)] + relationships
+
+
+def fetch_games_in_order(db: Session, game_ids: List[str], fields: Optional[frozenset] = None) -> List[Game]:
+    """
+    Loads a page of games with their equipment, settings and contributor in a fixed three statements,
+    returned in the order of game_ids. Ids that no longer exist are skipped.
+    With fields, only the columns and children those GameRead fields need are loaded.
+    """
+    if not game_ids:
+        return []
+
+    games = (db.query(Game)
+             .options(*game_load_options(fields))
+             .filter(Game.id.in_(game_ids))
+             .all())
+    games_by_id = {game.id: game for game in games}
+
+    return [games_by_id[game_id] for game_id in game_ids if game_id in games_by_id]
+
+
+# How each GameRead field is read off a Game row, and what has to be loaded for it
+GAME_READ_FIELDS = {
+    "id": lambda g: g.id,
+    "name": lambda g: g.name,
+    "description": lambda g: g.description,
+    "age_rating": lambda g: AgeRatingEnum(g.age_rating),
+    "game_type": lambda g: GameTypeEnum(g.game_type),
+    "player_count": lambda g: PlayerCount.model_construct(min_players=g.min_players, max_players=g.max_players),
+    "duration": lambda g: g.duration,
+    "difficulty": lambda g: GameDifficultyEnum(g.difficulty) if g.difficulty else None,
+    "equipment": lambda g: [item.equipment_name for item in g.equipment_items],
+    "game_setting": lambda g: [s.setting_name for s in g.setting_items],
+    "objective": lambda g: g.objective,
+    "setup": lambda g: g.setup,
+    "rules": lambda g: g.rules,
+    "image_url": lambda g: g.image_url,
+    "is_public": lambda g: g.is_public,
+    "upvotes": lambda g: g.upvotes,
+    "contributor": lambda g: UserPublicRead.model_construct(username=g.contributor.username,
+                                                            country_of_origin=g.contributor.country_of_origin),
+    "created_at": lambda g: g.created_at,
+    "is_whats_that_game_certified": lambda g: g.is_whats_that_game_verified,
+    # Per user, so filled in afterwards by mark_favourited
+    "is_favourited": lambda g: None,
+}
+GAME_READ_COLUMNS = {
+    "player_count": (Game.min_players, Game.max_players),
+    "is_whats_that_game_certified": (Game.is_whats_that_game_verified,),
+    "equipment": (),
+    "game_setting": (),
+    "contributor": (Game.contributor_id,),
+    "is_favourited": (),
+}
+GAME_READ_RELATIONSHIPS = {
+    "equipment": lambda: selectinload(Game.equipment_items),
+    "game_setting": lambda: selectinload(Game.setting_items),
+    "contributor": lambda: joinedload(Game.contributor).load_only(User.username, User.country_of_origin),
+}
+
+
+def map_game_to_read(db_game: Game, fields: Optional[frozenset] = None, validate: bool = True) -> GameRead:
+    """
+    A validated GameRead, so a stored row that no longer fits the schema fails here rather than being served.
+    The listings pass validate=False and build it without re-running field validation: their rows were
+    validated on the way in, and a page serialises about 1.2x faster (scripts/bench_game_serialization.py).
+    With fields (listings only), only those are set, and game_list_response leaves the rest out of the JSON.
+    """
+    readers = GAME_READ_FIELDS.items() if fields is None else [(f, GAME_READ_FIELDS[f]) for f in fields]
+    values = {field: read(db_game) for field, read in readers}
+    if not validate:
+        return GameRead.model_construct(**values)
+    # The nested models are built unvalidated by their readers, so they go in as data to be validated too
+    return GameRead.model_validate({field: value.model_dump() if isinstance(value, BaseModel) else value
+                                    for field, value in values.items()})
+
+
+def _columns_for_field(field: str):
+    if field in GAME_READ_COLUMNS:
+        return GAME_READ_COLUMNS[field]
+    return (getattr(Game, field),)
+
+
+def parse_game_fields(fields: Optional[str]) -> Optional[frozenset]:
+    """The GameRead fields named in a comma-separated fields= parameter; id is always included."""
+    if not fields:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - GAME_READ_FIELDS.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return frozenset(requested | {"id"})
+
+
+def map_game_to_export(db_game: Game) -> GameExport:
+    return GameExport.model_construct(**dict(map_game_to_read(db_game, validate=False)),
+                                      last_updated=db_game.last_updated)
+
+
+_GAME_LIST_ADAPTER = TypeAdapter(List[GameRead])
+
+
+def game_list_response(games: List[GameRead], response: Optional[Response] = None,
+                       fields: Optional[frozenset] = None) -> Response:
+    """
+    Serialises games straight to the JSON FastAPI would send for response_model=List[GameRead], without
+    its validate-then-dump pass. Headers already set on the endpoint's injected response are carried over.
+    Pass the fields games were mapped with to leave every other field out.
+    """
+    content = _GAME_LIST_ADAPTER.dump_json(games, exclude_unset=fields is not None)
+    return Response(content=content, media_type="application/json",
+                    headers=response.headers if response is not None else None)
+
+
+def _get_cached_games(db: Session, game_ids: List[str]) -> Dict[str, game_cache.CachedGame]:
+    """Detail cache entries for game_ids; all misses are loaded together and cached. Unknown ids are absent."""
+    game_cache.sync_game_cache(db)
+    cached_games = {}
+    missing = []
+    for game_id in game_ids:
+        cached = game_cache.get_cached_game(game_id)
+        if cached is None:
+            missing.append(game_id)
+        else:
+            cached_games[game_id] = cached
+
+    for db_game in fetch_games_in_order(db, missing):
+        cached_games[db_game.id] = game_cache.cache_game(db_game.id, map_game_to_read(db_game),
+                                                         db_game.contributor_id)
+    return cached_games
+
+
+def favourited_game_ids(db: Session, user_id: str, game_ids: List[str]) -> set:
+    """Which of game_ids user_id has favourited, in one query however many ids there are."""
+    if not game_ids:
+        return set()
+    return {row.game_id for row in db.query(UserFavourites.game_id).filter(
+        UserFavourites.user_id == user_id, UserFavourites.game_id.in_(game_ids))}
+
+
+def favourites_version(db: Session, user_id: str) -> Tuple[int, Optional[datetime]]:
+    """
+    Changes whenever user_id favourites or unfavourites a game: how many favourites they have and when the
+    latest was added. One read of the ix_user_favourites_user_created_at index.
+    """
+    count, latest = db.query(func.count(), func.max(UserFavourites.created_at)).filter(
+        UserFavourites.user_id == user_id).one()
+    return count, latest
+
+
+def mark_favourited(db: Session, games: List[GameRead], current_user: Optional[User],
+                    fields: Optional[frozenset] = None) -> List[GameRead]:
+    """
+    Copies of games with is_favourited set for current_user. Anonymous requests, and fields= selections
+    without is_favourited, get games back unchanged without touching the database.
+    """
+    if current_user is None or (fields is not None and "is_favourited" not in fields):
+        return games
+    favourited = favourited_game_ids(db, current_user.id, [game.id for game in games])
+    return [game.model_copy(update={"is_favourited": game.id in favourited}) for game in games]
+
+
+def _can_view(cached: game_cache.CachedGame, current_user: Optional[User]) -> bool:
+    return cached.is_public or (current_user is not None and cached.contributor_id == current_user.id)
+
+
+def _after_game_write(db: Session, db_game: Game) -> None:
+    search_index.index_game(db, db_game)
+    catalog_snapshot.snapshot_game(db_game)
+    game_cache.invalidate_game(db_game.id)
+    bump_catalog_version()
+
+
+def after_game_vote(db: Session, game_id: str, upvotes: int, trending_score: float) -> None:
+    catalog_snapshot.snapshot_votes(game_id, upvotes, trending_score)
+    game_cache.invalidate_game(game_id)
+    bump_catalog_version()
+
+
+def flush_vote_buffer(db: Session) -> int:
+    """Writes the buffered votes of UPVOTE_BUFFER_ENABLED to games; returns how many games changed."""
+    flushed = votes.flush_votes(db)
+    for game_id, upvotes, trending_score in flushed:
+        after_game_vote(db, game_id, upvotes, trending_score)
+    return len(flushed)
+
+
+def _after_game_delete(db: Session, game_id: str) -> None:
+    search_index.unindex_game(db, game_id)
+    catalog_snapshot.unsnapshot_game(game_id)
+    game_cache.invalidate_game(game_id)
+    bump_catalog_version()
 
 
 # DELETE
@@ -336,6 +1131,12 @@ def delete_game(
     if db_game.contributor_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not allowed to delete this game")
 
+    db.query(GameNeighbour).filter(
+        or_(GameNeighbour.game_id == game_id, GameNeighbour.neighbour_id == game_id)
+    ).delete(synchronize_session=False)
+    db.query(UserFavourites).filter(UserFavourites.game_id == game_id).delete(synchronize_session=False)
     db.delete(db_game)
+    db.add(GameTombstone(game_id=game_id, deleted_at=datetime.now(timezone.utc)))
     db.commit()
+    _after_game_delete(db, game_id)
     return None
@@ -1,7 +1,7 @@
 from typing import List
 
 import pycountry
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel
 
 from src.models.enums.age_rating_enum import AgeRatingEnum
@@ -11,6 +11,7 @@ from src.models.enums.game_difficulty_enum import GameDifficultyEnum
 from src.models.enums.game_setting_enum import GameSettingEnum
 from src.models.enums.game_type_enum import GameTypeEnum
 from src.models.game_models.game_metadata import GameMetadata
+from src.utils.http_cache import STATIC_PUBLIC, etag_matches, make_etag, not_modified, set_cache_headers
 
 router = APIRouter()
 
@@ -24,8 +25,7 @@ class CountriesResponse(BaseModel):
     countries: List[Country]
 
 
-@router.get("/countries", response_model=CountriesResponse)
-def get_countries():
+def _build_countries() -> CountriesResponse:
     countries = [
         Country(code=country.alpha_2, name=country.name)
         for country in pycountry.countries
@@ -34,8 +34,7 @@ def get_countries():
     return CountriesResponse(countries=countries_sorted)
 
 
-@router.get("/metadata", response_model=GameMetadata, status_code=200)
-def get_metadata():
+def _build_metadata() -> GameMetadata:
     return GameMetadata(
         game_types=[gt.value for gt in GameTypeEnum],
         age_ratings=[ar.value for ar in AgeRatingEnum],
@@ -44,3 +43,26 @@ def get_metadata():
         durations=[d.value for d in DurationEnum],
         difficulty=[gd.value for gd in GameDifficultyEnum]
     )
+
+
+# Both payloads only change with a deploy, so they are built and hashed once
+COUNTRIES = _build_countries()
+COUNTRIES_ETAG = make_etag(COUNTRIES.model_dump_json())
+METADATA = _build_metadata()
+METADATA_ETAG = make_etag(METADATA.model_dump_json())
+
+
+@router.get("/countries", response_model=CountriesResponse)
+def get_countries(request: Request, response: Response):
+    if etag_matches(request, COUNTRIES_ETAG):
+        return not_modified(COUNTRIES_ETAG, STATIC_PUBLIC)
+    set_cache_headers(response, COUNTRIES_ETAG, STATIC_PUBLIC)
+    return COUNTRIES
+
+
+@router.get("/metadata", response_model=GameMetadata, status_code=200)
+def get_metadata(request: Request, response: Response):
+    if etag_matches(request, METADATA_ETAG):
+        return not_modified(METADATA_ETAG, STATIC_PUBLIC)
+    set_cache_headers(response, METADATA_ETAG, STATIC_PUBLIC)
+    return METADATA
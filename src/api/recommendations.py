@@ -0,0 +1,31 @@
+# src/api/recommendations.py
+from typing import Annotated, List
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from src.api.games import fetch_games_in_order, game_list_response, map_game_to_read
+from src.api.users import get_current_active_user
+from src.db.database import get_db
+from src.db.tables import User
+from src.models.game_models.game import GameRead
+from src.services.recommendations import recommended_game_ids
+
+# Mounted under /users; kept apart from users.py, which games.py imports
+router = APIRouter()
+
+
+def auth_required():
+    return Depends(get_current_active_user)
+
+
+@router.get("/me/recommendations", response_model=List[GameRead], status_code=200,
+            responses={401: {"description": "Authentication required"}})
+def get_my_recommendations(
+        db: Annotated[Session, Depends(get_db)],
+        current_user: User = auth_required(),
+        limit: int = 20,
+):
+    """Games favourited by people who favourited the same games as you, from the last neighbour rebuild."""
+    game_ids = recommended_game_ids(db, current_user.id, min(max(limit, 1), 100))
+    return game_list_response([map_game_to_read(game, validate=False) for game in fetch_games_in_order(db, game_ids)])
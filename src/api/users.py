@@ -2,20 +2,27 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Annotated
+from typing import Annotated, List
 
 from fastapi import APIRouter, HTTPException, Request, Depends
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel
-from sqlalchemy import func
+from sqlalchemy import delete, func
 from sqlalchemy.orm import Session
 
-from src.core.exceptions import USER_NOT_FOUND_EXCEPTION, INACTIVE_USER_EXCEPTION, UNAUTHORIZED_EXCEPTION
+from src.core.exceptions import USER_NOT_FOUND_EXCEPTION, INACTIVE_USER_EXCEPTION, UNAUTHORIZED_EXCEPTION, \
+    FORBIDDEN_EXCEPTION
 from src.core.security import verify_access_token, hash_password, verify_password
 from src.db.database import get_db
-from src.db.tables import User
+from src.db.tables import Game, User, UserFavourites
+from src.models.enums.role_enum import Role
 from src.models.user_models.user import UserCreate, UserPublicRead, UserPrivateRead, UserCompleteProfile, UserUpdate, \
     UserPasswordUpdate
+from src.services import auth_cache, catalog_snapshot, votes
+from src.services.catalog_version import bump_catalog_version
+from src.services.game_cache import clear_game_cache, invalidate_game
+from src.utils import config
+from src.utils.trending import vote_weight
 
 
 class MessageResponse(BaseModel):
@@ -38,6 +45,19 @@ def get_access_token(
     return request.cookies.get("access_token")
 
 
+def find_token_user(db: Session, username: str) -> User | None:
+    """The user a token's sub names; with AUTH_CACHE_ENABLED usually from auth_cache rather than a SELECT."""
+    if config.AUTH_CACHE_ENABLED:
+        user = auth_cache.get_cached_user(db, username)
+        if user is not None:
+            return user
+
+    user = db.query(User).filter(func.lower(User.username) == username.lower()).first()
+    if user is not None and config.AUTH_CACHE_ENABLED:
+        auth_cache.cache_user(user)
+    return user
+
+
 def get_current_user(
         token: str = Depends(get_access_token),
         db: Session = Depends(get_db),
@@ -46,7 +66,7 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     token_data = verify_access_token(token)
-    user = db.query(User).filter(func.lower(User.username) == token_data.username.lower()).first()
+    user = find_token_user(db, token_data.username)
 
     if not user:
         raise USER_NOT_FOUND_EXCEPTION
@@ -62,7 +82,7 @@ def get_current_user_optional(
         return None
     try:
         token_data = verify_access_token(token)
-        return db.query(User).filter(func.lower(User.username) == token_data.username.lower()).first()
+        return find_token_user(db, token_data.username)
     except HTTPException:
         return None
 
@@ -73,6 +93,12 @@ def get_current_active_user(current_user: User = Depends(get_current_user)):
     return current_user
 
 
+def get_current_admin_user(current_user: User = Depends(get_current_active_user)):
+    if current_user.role != Role.admin:
+        raise FORBIDDEN_EXCEPTION
+    return current_user
+
+
 # CREATE
 @router.post("/register", response_model=UserPublicRead, status_code=201,
              responses={400: {"description": "Username taken or Email already in use"},
@@ -160,9 +186,19 @@ def update_my_profile(
             setattr(current_user, key, value)
 
     current_user.last_updated = datetime.now(timezone.utc)
+    if "country_of_origin" in update_data:
+        # Their games show the new country, so they count as changed for other workers and exports
+        db.query(Game).filter(Game.contributor_id == current_user.id).update(
+            {Game.last_updated: current_user.last_updated}, synchronize_session=False)
 
     db.commit()
     db.refresh(current_user)
+    auth_cache.invalidate_user(current_user.username)
+
+    if "country_of_origin" in update_data:
+        # Cached game payloads and listings embed their contributor's country
+        clear_game_cache()
+        bump_catalog_version()
 
     return current_user
 
@@ -191,6 +227,7 @@ def update_my_password(
     current_user.last_updated = datetime.now(timezone.utc)
 
     db.commit()
+    auth_cache.invalidate_user(current_user.username)
 
     return {"message": "Password updated successfully"}
 
@@ -211,6 +248,26 @@ def delete_account(
     if not user:
         raise USER_NOT_FOUND_EXCEPTION
 
+    username = user.username
+    changes = _take_back_votes(db, user.id)
     db.delete(user)
-    db.commit()
+    corrected = votes.commit_votes(db, changes)
+    auth_cache.invalidate_user(username)
+    for game_id, upvotes, trending_score in corrected:
+        catalog_snapshot.snapshot_votes(game_id, upvotes, trending_score)
+        invalidate_game(game_id)
+    if corrected:
+        bump_catalog_version()
     return {"message": "Account successfully deleted"}
+
+
+def _take_back_votes(db: Session, user_id: str) -> List[votes.VoteChange]:
+    """Deletes the user's favourites, returning the changes that take their votes back off the games."""
+    removed = db.execute(
+        delete(UserFavourites).where(UserFavourites.user_id == user_id)
+        .returning(UserFavourites.game_id, UserFavourites.created_at)
+    ).all()
+    floors = {game_id: vote_weight(created_at) for game_id, created_at in
+              db.query(Game.id, Game.created_at).filter(Game.id.in_([game_id for game_id, _ in removed]))}
+    return [votes.VoteChange(game_id, -1, floors[game_id], removed=vote_weight(favourited_at))
+            for game_id, favourited_at in removed if game_id in floors]
@@ -28,3 +28,8 @@ GAME_NOT_FOUND_EXCEPTION = HTTPException(
     status_code=404,
     detail="Game not found"
 )
+
+INVALID_CURSOR_EXCEPTION = HTTPException(
+    status_code=400,
+    detail="Invalid pagination cursor"
+)
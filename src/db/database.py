@@ -1,6 +1,7 @@
 # src/db/database.py
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
 from src.utils.config import DATABASE_URL
 
@@ -9,6 +10,16 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def insert_or_ignore(db: Session, model):
+    """INSERT that skips rows clashing with an existing key (ON CONFLICT DO NOTHING) instead of failing."""
+    dialect = postgresql if is_postgres(db) else sqlite
+    return dialect.insert(model).on_conflict_do_nothing()
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -1,11 +1,13 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Float, ForeignKey, Enum, Index, func, literal_column
+from sqlalchemy.orm import relationship, validates
 
 from src.db.database import Base
+from src.models.enums.duration_enum import duration_minutes
 from src.models.enums.role_enum import Role
+from src.utils.trending import vote_weight
 
 GAMES_ID_FK: str = "games.id"
 
@@ -31,6 +33,35 @@ class User(Base):
     games = relationship("Game", back_populates="contributor")
     favourites = relationship("UserFavourites", back_populates="user")
 
+    __table_args__ = (
+        # Case-insensitive lookups by login name, see find_token_user in src/api/users.py and src/api/auth.py
+        Index("ix_users_username_lower", func.lower(username)),
+        Index("ix_users_email_lower", func.lower(email)),
+    )
+
+
+def _search_vector(name, description, objective, rules):
+    english = literal_column("'english'")
+    weighted = [
+        func.setweight(func.to_tsvector(english, column), literal_column(f"'{weight}'"))
+        for column, weight in ((name, "A"), (description, "B"), (objective, "C"), (rules, "D"))
+    ]
+    vector = weighted[0]
+    for part in weighted[1:]:
+        vector = vector.op("||")(part)
+    return vector
+
+
+def player_range(min_players, max_players):
+    """Inclusive int4range of a game's player counts (Postgres only)."""
+    return func.int4range(min_players, max_players, literal_column("'[]'"))
+
+
+def _initial_trending_score(context):
+    # A game starts with the weight of its creation, so new games surface in sort=trending before any votes
+    created_at = context.get_current_parameters().get("created_at")
+    return vote_weight(created_at or datetime.now(timezone.utc))
+
 
 class UserFavourites(Base):
     __tablename__ = "user_favourites"
@@ -42,6 +73,12 @@ class UserFavourites(Base):
     user = relationship("User", back_populates="favourites")
     game = relationship("Game", back_populates="favourited_by")
 
+    __table_args__ = (
+        Index("ix_user_favourites_user_created_at", "user_id", "created_at", "game_id"),
+        # Favourites cast since a watermark, see src/services/upvote_counts.py
+        Index("ix_user_favourites_created_at", "created_at", "game_id"),
+    )
+
 
 class Game(Base):
     __tablename__ = "games"
@@ -55,6 +92,9 @@ class Game(Base):
     min_players = Column(Integer, nullable=False)
     max_players = Column(Integer, nullable=False)
     duration = Column(String, nullable=False)
+    # Derived from duration by Game.set_duration_minutes, for range filtering
+    duration_min_minutes = Column(Integer, nullable=True)
+    duration_max_minutes = Column(Integer, nullable=True)
     objective = Column(String, nullable=False)
     setup = Column(String, nullable=False)
     rules = Column(String, nullable=False)
@@ -63,10 +103,15 @@ class Game(Base):
     is_whats_that_game_verified = Column(Boolean, nullable=False, default=False)
 
     upvotes = Column(Integer, nullable=False, default=0)
+    # Time-decayed vote count in log space, see src/utils/trending.py
+    trending_score = Column(Float, nullable=False, default=_initial_trending_score)
+    # When a vote last changed upvotes/trending_score, so counter reconciliation can run incrementally
+    votes_changed_at = Column(DateTime, nullable=True)
     difficulty = Column(String, nullable=True)
 
     contributor_id = Column(String, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    last_updated = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
     # relationships
     equipment_items = relationship("GameEquipment", cascade="all, delete-orphan")
@@ -74,16 +119,73 @@ class Game(Base):
     contributor = relationship("User", back_populates="games")
     favourited_by = relationship("UserFavourites", back_populates="game", lazy="noload")
 
+    __table_args__ = (
+        # Keyset pagination orderings, see GAME_SORT_KEYS in src/api/games.py
+        Index("ix_games_public_created_at", "is_public", "created_at", "id"),
+        Index("ix_games_public_upvotes", "is_public", "upvotes", "id"),
+        Index("ix_games_public_trending", "is_public", "trending_score", "id"),
+        Index("ix_games_contributor_created_at", "contributor_id", "created_at", "id"),
+        # players=N filter, see player_count_contains in src/api/games.py; id makes the B-tree covering
+        # for the id subqueries, since a range on min_players alone still matches much of the catalog
+        Index("ix_games_public_players", "is_public", "min_players", "max_players", "id"),
+        Index("ix_games_player_range", player_range(min_players, max_players),
+              postgresql_using="gist").ddl_if(dialect="postgresql"),
+        # Duration range filters, see apply_game_filters in src/api/games.py
+        Index("ix_games_public_duration_max", "is_public", "duration_max_minutes"),
+        Index("ix_games_public_duration_min", "is_public", "duration_min_minutes"),
+        # Incremental export order, see export_games in src/api/games.py
+        Index("ix_games_public_last_updated", "is_public", "last_updated", "id"),
+        # Latest change of any game, see src/services/catalog_version.py
+        Index("ix_games_last_updated", "last_updated"),
+        # Incremental counter reconciliation, see src/services/upvote_counts.py
+        Index("ix_games_votes_changed_at", "votes_changed_at"),
+        # Must match the expression built by game_search_vector(), otherwise Postgres won't use it
+        Index("ix_games_search_vector", _search_vector(name, description, objective, rules),
+              postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+    @validates("duration")
+    def set_duration_minutes(self, _key, duration):
+        self.duration_min_minutes, self.duration_max_minutes = duration_minutes(duration)
+        return duration
+
+
+def game_search_vector():
+    """Weighted tsvector over the searchable text of a game (Postgres only)."""
+    return _search_vector(Game.name, Game.description, Game.objective, Game.rules)
+
+
+class GameNeighbour(Base):
+    """Top co-favourited games per game, rebuilt offline by src/services/recommendations.py."""
+    __tablename__ = "game_neighbours"
+    game_id = Column(String, ForeignKey(GAMES_ID_FK), nullable=False, primary_key=True)
+    neighbour_id = Column(String, ForeignKey(GAMES_ID_FK), nullable=False, primary_key=True)
+    score = Column(Float, nullable=False)
+
+
+class GameTombstone(Base):
+    """A deleted game, so incremental exports can tell mirrors to drop it."""
+    __tablename__ = "game_tombstones"
+    game_id = Column(String, primary_key=True)
+    deleted_at = Column(DateTime, nullable=False, index=True)
+
+
+class JobWatermark(Base):
+    """How far an incremental job has got, e.g. src/services/upvote_counts.py."""
+    __tablename__ = "job_watermarks"
+    job = Column(String, primary_key=True)
+    watermark = Column(DateTime, nullable=False)
+
 
 class GameEquipment(Base):
     __tablename__ = "game_equipment"
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    game_id = Column(String, ForeignKey(GAMES_ID_FK), nullable=False)
+    game_id = Column(String, ForeignKey(GAMES_ID_FK), nullable=False, index=True)
     equipment_name = Column(String, nullable=False)
 
 
 class GameSetting(Base):
     __tablename__ = "game_settings"
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    game_id = Column(String, ForeignKey(GAMES_ID_FK), nullable=False)
+    game_id = Column(String, ForeignKey(GAMES_ID_FK), nullable=False, index=True)
     setting_name = Column(String, nullable=False)
@@ -1,12 +1,50 @@
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 
-from src.api import users, games, auth, favourites, metadata, optimisation
-from src.db.database import engine, Base
+from src.api import users, games, auth, favourites, metadata, optimisation, admin, recommendations
+from src.db.database import SessionLocal, engine, Base
+from src.services import votes
+from src.utils import config
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+async def flush_votes_periodically(session_factory=SessionLocal):
+    """
+    Writes buffered upvotes (UPVOTE_BUFFER_ENABLED) once they are due even when no further vote arrives, so
+    none waits much longer than UPVOTE_BUFFER_FLUSH_SECONDS to reach games.
+    """
+    def flush():
+        with session_factory() as db:
+            games.flush_vote_buffer(db)
+
+    while True:
+        await asyncio.sleep(config.UPVOTE_BUFFER_FLUSH_SECONDS)
+        if votes.flush_due():
+            try:
+                await run_in_threadpool(flush)
+            except Exception:
+                # The buffer keeps the votes it failed to write for the next attempt
+                logger.exception("Flushing buffered upvotes failed")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    flusher = asyncio.create_task(flush_votes_periodically())
+    yield
+    flusher.cancel()
+    # Don't leave buffered upvotes behind when the worker stops
+    with SessionLocal() as db:
+        votes.flush_votes(db)
+
+
+app = FastAPI(lifespan=lifespan)
 Base.metadata.create_all(bind=engine)
 
 cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
@@ -22,12 +60,14 @@ app.add_middleware(
 )
 
 app.include_router(users.router, prefix="/users", tags=["users"])
+app.include_router(recommendations.router, prefix="/users", tags=["users"])
 app.include_router(games.protected_router, prefix="/games", tags=["games"])
 app.include_router(games.public_router, prefix="/games", tags=["games"])
 app.include_router(auth.router, prefix="", tags=["auth", "oauth"])
 app.include_router(favourites.router, prefix="/favourites", tags=["favourites"])
 app.include_router(metadata.router, prefix="/metadata", tags=["metadata"])
 app.include_router(optimisation.router, prefix="/optimise", tags=["optimisation"])
+app.include_router(admin.router, prefix="/admin", tags=["admin"])
 
 
 @app.get("/")
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class JobResult(BaseModel):
+    job: str
+    rows: int = Field(..., description="Rows the job wrote")
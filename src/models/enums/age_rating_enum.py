@@ -7,4 +7,15 @@ class AgeRatingEnum(str, Enum):
     age_7 = "7+"
     age_12 = "12+"
     age_16 = "16+"
-    age_18 = "18+"
\ No newline at end of file
+    age_18 = "18+"
+
+
+# Youngest age each rating is suitable for
+AGE_RATING_MIN_AGE = {
+    AgeRatingEnum.all_ages: 0,
+    AgeRatingEnum.age_3: 3,
+    AgeRatingEnum.age_7: 7,
+    AgeRatingEnum.age_12: 12,
+    AgeRatingEnum.age_16: 16,
+    AgeRatingEnum.age_18: 18,
+}
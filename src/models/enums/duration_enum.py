@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Optional, Tuple
 
 
 class DurationEnum(str, Enum):
@@ -11,3 +12,25 @@ class DurationEnum(str, Enum):
     one_to_two_hours = "1-2 hours"
     two_to_three_hours = "2-3 hours"
     over_three_hours = "Over 3 hours"
+
+
+# (min, max) minutes of each duration; None where the range is open
+DURATION_MINUTES = {
+    DurationEnum.under_5_min: (0, 5),
+    DurationEnum.five_to_10_min: (5, 10),
+    DurationEnum.ten_to_15_min: (10, 15),
+    DurationEnum.fifteen_to_30_min: (15, 30),
+    DurationEnum.thirty_to_45_min: (30, 45),
+    DurationEnum.forty_five_to_60_min: (45, 60),
+    DurationEnum.one_to_two_hours: (60, 120),
+    DurationEnum.two_to_three_hours: (120, 180),
+    DurationEnum.over_three_hours: (180, None),
+}
+
+
+def duration_minutes(duration: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """The minute range of a stored duration string; (None, None) for anything that isn't a DurationEnum value."""
+    try:
+        return DURATION_MINUTES[DurationEnum(duration)]
+    except ValueError:
+        return None, None
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class GameSortEnum(str, Enum):
+    newest = "newest"
+    top = "top"
+    trending = "trending"
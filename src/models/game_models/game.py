@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.models.enums.age_rating_enum import AgeRatingEnum
 from src.models.enums.game_difficulty_enum import GameDifficultyEnum
@@ -37,16 +37,30 @@ class GameRead(GameBase):
     upvotes: int
     contributor: UserPublicRead
     created_at: datetime
+    # Whether the signed-in user has favourited the game; null for anonymous requests
+    is_favourited: Optional[bool] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class GameExport(GameRead):
+    last_updated: datetime
+
+
+class GameExportRemoval(BaseModel):
+    """In a since= export, a game deleted or made private since: mirrors should drop it."""
+    id: str
+    deleted: bool = True
+    last_updated: datetime
+
+
 class GameUpdate(BaseModel):
     name: Optional[str] = None
     game_type: Optional[GameTypeEnum] = None
     age_rating: Optional[AgeRatingEnum] = None
-    min_players: Optional[int] = None
-    max_players: Optional[int] = None
+    # The bounds of PlayerCount, which every stored game must still satisfy to be read back
+    min_players: Optional[int] = Field(None, gt=1, lt=100)
+    max_players: Optional[int] = Field(None, gt=1, lt=100)
     duration: Optional[str] = None
     difficulty: Optional[GameDifficultyEnum] = None
     equipment: Optional[List[str]] = None
@@ -56,6 +70,12 @@ class GameUpdate(BaseModel):
     rules: Optional[str] = None
     game_setting: Optional[List[str]] = None
 
+    @model_validator(mode="after")
+    def check_player_range(self):
+        if self.min_players is not None and self.max_players is not None and self.min_players > self.max_players:
+            raise ValueError("min_players must not exceed max_players")
+        return self
+
 
 class GameUpdateAdmin(GameUpdate):
     is_whats_that_game_certified: Optional[bool] = None
@@ -0,0 +1,15 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class GameBulkItemResult(BaseModel):
+    index: int
+    id: Optional[str] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+class GameBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[GameBulkItemResult]
@@ -0,0 +1,13 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class GameFacets(BaseModel):
+    total: int
+    game_types: Dict[str, int]
+    age_ratings: Dict[str, int]
+    game_equipment: Dict[str, int]
+    game_settings: Dict[str, int]
+    durations: Dict[str, int]
+    difficulty: Dict[str, int]
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.models.enums.age_rating_enum import AgeRatingEnum
+from src.models.enums.game_difficulty_enum import GameDifficultyEnum
+from src.models.enums.game_type_enum import GameTypeEnum
+
+
+class GameFilters(BaseModel):
+    """Catalog filters shared by the public game listing endpoints, read from the query string."""
+    q: Optional[str] = None
+    name: Optional[str] = None
+    game_type: Optional[GameTypeEnum] = None
+    age_rating: Optional[AgeRatingEnum] = None
+    min_players: Optional[int] = None
+    max_players: Optional[int] = None
+    players: Optional[int] = None
+    duration: Optional[str] = None
+    min_duration: Optional[int] = None
+    max_duration: Optional[int] = None
+    difficulty: Optional[GameDifficultyEnum] = None
+    setting: Optional[str] = None
+    equipment: Optional[str] = None
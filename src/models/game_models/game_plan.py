@@ -0,0 +1,25 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.models.enums.equipment_enum import GameEquipmentEnum
+from src.models.enums.game_difficulty_enum import GameDifficultyEnum
+from src.models.enums.game_setting_enum import GameSettingEnum
+from src.models.game_models.game import GameRead
+
+
+class GamePlanRequest(BaseModel):
+    players: int = Field(..., gt=0, description="How many people are playing")
+    time_available_minutes: int = Field(..., gt=0, description="Total time for the evening")
+    equipment: List[GameEquipmentEnum] = Field(default_factory=list, description="Equipment on hand")
+    setting: Optional[GameSettingEnum] = None
+    youngest_age: Optional[int] = Field(None, ge=0, description="Age of the youngest player")
+    max_difficulty: Optional[GameDifficultyEnum] = None
+    limit: int = Field(10, gt=0, le=50, description="Most games to suggest and to schedule")
+
+
+class GamePlan(BaseModel):
+    games: List[GameRead] = Field(..., description="The best games that fit the group, at most limit, best first")
+    schedule: List[GameRead] = Field(..., description="Best games that can be played back to back in the time")
+    schedule_minutes: int = Field(..., description="Longest the schedule can take, from the duration upper bounds; "
+                                                  "a game with no upper bound takes the rest of the time")
@@ -0,0 +1,18 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class FavouriteBulkRequest(BaseModel):
+    add: List[str] = []
+    remove: List[str] = []
+
+
+class FavouriteSyncRequest(BaseModel):
+    game_ids: List[str]
+
+
+class FavouriteBulkResponse(BaseModel):
+    added: int
+    removed: int
+    not_found: List[str]
@@ -0,0 +1,38 @@
+# src/services/auth_cache.py
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.db.tables import User
+from src.utils.cache import TTLCache
+from src.utils.config import AUTH_CACHE_SIZE, AUTH_CACHE_TTL_SECONDS
+
+# Everything but the password hash, which loads on first access for the few endpoints that check it
+_CACHED_COLUMNS = [attr.key for attr in User.__mapper__.column_attrs if attr.key != "hashed_password"]
+
+# Token sub (lower-cased username) -> the user's column values
+auth_cache = TTLCache(maxsize=AUTH_CACHE_SIZE, ttl_seconds=AUTH_CACHE_TTL_SECONDS)
+
+
+def get_cached_user(db: Session, username: str) -> Optional[User]:
+    """The cached user as a User in db's session, built without a SELECT, or None on a miss."""
+    columns = auth_cache.get(username.lower())
+    if columns is None:
+        return None
+    user = User(**columns)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def cache_user(user: User) -> None:
+    auth_cache.set(user.username.lower(), {key: getattr(user, key) for key in _CACHED_COLUMNS})
+
+
+def invalidate_user(username: str) -> None:
+    auth_cache.invalidate(username.lower())
+
+
+def clear_auth_cache() -> None:
+    auth_cache.clear()
@@ -0,0 +1,565 @@
+# src/services/catalog_snapshot.py
+from __future__ import annotations
+
+import math
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.db.tables import Game, GameEquipment, GameSetting, GameTombstone
+from src.models.enums.age_rating_enum import AGE_RATING_MIN_AGE
+from src.models.enums.duration_enum import duration_minutes
+from src.models.enums.equipment_enum import GameEquipmentEnum
+from src.models.enums.game_difficulty_enum import GameDifficultyEnum
+from src.models.enums.game_sort_enum import GameSortEnum
+from src.models.game_models.game import GameRead
+from src.models.game_models.game_filters import GameFilters
+from src.models.game_models.game_plan import GamePlanRequest
+from src.services.catalog_version import SYNC_OVERLAP, get_catalog_version, utc_now
+from src.utils.pagination import encode_cursor
+
+_EPOCH = datetime(1970, 1, 1)
+# Player counts and duration bounds become similarity features in [0, 1], so none outweighs a shared category
+_PLAYERS_SCALE = 20.0
+_MINUTES_SCALE = 180.0
+# Listed by games that need no equipment at all
+_NO_EQUIPMENT = (GameEquipmentEnum.none.value, GameEquipmentEnum.nothing.value)
+_STRING = np.dtypes.StringDType()
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _permutation(draws: random.Random, size: int) -> Tuple[int, int]:
+    """Parameters of the affine permutation i -> (multiplier * i + offset) % size; multiplier is coprime."""
+    multiplier = draws.randrange(size) or 1
+    while math.gcd(multiplier, size) != 1:
+        multiplier += 1
+    return multiplier, draws.randrange(size)
+
+
+def shuffled_position(seed: Optional[int], step: int, size: int) -> int:
+    """
+    The position in range(size) that step of seed's permutation lands on, as CatalogSnapshot.random_game walks
+    it; a uniformly random position without a seed.
+    """
+    draws = random.Random(seed)
+    multiplier, offset = _permutation(draws, size)
+    if seed is None:
+        return draws.randrange(size)
+    return (multiplier * step + offset) % size
+
+
+class Vocabulary:
+    """Maps the distinct values of a column to small integer codes, in first-seen order."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def code(self, value: str) -> int:
+        if value not in self.codes:
+            self.codes[value] = len(self.values)
+            self.values.append(value)
+        return self.codes[value]
+
+    def matching(self, needle: str) -> List[int]:
+        """Codes whose value contains needle, case-insensitively (the in-memory icontains(needle, autoescape=True))."""
+        needle = needle.lower()
+        return [code for code, value in enumerate(self.values) if needle in value.lower()]
+
+
+class CatalogSnapshot:
+    """
+    All public games held as parallel arrays: player counts as ints, type/age/difficulty/duration as
+    vocabulary codes and equipment/settings as one bit per distinct value. Answers the GET /games
+    filters with vectorised masks and hands back the ids of the page, leaving the rows to the database.
+
+    The game write endpoints update it row by row. It is built from the database when first used, and
+    refreshed from it whenever the catalog version moves, which picks up writes made by other processes.
+    """
+
+    _COLUMNS = ("ids", "names", "alive", "min_players", "max_players", "game_type", "age_rating", "difficulty",
+                "duration", "duration_min", "duration_max", "created_at", "upvotes", "trending",
+                "equipment_bits", "setting_bits")
+    # Columns whose empty rows aren't zero; NaN compares false like SQL NULL does
+    _FILL = {"difficulty": -1, "duration_min": np.nan, "duration_max": np.nan}
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.RLock()
+        self.is_built = False
+        self.version: Optional[str] = None  # catalog version last synced with
+        self._synced_at: Optional[datetime] = None
+        self._size = 0
+        self._live = 0
+        self._row_of: Dict[str, int] = {}
+        self._orders: Dict[GameSortEnum, Tuple[np.ndarray, np.ndarray]] = {}
+
+        self.game_types = Vocabulary()
+        self.age_ratings = Vocabulary()
+        self.difficulties = Vocabulary()
+        self.durations = Vocabulary()
+        self.equipment = Vocabulary()
+        self.settings = Vocabulary()
+
+        self.ids = np.empty(capacity, dtype=_STRING)
+        self.names = np.empty(capacity, dtype=_STRING)  # lower-cased for substring matching
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.min_players = np.zeros(capacity, dtype=np.int32)
+        self.max_players = np.zeros(capacity, dtype=np.int32)
+        self.game_type = np.zeros(capacity, dtype=np.int16)
+        self.age_rating = np.zeros(capacity, dtype=np.int16)
+        self.difficulty = np.full(capacity, -1, dtype=np.int16)
+        self.duration = np.zeros(capacity, dtype=np.int16)
+        self.duration_min = np.full(capacity, np.nan, dtype=np.float32)
+        self.duration_max = np.full(capacity, np.nan, dtype=np.float32)
+        self.created_at = np.zeros(capacity, dtype=np.int64)  # microseconds since the epoch
+        self.upvotes = np.zeros(capacity, dtype=np.int32)
+        self.trending = np.zeros(capacity, dtype=np.float64)
+        self.equipment_bits = np.zeros((capacity, 1), dtype=np.uint64)
+        self.setting_bits = np.zeros((capacity, 1), dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return self._live
+
+    # --- maintenance -------------------------------------------------------------------------------
+
+    def build(self, db: Session, version: Optional[str] = None) -> None:
+        with self._lock:
+            if self.is_built:
+                return
+            self._synced_at = utc_now()
+            self._load(db)
+            self.version = version
+            self.is_built = True
+
+    def refresh(self, db: Session, version: str) -> None:
+        """
+        Catches up with writes this process didn't make (other workers, jobs run outside the API): games whose
+        last_updated moved since the last sync are reloaded or dropped, and deleted games dropped.
+        """
+        with self._lock:
+            if not self.is_built or version == self.version:
+                return
+            since, self._synced_at = self._synced_at - SYNC_OVERLAP, utc_now()
+            self._load(db, since)
+            for game_id, in db.query(GameTombstone.game_id).filter(GameTombstone.deleted_at >= since):
+                self._remove(game_id)
+            self.version = version
+
+    def _load(self, db: Session, since: Optional[datetime] = None) -> None:
+        # The whole public catalog, or every game changed since `since` whatever its visibility
+        changed = Game.last_updated >= since if since else Game.is_public == True
+
+        equipment: Dict[str, List[str]] = {}
+        for game_id, name in (db.query(GameEquipment.game_id, GameEquipment.equipment_name)
+                              .join(Game, Game.id == GameEquipment.game_id)
+                              .filter(changed, Game.is_public == True)
+                              .yield_per(5000)):
+            equipment.setdefault(game_id, []).append(name)
+
+        settings: Dict[str, List[str]] = {}
+        for game_id, name in (db.query(GameSetting.game_id, GameSetting.setting_name)
+                              .join(Game, Game.id == GameSetting.game_id)
+                              .filter(changed, Game.is_public == True)
+                              .yield_per(5000)):
+            settings.setdefault(game_id, []).append(name)
+
+        rows = (db.query(Game.id, Game.is_public, Game.name, Game.game_type, Game.age_rating, Game.difficulty,
+                         Game.duration, Game.duration_min_minutes, Game.duration_max_minutes, Game.min_players,
+                         Game.max_players, Game.created_at, Game.upvotes, Game.trending_score)
+                .filter(changed)
+                .yield_per(5000))
+        for row in rows:
+            if row.is_public:
+                self._set_row(row, equipment.get(row.id, ()), settings.get(row.id, ()))
+            else:
+                self._remove(row.id)
+
+    def upsert_game(self, db_game: Game) -> None:
+        """Mirrors a game after a write: public games are (re)loaded, anything else is dropped."""
+        with self._lock:
+            if not self.is_built:
+                return
+            if not db_game.is_public:
+                self._remove(db_game.id)
+                return
+            self._set_row(db_game,
+                          [item.equipment_name for item in db_game.equipment_items],
+                          [item.setting_name for item in db_game.setting_items])
+
+    def remove_game(self, game_id: str) -> None:
+        with self._lock:
+            if self.is_built:
+                self._remove(game_id)
+
+    def set_votes(self, game_id: str, upvotes: int, trending_score: float) -> None:
+        with self._lock:
+            row = self._row_of.get(game_id)
+            if row is not None:
+                self.upvotes[row] = upvotes
+                self.trending[row] = trending_score
+                self._orders.pop(GameSortEnum.top, None)
+                self._orders.pop(GameSortEnum.trending, None)
+
+    def _set_row(self, game, equipment: Sequence[str], settings: Sequence[str]) -> None:
+        row = self._row_of.get(game.id)
+        if row is None:
+            if self._size == len(self.ids):
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._live += 1
+            self._row_of[game.id] = row
+
+        self.ids[row] = game.id
+        self.names[row] = game.name.lower()
+        self.alive[row] = True
+        self.min_players[row] = game.min_players
+        self.max_players[row] = game.max_players
+        self.game_type[row] = self.game_types.code(game.game_type)
+        self.age_rating[row] = self.age_ratings.code(game.age_rating)
+        self.difficulty[row] = self.difficulties.code(game.difficulty) if game.difficulty else -1
+        self.duration[row] = self.durations.code(game.duration)
+        self.duration_min[row] = np.nan if game.duration_min_minutes is None else game.duration_min_minutes
+        self.duration_max[row] = np.nan if game.duration_max_minutes is None else game.duration_max_minutes
+        self.created_at[row] = _to_micros(game.created_at)
+        self.upvotes[row] = game.upvotes or 0
+        self.trending[row] = game.trending_score or 0.0
+        self.equipment_bits = self._set_bits(self.equipment_bits, row, self.equipment, equipment)
+        self.setting_bits = self._set_bits(self.setting_bits, row, self.settings, settings)
+        self._orders.clear()
+
+    @staticmethod
+    def _set_bits(bits: np.ndarray, row: int, vocabulary: Vocabulary, values: Sequence[str]) -> np.ndarray:
+        codes = [vocabulary.code(value) for value in values]
+        words_needed = len(vocabulary.values) // 64 + 1
+        if words_needed > bits.shape[1]:
+            bits = np.hstack([bits, np.zeros((bits.shape[0], words_needed - bits.shape[1]), dtype=np.uint64)])
+        bits[row] = 0
+        for code in codes:
+            bits[row, code // 64] |= np.uint64(1 << (code % 64))
+        return bits
+
+    def _remove(self, game_id: str) -> None:
+        row = self._row_of.pop(game_id, None)
+        if row is None:
+            return
+        self.alive[row] = False
+        self._live -= 1
+        self._orders.clear()
+        if self._size - self._live > max(self._live, 1024):
+            self._compact()
+
+    def _compact(self) -> None:
+        rows = np.flatnonzero(self.alive[:self._size])
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            column[:len(rows)] = column[rows]
+        self.alive[len(rows):] = False
+        self._size = len(rows)
+        self._row_of = {str(game_id): row for row, game_id in enumerate(self.ids[:self._size])}
+
+    def _grow(self) -> None:
+        capacity = max(len(self.ids) * 2, 1024)
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            if name in self._FILL:
+                grown[:] = self._FILL[name]
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+    # --- queries -----------------------------------------------------------------------------------
+
+    def mask(self, filters: GameFilters) -> np.ndarray:
+        """
+        Rows matching filters, with the same semantics as apply_game_filters (q is not supported). Text filters
+        fold case with str.lower(), as PostgreSQL's lower() does; SQLite's only folds ASCII letters, so there a
+        name like "Élan" can match "élan" here but not in SQL.
+        """
+        n = self._size
+        mask = self.alive[:n].copy()
+
+        if filters.name:
+            mask &= np.strings.find(self.names[:n], filters.name.lower()) >= 0
+        if filters.game_type:
+            mask &= self._code_mask(self.game_type[:n], self.game_types, filters.game_type.value)
+        if filters.age_rating:
+            mask &= self._code_mask(self.age_rating[:n], self.age_ratings, filters.age_rating.value)
+        if filters.min_players:
+            mask &= self.min_players[:n] >= filters.min_players
+        if filters.max_players:
+            mask &= self.max_players[:n] <= filters.max_players
+        if filters.players is not None:
+            mask &= (self.min_players[:n] <= filters.players) & (self.max_players[:n] >= filters.players)
+        if filters.duration:
+            mask &= np.isin(self.duration[:n], self.durations.matching(filters.duration))
+        if filters.min_duration is not None:
+            mask &= self.duration_min[:n] >= filters.min_duration
+        if filters.max_duration is not None:
+            mask &= self.duration_max[:n] <= filters.max_duration
+        if filters.difficulty:
+            mask &= self._code_mask(self.difficulty[:n], self.difficulties, filters.difficulty.value)
+        if filters.setting:
+            mask &= self._any_bit(self.setting_bits[:n], self.settings.matching(filters.setting))
+        if filters.equipment:
+            mask &= self._any_bit(self.equipment_bits[:n], self.equipment.matching(filters.equipment))
+
+        return mask
+
+    def page(
+            self,
+            filters: GameFilters,
+            sort: GameSortEnum,
+            cursor_values: Optional[Sequence] = None,
+            limit: int = 20,
+            offset: int = 0,
+    ) -> Tuple[List[str], Optional[str]]:
+        """Ids of one page in the same order, and with the same cursors, as the SQL listing."""
+        with self._lock:
+            mask = self.mask(filters)
+            order, rank = self._order(sort)
+            keys = self._sort_key(sort)
+
+            if cursor_values:
+                value, cursor_id = cursor_values
+                value = self._cursor_key(sort, value)
+                cursor_row = self._row_of.get(cursor_id)
+                if cursor_row is not None and keys[cursor_row] == value:
+                    mask &= rank > rank[cursor_row]
+                else:
+                    n = self._size
+                    mask &= (keys[:n] < value) | ((keys[:n] == value) & (self.ids[:n] < cursor_id))
+
+            selected = order[mask[order]]
+            if not cursor_values and offset:
+                selected = selected[offset:]
+
+            page_rows = selected[:limit + 1]
+            ids = [str(game_id) for game_id in self.ids[page_rows[:limit]]]
+            if len(page_rows) <= limit:
+                return ids, None
+
+            last = page_rows[limit - 1]
+            if sort == GameSortEnum.top:
+                key = int(self.upvotes[last])
+            elif sort == GameSortEnum.trending:
+                key = float(self.trending[last])
+            else:
+                key = _EPOCH + timedelta(microseconds=int(self.created_at[last]))
+            return ids, encode_cursor(sort.value, [key, ids[-1]])
+
+    def random_game(
+            self,
+            filters: GameFilters,
+            seed: Optional[int] = None,
+            step: int = 0,
+            within: Optional[Sequence[str]] = None,
+    ) -> Tuple[Optional[str], int]:
+        """
+        A uniformly random game matching filters (and among the ids in within, if given), or None, with the
+        step it was drawn at. With a seed, step indexes a seeded permutation of the candidates, so walking
+        step upwards visits every candidate once before any repeats. Unfiltered draws pick row slots directly
+        and skip removed ones, which compaction keeps rare, so they don't scan the catalog.
+        """
+        with self._lock:
+            if not self._live:
+                return None, step
+
+            if within is None and not filters.model_dump(exclude_none=True):
+                rows = None
+                size = self._size
+            else:
+                mask = self.mask(filters)
+                if within is not None:
+                    listed = np.zeros(self._size, dtype=bool)
+                    listed[[self._row_of[game_id] for game_id in within if game_id in self._row_of]] = True
+                    mask &= listed
+                rows = np.flatnonzero(mask)
+                size = len(rows)
+                if not size:
+                    return None, step
+
+            draws = random.Random(seed)
+            multiplier, offset = _permutation(draws, size)
+            for _ in range(size):
+                position = (multiplier * step + offset) % size if seed is not None else draws.randrange(size)
+                row = position if rows is None else rows[position]
+                if self.alive[row]:
+                    return str(self.ids[row]), step
+                step += 1
+            # A seeded walk has been through every slot by now; random picks may just have kept missing
+            live = np.flatnonzero(self.alive[:self._size])
+            return str(self.ids[draws.choice(live)]), step
+
+    def plan(self, plan: GamePlanRequest) -> List[Tuple[str, int, Optional[int]]]:
+        """
+        (id, shortest, longest duration in minutes) of every game the group in plan can play, in sort=top order.
+        Open-ended durations have no longest and fit when their shortest does. Equipment is a subset test on
+        the bitsets: a game matches when it needs nothing the group lacks.
+        """
+        with self._lock:
+            n = self._size
+            mask = self.alive[:n].copy()
+            mask &= (self.min_players[:n] <= plan.players) & (self.max_players[:n] >= plan.players)
+            longest = self.duration_max[:n]
+            mask &= np.where(np.isnan(longest), self.duration_min[:n], longest) <= plan.time_available_minutes
+
+            owned = [self.equipment.codes[value] for value in
+                     [item.value for item in plan.equipment] + list(_NO_EQUIPMENT) if value in self.equipment.codes]
+            missing = ~self._bits(self.equipment_bits.shape[1], owned)
+            mask &= ~(self.equipment_bits[:n] & missing).any(axis=1)
+
+            if plan.setting:
+                setting = self.settings.codes.get(plan.setting.value)
+                mask &= self._any_bit(self.setting_bits[:n], [] if setting is None else [setting])
+            if plan.youngest_age is not None:
+                allowed = [self.age_ratings.codes[rating.value] for rating, age in AGE_RATING_MIN_AGE.items()
+                           if age <= plan.youngest_age and rating.value in self.age_ratings.codes]
+                mask &= np.isin(self.age_rating[:n], allowed)
+            if plan.max_difficulty:
+                levels = list(GameDifficultyEnum)
+                allowed = [self.difficulties.codes[level.value]
+                           for level in levels[:levels.index(plan.max_difficulty) + 1]
+                           if level.value in self.difficulties.codes]
+                mask &= np.isin(self.difficulty[:n], allowed + [-1])
+
+            order, _ = self._order(GameSortEnum.top)
+            rows = order[mask[order]]
+            return [(str(game_id), int(shortest), None if np.isnan(longest) else int(longest))
+                    for game_id, shortest, longest in zip(self.ids[rows], self.duration_min[rows],
+                                                          self.duration_max[rows])]
+
+    def similar(self, game: GameRead, limit: int = 10) -> List[str]:
+        """
+        Ids of the public games most like game by cosine similarity, most similar first. Each game is a
+        vector of one-hot type/age rating/difficulty, its equipment and setting sets, and its scaled player
+        counts and duration bounds; the categorical part of the dot products is a popcount of the bitsets.
+        """
+        with self._lock:
+            n = self._size
+            equipment = self._bits(self.equipment_bits.shape[1],
+                                   [self.equipment.codes[v] for v in game.equipment if v in self.equipment.codes])
+            settings = self._bits(self.setting_bits.shape[1],
+                                  [self.settings.codes[v] for v in game.game_setting or [] if v in self.settings.codes])
+            dot = (np.bitwise_count(self.equipment_bits[:n] & equipment).sum(axis=1)
+                   + np.bitwise_count(self.setting_bits[:n] & settings).sum(axis=1)).astype(np.float32)
+            for codes, vocabulary, value in ((self.game_type, self.game_types, game.game_type),
+                                             (self.age_rating, self.age_ratings, game.age_rating),
+                                             (self.difficulty, self.difficulties, game.difficulty)):
+                if value is not None and value.value in vocabulary.codes:
+                    dot += codes[:n] == vocabulary.codes[value.value]
+
+            features = self._numeric_features(n)
+            reference = np.minimum(np.nan_to_num(np.array([
+                game.player_count.min_players / _PLAYERS_SCALE, game.player_count.max_players / _PLAYERS_SCALE,
+                *(np.nan if m is None else m / _MINUTES_SCALE for m in duration_minutes(game.duration)),
+            ], dtype=np.float32)), 1.0)
+            dot += features @ reference
+
+            ones = (np.bitwise_count(self.equipment_bits[:n]).sum(axis=1)
+                    + np.bitwise_count(self.setting_bits[:n]).sum(axis=1) + 2 + (self.difficulty[:n] >= 0))
+            norms = np.sqrt(ones + (features ** 2).sum(axis=1))
+            reference_norm = np.sqrt(len(game.equipment) + len(game.game_setting or []) + 2
+                                     + (game.difficulty is not None) + (reference ** 2).sum())
+            scores = np.where(self.alive[:n], dot / (norms * reference_norm), -1.0)
+
+            row = self._row_of.get(game.id)
+            if row is not None:
+                scores[row] = -1.0
+
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > limit:
+                candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+            # Ties go to the more upvoted game, as in sort=top
+            ranked = candidates[np.lexsort((-self.upvotes[candidates], -scores[candidates]))]
+            return [str(game_id) for game_id in self.ids[ranked]]
+
+    def _numeric_features(self, n: int) -> np.ndarray:
+        return np.minimum(np.nan_to_num(np.column_stack([
+            self.min_players[:n] / _PLAYERS_SCALE, self.max_players[:n] / _PLAYERS_SCALE,
+            self.duration_min[:n] / _MINUTES_SCALE, self.duration_max[:n] / _MINUTES_SCALE,
+        ]).astype(np.float32)), 1.0)
+
+    def _sort_key(self, sort: GameSortEnum) -> np.ndarray:
+        if sort == GameSortEnum.top:
+            return self.upvotes
+        if sort == GameSortEnum.trending:
+            return self.trending
+        return self.created_at
+
+    @staticmethod
+    def _cursor_key(sort: GameSortEnum, value):
+        """A decoded cursor value in the units of _sort_key(sort)."""
+        if isinstance(value, datetime):
+            return _to_micros(value)
+        return float(value) if sort == GameSortEnum.trending else int(value)
+
+    def _order(self, sort: GameSortEnum) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows sorted by (key, id) descending and each row's position in that order, cached until a write."""
+        if sort not in self._orders:
+            n = self._size
+            order = np.lexsort((self.ids[:n], self._sort_key(sort)[:n]))[::-1]
+            rank = np.empty(n, dtype=np.int64)
+            rank[order] = np.arange(n)
+            self._orders[sort] = (order, rank)
+        return self._orders[sort]
+
+    @staticmethod
+    def _code_mask(codes: np.ndarray, vocabulary: Vocabulary, value: str) -> np.ndarray:
+        code = vocabulary.codes.get(value)
+        if code is None:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == code
+
+    @staticmethod
+    def _bits(words: int, codes: List[int]) -> np.ndarray:
+        bits = np.zeros(words, dtype=np.uint64)
+        for code in codes:
+            bits[code // 64] |= np.uint64(1 << (code % 64))
+        return bits
+
+    @classmethod
+    def _any_bit(cls, bits: np.ndarray, codes: List[int]) -> np.ndarray:
+        return (bits & cls._bits(bits.shape[1], codes)).any(axis=1)
+
+
+_snapshot = CatalogSnapshot()
+
+
+def get_catalog_snapshot(db: Session) -> CatalogSnapshot:
+    version = get_catalog_version(db)
+    if not _snapshot.is_built:
+        _snapshot.build(db, version)
+    elif version != _snapshot.version:
+        _snapshot.refresh(db, version)
+    return _snapshot
+
+
+def reset_catalog_snapshot() -> None:
+    global _snapshot
+    _snapshot = CatalogSnapshot()
+
+
+def is_snapshot_built() -> bool:
+    return _snapshot.is_built
+
+
+def snapshot_game(db_game: Game) -> None:
+    _snapshot.upsert_game(db_game)
+
+
+def unsnapshot_game(game_id: str) -> None:
+    _snapshot.remove_game(game_id)
+
+
+def snapshot_votes(game_id: str, upvotes: int, trending_score: float) -> None:
+    _snapshot.set_votes(game_id, upvotes, trending_score)
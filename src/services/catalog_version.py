@@ -0,0 +1,67 @@
+# src/services/catalog_version.py
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.db.tables import Game, GameTombstone
+from src.utils import config
+
+# Read from the database so every worker process, and jobs run outside them, agree on it: whatever changes a
+# listing moves games.last_updated (edits, visibility, votes, contributor changes) or adds a game_tombstones row
+_cached: Optional[Tuple[float, str]] = None
+_lock = threading.Lock()
+
+# How far before their last sync in-process copies of the catalog re-read changed games, covering the clocks of
+# other hosts and transactions that commit a while after stamping last_updated
+SYNC_OVERLAP = timedelta(minutes=1)
+
+
+def utc_now() -> datetime:
+    # Naive UTC, as the DateTime columns hand timestamps back
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def bump_catalog_version() -> None:
+    """Called after every write that can change what a catalog listing returns, so this process sees it at once."""
+    global _cached
+    with _lock:
+        _cached = None
+
+
+def get_catalog_version(db: Session) -> str:
+    """
+    The catalog's version, re-read at most every CATALOG_VERSION_TTL_SECONDS unless a local write bumped it.
+
+    Two limits of deriving it from timestamps rather than a counter bumped at commit:
+    - A transaction that commits after a later-stamped one has committed leaves the maximum where it is, so its
+      change doesn't move the version (and ETags built on it) until the next write does. The in-process copies
+      re-read SYNC_OVERLAP before their last sync, which picks such rows up as soon as the version next moves.
+    - Votes move last_updated too, as sort=top and sort=trending depend on them, so every upvote changes the
+      ETag of every listing, whatever its sort or filters.
+    """
+    global _cached
+    with _lock:
+        if _cached is not None and _cached[0] > time.monotonic():
+            return _cached[1]
+
+    last_updated, deleted_at = db.query(
+        func.max(Game.last_updated),
+        select(func.max(GameTombstone.deleted_at)).scalar_subquery(),
+    ).one()
+    version = f"{last_updated.isoformat() if last_updated else ''}/{deleted_at.isoformat() if deleted_at else ''}"
+    with _lock:
+        _cached = (time.monotonic() + config.CATALOG_VERSION_TTL_SECONDS, version)
+    return version
+
+
+def changed_game_ids(db: Session, since: datetime) -> List[str]:
+    """Ids of the games changed (last_updated) or deleted (game_tombstones) since `since`, by any process."""
+    changed = select(Game.id).where(Game.last_updated >= since).union(
+        select(GameTombstone.game_id).where(GameTombstone.deleted_at >= since))
+    return list(db.execute(changed).scalars())
@@ -0,0 +1,76 @@
+# src/services/game_cache.py
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from src.models.game_models.game import GameRead
+from src.services.catalog_version import SYNC_OVERLAP, changed_game_ids, get_catalog_version, utc_now
+from src.utils.cache import TTLCache
+from src.utils.config import GAME_DETAIL_CACHE_SIZE, GAME_DETAIL_CACHE_TTL_SECONDS
+from src.utils.http_cache import make_etag
+
+
+@dataclass(frozen=True)
+class CachedGame:
+    """A serialised game plus what get_game_by_id needs to re-check visibility and answer conditional GETs."""
+    payload: GameRead
+    body: bytes
+    contributor_id: str
+    etag: str
+
+    @property
+    def is_public(self) -> bool:
+        return self.payload.is_public
+
+
+game_detail_cache = TTLCache(maxsize=GAME_DETAIL_CACHE_SIZE, ttl_seconds=GAME_DETAIL_CACHE_TTL_SECONDS)
+
+# The catalog version the cache last caught up with, and when
+_sync_lock = threading.Lock()
+_synced_version: Optional[str] = None
+_synced_at: Optional[datetime] = None
+
+
+def sync_game_cache(db: Session) -> None:
+    """
+    Drops the entries of games changed since the last sync whenever the catalog version moves, so writes made
+    by other processes (which can't invalidate this one's entries) are seen within CATALOG_VERSION_TTL_SECONDS.
+    """
+    global _synced_version, _synced_at
+    version = get_catalog_version(db)
+    if version == _synced_version:
+        return
+    with _sync_lock:
+        if version == _synced_version:
+            return
+        now = utc_now()
+        if _synced_at is not None:
+            for game_id in changed_game_ids(db, _synced_at - SYNC_OVERLAP):
+                game_detail_cache.invalidate(game_id)
+        _synced_version, _synced_at = version, now
+
+
+def get_cached_game(game_id: str) -> Optional[CachedGame]:
+    return game_detail_cache.get(game_id)
+
+
+def cache_game(game_id: str, payload: GameRead, contributor_id: str) -> CachedGame:
+    body = payload.model_dump_json()
+    cached = CachedGame(payload=payload, body=body.encode(), contributor_id=contributor_id, etag=make_etag(body))
+    game_detail_cache.set(game_id, cached)
+    return cached
+
+
+def invalidate_game(game_id: str) -> None:
+    game_detail_cache.invalidate(game_id)
+
+
+def clear_game_cache() -> None:
+    global _synced_version, _synced_at
+    game_detail_cache.clear()
+    _synced_version = _synced_at = None
@@ -0,0 +1,75 @@
+# src/services/recommendations.py
+from __future__ import annotations
+
+from typing import List
+
+from sqlalchemy import and_, delete, func, insert, select
+from sqlalchemy.orm import Session, aliased
+
+from src.db.tables import Game, GameNeighbour, UserFavourites
+
+NEIGHBOURS_PER_GAME = 50
+# Users with more favourites than this say little about any one pair and dominate the self-join
+MAX_FAVOURITES_PER_USER = 500
+
+
+def rebuild_game_neighbours(db: Session, top_n: int = NEIGHBOURS_PER_GAME) -> int:
+    """
+    Replaces game_neighbours with the top_n most co-favourited games of every game, scored by Jaccard
+    similarity of the sets of users who favourited them. The co-occurrence counts are the sparse product
+    FᵀF of the user x game favourites matrix, computed as a self-join in the database, so no favourite
+    rows are loaded into Python. Readers keep seeing the previous neighbours until the commit.
+    """
+    counted_users = (select(UserFavourites.user_id)
+                     .group_by(UserFavourites.user_id)
+                     .having(func.count() <= MAX_FAVOURITES_PER_USER))
+    favourites = (select(UserFavourites.user_id, UserFavourites.game_id)
+                  .where(UserFavourites.user_id.in_(counted_users))
+                  .subquery())
+
+    degrees = (select(favourites.c.game_id, func.count().label("users"))
+               .group_by(favourites.c.game_id)
+               .subquery())
+
+    first, second = aliased(favourites), aliased(favourites)
+    together = (select(first.c.game_id, second.c.game_id.label("neighbour_id"), func.count().label("users"))
+                .join(second, and_(first.c.user_id == second.c.user_id, first.c.game_id != second.c.game_id))
+                .group_by(first.c.game_id, second.c.game_id)
+                .subquery())
+
+    game_degree, neighbour_degree = aliased(degrees), aliased(degrees)
+    score = (together.c.users * 1.0 / (game_degree.c.users + neighbour_degree.c.users - together.c.users))
+    ranked = (select(together.c.game_id, together.c.neighbour_id, score.label("score"),
+                     func.row_number().over(partition_by=together.c.game_id,
+                                            order_by=(score.desc(), together.c.neighbour_id)).label("rank"))
+              .join(game_degree, game_degree.c.game_id == together.c.game_id)
+              .join(neighbour_degree, neighbour_degree.c.game_id == together.c.neighbour_id)
+              .subquery())
+
+    db.execute(delete(GameNeighbour))
+    result = db.execute(insert(GameNeighbour).from_select(
+        ["game_id", "neighbour_id", "score"],
+        select(ranked.c.game_id, ranked.c.neighbour_id, ranked.c.score).where(ranked.c.rank <= top_n),
+    ))
+    db.commit()
+    return result.rowcount
+
+
+def recommended_game_ids(db: Session, user_id: str, limit: int = 20) -> List[str]:
+    """
+    Public games the user hasn't favourited, ranked by the summed neighbour scores of their favourites.
+    Reads only the neighbour lists of those favourites, through the game_neighbours primary key.
+    """
+    favourite_ids = select(UserFavourites.game_id).where(UserFavourites.user_id == user_id)
+    # Aggregate from the user's few neighbour lists first, so the join to games can't drive the plan
+    scores = (select(GameNeighbour.neighbour_id, func.sum(GameNeighbour.score).label("score"))
+              .where(GameNeighbour.game_id.in_(favourite_ids), GameNeighbour.neighbour_id.not_in(favourite_ids))
+              .group_by(GameNeighbour.neighbour_id)
+              .subquery())
+    rows = (db.query(scores.c.neighbour_id)
+            .join(Game, Game.id == scores.c.neighbour_id)
+            .filter(Game.is_public == True)
+            .order_by(scores.c.score.desc(), scores.c.neighbour_id)
+            .limit(limit)
+            .all())
+    return [row.neighbour_id for row in rows]
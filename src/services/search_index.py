@@ -0,0 +1,173 @@
+# src/services/search_index.py
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy import case, false, func, literal_column
+from sqlalchemy.orm import Session
+
+from src.db.database import is_postgres
+from src.db.tables import Game, game_search_vector
+
+# Mirrors the A/B/C/D weights of the Postgres tsvector
+FIELD_WEIGHTS = {"name": 3.0, "description": 1.5, "objective": 1.0, "rules": 1.0}
+MAX_SEARCH_RESULTS = 1000
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or", "the",
+    "to", "with",
+})
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    tokens = []
+    for token in _TOKEN_PATTERN.findall((text or "").lower()):
+        if token in _STOP_WORDS:
+            continue
+        # Cheap plural folding so "cards" finds "card"; applied to documents and queries alike
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class InvertedIndex:
+    """
+    In-process BM25 index over game text, used when the database has no full-text search (SQLite).
+    Kept current by the game write endpoints; built lazily from the database on first search.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._doc_terms: Dict[str, Counter] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+        self._lock = threading.RLock()
+        self.is_built = False
+
+    def build(self, db: Session) -> None:
+        with self._lock:
+            if self.is_built:
+                return
+            rows = (db.query(Game.id, Game.name, Game.description, Game.objective, Game.rules)
+                    .yield_per(1000))
+            for row in rows:
+                self._add(row.id, row._mapping)
+            self.is_built = True
+
+    def add_game(self, db_game: Game) -> None:
+        with self._lock:
+            if not self.is_built:
+                return
+            self._remove(db_game.id)
+            self._add(db_game.id, {field: getattr(db_game, field) for field in FIELD_WEIGHTS})
+
+    def remove_game(self, game_id: str) -> None:
+        with self._lock:
+            if self.is_built:
+                self._remove(game_id)
+
+    def search(self, query: str, limit: int = MAX_SEARCH_RESULTS) -> List[str]:
+        """Return ids of games containing every query term, best BM25 score first."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        with self._lock:
+            postings = [self._postings.get(term, {}) for term in terms]
+            if not all(postings):
+                return []
+
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting.keys()
+
+            doc_count = len(self._doc_lengths)
+            avg_length = self._total_length / doc_count if doc_count else 0.0
+            scores = {}
+            for posting in postings:
+                idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for game_id in candidates:
+                    tf = posting[game_id]
+                    norm = 1 - self.b + self.b * self._doc_lengths[game_id] / avg_length if avg_length else 1.0
+                    scores[game_id] = scores.get(game_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [game_id for game_id, _ in ranked[:limit]]
+
+    def _add(self, game_id: str, fields) -> None:
+        terms: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(fields[field]):
+                terms[token] += weight
+
+        length = sum(terms.values())
+        for term, tf in terms.items():
+            self._postings[term][game_id] = tf
+        self._doc_terms[game_id] = terms
+        self._doc_lengths[game_id] = length
+        self._total_length += length
+
+    def _remove(self, game_id: str) -> None:
+        terms = self._doc_terms.pop(game_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            posting = self._postings[term]
+            posting.pop(game_id, None)
+            if not posting:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(game_id)
+
+
+_index = InvertedIndex()
+
+
+def get_search_index(db: Session) -> InvertedIndex:
+    if not _index.is_built:
+        _index.build(db)
+    return _index
+
+
+def reset_search_index() -> None:
+    global _index
+    _index = InvertedIndex()
+
+
+def search_clauses(db: Session, q: str):
+    """
+    Returns (filter, order_by) restricting a Game query to matches for q, most relevant first.
+    Postgres ranks against the GIN-indexed tsvector; anything else goes through the in-process index.
+    """
+    if is_postgres(db):
+        ts_query = func.plainto_tsquery(literal_column("'english'"), q)
+        vector = game_search_vector()
+        return vector.op("@@")(ts_query), func.ts_rank_cd(vector, ts_query).desc()
+
+    ranked_ids = get_search_index(db).search(q)
+    if not ranked_ids:
+        return false(), None
+    return Game.id.in_(ranked_ids), case({game_id: rank for rank, game_id in enumerate(ranked_ids)}, value=Game.id)
+
+
+def is_index_built(db: Session) -> bool:
+    """Whether game writes have an in-process index to keep current."""
+    return not is_postgres(db) and _index.is_built
+
+
+def index_game(db: Session, db_game: Game) -> None:
+    if not is_postgres(db):
+        _index.add_game(db_game)
+
+
+def unindex_game(db: Session, game_id: str) -> None:
+    if not is_postgres(db):
+        _index.remove_game(game_id)
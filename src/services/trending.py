@@ -0,0 +1,55 @@
+# src/services/trending.py
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from src.db.tables import Game, UserFavourites
+from src.utils.trending import vote_weight
+
+# Scores closer than this are left alone, so a rerun with nothing new writes nothing
+SCORE_TOLERANCE = 1e-9
+
+
+def recompute_trending_scores(db: Session) -> int:
+    """
+    Recomputes every game's trending_score from its creation time and user_favourites, returning how many
+    scores changed. The vote endpoints only adjust scores incrementally, so this corrects concurrent votes that
+    overwrote each other, approximate vote removals and a changed TRENDING_HALF_LIFE_HOURS; votes cast while
+    it runs may be overwritten and are picked up by the next run.
+    """
+    game_ids, weights, current = [], [], []
+    for game_id, created_at, trending_score in (db.query(Game.id, Game.created_at, Game.trending_score)
+                                                .yield_per(5000)):
+        game_ids.append(game_id)
+        weights.append(vote_weight(created_at))
+        current.append(trending_score)
+    row_of = {game_id: row for row, game_id in enumerate(game_ids)}
+    scores = np.array(weights, dtype=np.float64)
+
+    batch_rows, batch_weights = [], []
+    for game_id, created_at in (db.query(UserFavourites.game_id, UserFavourites.created_at)
+                                .yield_per(5000)):
+        row = row_of.get(game_id)
+        if row is None:
+            continue
+        batch_rows.append(row)
+        batch_weights.append(vote_weight(created_at))
+        if len(batch_rows) == 5000:
+            np.logaddexp.at(scores, batch_rows, batch_weights)
+            batch_rows, batch_weights = [], []
+    if batch_rows:
+        np.logaddexp.at(scores, batch_rows, batch_weights)
+
+    changed = np.flatnonzero(np.abs(scores - np.array(current, dtype=np.float64)) > SCORE_TOLERANCE)
+    if len(changed):
+        # ORM bulk UPDATE by primary key: one executemany rather than a statement per game. Moving last_updated
+        # moves the catalog version, which is how API processes' snapshots and ETags hear about it
+        now = datetime.now(timezone.utc)
+        db.execute(update(Game), [{"id": game_ids[row], "trending_score": float(scores[row]), "last_updated": now}
+                                  for row in changed])
+    db.commit()
+    return len(changed)
@@ -0,0 +1,73 @@
+# src/services/upvote_counts.py
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from src.db.tables import Game, JobWatermark, UserFavourites
+
+JOB = "reconcile-upvotes"
+BATCH_SIZE = 1000
+# Votes committed just before a run started may not have been visible to it, so the next run looks back this far
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def reconcile_upvote_counts(db: Session, full: bool = False,
+                            batch_size: int = BATCH_SIZE) -> List[Tuple[str, int, float]]:
+    """
+    Sets games.upvotes back to the number of user_favourites rows of each game, returning the
+    (id, upvotes, trending_score) of the games it corrected. Only games voted on or favourited since the last
+    run's watermark are checked unless full is set (or there is no watermark yet).
+
+    Games are corrected batch_size at a time, each batch one UPDATE committed on its own, so only the rows
+    being corrected are locked and only briefly. Votes buffered by UPVOTE_BUFFER_ENABLED but not yet flushed
+    look like drift and are corrected away; their flush then overcounts until the next run, which checks
+    those games again because the flush marks them voted on.
+    """
+    started = datetime.now(timezone.utc)
+    watermark = db.get(JobWatermark, JOB)
+    since = None if full or watermark is None else watermark.watermark - WATERMARK_OVERLAP
+
+    favourites = (select(func.count()).select_from(UserFavourites)
+                  .where(UserFavourites.game_id == Game.id).scalar_subquery())
+    corrected, last_id = [], None
+    while True:
+        ids = _touched_game_ids(db, since, last_id, batch_size)
+        if not ids:
+            break
+        last_id = ids[-1]
+        # The recount and the write are one statement, so they agree even while votes keep arriving. Moving
+        # last_updated is what lets API processes' catalog snapshots and ETags, and export mirrors, see the fix
+        corrected += [tuple(row) for row in db.execute(
+            update(Game)
+            .where(Game.id.in_(ids), Game.upvotes != favourites)
+            .values(upvotes=favourites, last_updated=datetime.now(timezone.utc))
+            .returning(Game.id, Game.upvotes, Game.trending_score)
+        )]
+        db.commit()
+
+    if watermark is None:
+        db.add(JobWatermark(job=JOB, watermark=started))
+    else:
+        watermark.watermark = started
+    db.commit()
+    return corrected
+
+
+def _touched_game_ids(db: Session, since: Optional[datetime], after: Optional[str], limit: int) -> List[str]:
+    """The next ids in order after `after` of games whose votes changed since `since` (all games if None)."""
+    if since is None:
+        touched = select(Game.id.label("id"))
+    else:
+        # A vote marks its game unless UPVOTE_BUFFER_ENABLED holds it back, and buffered votes lost with
+        # their process never do, so games favourited since are included too
+        touched = select(Game.id.label("id")).where(Game.votes_changed_at >= since).union(
+            select(UserFavourites.game_id).where(UserFavourites.created_at >= since))
+    touched = touched.subquery()
+    query = select(touched.c.id)
+    if after is not None:
+        query = query.where(touched.c.id > after)
+    return list(db.execute(query.order_by(touched.c.id).limit(limit)).scalars())
@@ -0,0 +1,180 @@
+# src/services/votes.py
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import Float, Integer, bindparam, update
+from sqlalchemy.orm import Session
+
+from src.db.tables import Game
+from src.utils import config
+from src.utils.trending import add_vote_clause, remove_vote_clause
+
+
+@dataclass
+class VoteChange:
+    """What one or more votes do to a games row: the upvote delta and the trending weights cast and taken back."""
+    game_id: str
+    upvotes: int
+    floor: float  # trending score of the game with no votes
+    added: Optional[float] = None  # log-sum of the weights of the votes cast
+    removed: Optional[float] = None  # log-sum of the weights of the votes taken back
+
+    def merge(self, other: VoteChange) -> None:
+        self.upvotes += other.upvotes
+        self.added = _log_sum(self.added, other.added)
+        self.removed = _log_sum(self.removed, other.removed)
+
+    def params(self) -> dict:
+        return {"game_id": self.game_id, "delta": self.upvotes, "added": self.added, "removed": self.removed,
+                "floor": self.floor}
+
+
+def _vote_update(added: bool, removed: bool):
+    """UPDATE applying a VoteChange's params to its games row, for changes that cast and/or take back votes."""
+    games = Game.__table__
+    score = games.c.trending_score
+    if added:
+        score = add_vote_clause(score, bindparam("added", type_=Float))
+    if removed:
+        score = remove_vote_clause(score, bindparam("removed", type_=Float), bindparam("floor", type_=Float))
+    # last_updated too, as upvotes are part of what GET /games/export?since= hands to mirrors
+    now = datetime.now(timezone.utc)
+    return (update(games)
+            .where(games.c.id == bindparam("game_id"))
+            .values(upvotes=games.c.upvotes + bindparam("delta", type_=Integer), trending_score=score,
+                    votes_changed_at=now, last_updated=now))
+
+
+def _write_changes(db: Session, changes: List[VoteChange]) -> None:
+    # One executemany per shape of SET clause rather than a statement per game
+    shapes: Dict[Tuple[bool, bool], List[dict]] = {}
+    for change in changes:
+        shapes.setdefault((change.added is not None, change.removed is not None), []).append(change.params())
+    for (added, removed), params in shapes.items():
+        db.execute(_vote_update(added, removed), params)
+
+
+def _vote_counts(db: Session, game_ids: List[str]) -> List[Tuple[str, int, float]]:
+    return [tuple(row) for row in db.query(Game.id, Game.upvotes, Game.trending_score)
+            .filter(Game.id.in_(game_ids))]
+
+
+def _log_sum(a: Optional[float], b: Optional[float]) -> Optional[float]:
+    if a is None or b is None:
+        return b if a is None else a
+    return float(np.logaddexp(a, b))
+
+
+class VoteBuffer:
+    """
+    Per-process sums of the vote changes not yet written to games, for hot games where every vote updating
+    the same row would queue on its lock. Deltas are additive, so each worker process flushes its own: on
+    the first vote after UPVOTE_BUFFER_FLUSH_SECONDS, or from the periodic task main.py runs.
+    Buffered votes are lost if the process dies, but their user_favourites rows are already committed,
+    so recounting from user_favourites restores them.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, VoteChange] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def add(self, change: VoteChange) -> None:
+        with self._lock:
+            pending = self._pending.get(change.game_id)
+            if pending is None:
+                self._pending[change.game_id] = VoteChange(change.game_id, change.upvotes, change.floor,
+                                                           change.added, change.removed)
+            else:
+                pending.merge(change)
+
+    def pending_upvotes(self, game_id: str) -> int:
+        with self._lock:
+            pending = self._pending.get(game_id)
+            return pending.upvotes if pending else 0
+
+    def flush_due(self) -> bool:
+        return bool(self._pending) and time.monotonic() - self._last_flush >= config.UPVOTE_BUFFER_FLUSH_SECONDS
+
+    def flush(self, db: Session) -> List[Tuple[str, int, float]]:
+        """Writes every pending change and returns the (id, upvotes, trending_score) of the games written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return []
+
+        try:
+            _write_changes(db, list(pending.values()))
+            db.commit()
+        except Exception:
+            db.rollback()
+            for change in pending.values():
+                self.add(change)
+            raise
+        return _vote_counts(db, list(pending))
+
+
+_buffer = VoteBuffer()
+
+
+def commit_vote(db: Session, change: Optional[VoteChange]) -> Optional[Tuple[int, float]]:
+    """
+    Commits the caller's user_favourites write together with change. Unbuffered, change is applied with one
+    atomic UPDATE ... RETURNING issued last, so the games row is locked only for the commit, and the new
+    (upvotes, trending_score) is returned. With UPVOTE_BUFFER_ENABLED it is buffered after the commit and
+    None is returned; so is None when there is no change (the favourite was already in the wanted state).
+    """
+    if change is None:
+        db.commit()
+        return None
+    if config.UPVOTE_BUFFER_ENABLED:
+        db.commit()
+        _buffer.add(change)
+        return None
+
+    statement = _vote_update(change.added is not None, change.removed is not None).returning(
+        Game.__table__.c.upvotes, Game.__table__.c.trending_score)
+    upvotes, trending_score = db.execute(statement, change.params()).one()
+    db.commit()
+    return upvotes, trending_score
+
+
+def commit_votes(db: Session, changes: List[VoteChange]) -> List[Tuple[str, int, float]]:
+    """
+    commit_vote for many games at once, at most one UPDATE statement per shape of change. Returns the
+    (id, upvotes, trending_score) of the games written, or nothing when UPVOTE_BUFFER_ENABLED buffers them.
+    """
+    if config.UPVOTE_BUFFER_ENABLED or not changes:
+        db.commit()
+        for change in changes:
+            _buffer.add(change)
+        return []
+
+    _write_changes(db, changes)
+    db.commit()
+    return _vote_counts(db, [change.game_id for change in changes])
+
+
+def current_upvotes(db: Session, game_id: str) -> int:
+    """The game's upvotes including votes still in this process's buffer."""
+    return db.query(Game.upvotes).filter(Game.id == game_id).scalar() + _buffer.pending_upvotes(game_id)
+
+
+def flush_due() -> bool:
+    return _buffer.flush_due()
+
+
+def flush_votes(db: Session) -> List[Tuple[str, int, float]]:
+    return _buffer.flush(db)
+
+
+def reset_vote_buffer() -> None:
+    global _buffer
+    _buffer = VoteBuffer()
@@ -5,3 +5,32 @@ from dotenv import load_dotenv
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Serve public GET /games filtering from the in-process columnar snapshot instead of SQL. GET /games/random
+# and POST /games/plan use it too; without it a random draw counts and skips through the matching games.
+# GET /games/{id}/similar has no SQL path and builds the snapshot on first use whatever this is set to
+CATALOG_SNAPSHOT_ENABLED = os.getenv("CATALOG_SNAPSHOT_ENABLED", "false").lower() == "true"
+# Also run the SQL path for every snapshot-served request, log any difference and return the SQL result
+CATALOG_SNAPSHOT_VERIFY = os.getenv("CATALOG_SNAPSHOT_VERIFY", "false").lower() == "true"
+
+# How long a process reuses the catalog version behind GET /games ETags before re-reading it from the database
+CATALOG_VERSION_TTL_SECONDS = float(os.getenv("CATALOG_VERSION_TTL_SECONDS", "1"))
+
+GAME_DETAIL_CACHE_SIZE = int(os.getenv("GAME_DETAIL_CACHE_SIZE", "5000"))
+GAME_DETAIL_CACHE_TTL_SECONDS = float(os.getenv("GAME_DETAIL_CACHE_TTL_SECONDS", "300"))
+
+# A vote's weight in sort=trending halves every this many hours
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "24"))
+
+# Sum upvotes in-process and write them to games every UPVOTE_BUFFER_FLUSH_SECONDS, instead of on every vote.
+# A background task flushes due votes, so they reach games within about twice that even with no further votes
+UPVOTE_BUFFER_ENABLED = os.getenv("UPVOTE_BUFFER_ENABLED", "false").lower() == "true"
+UPVOTE_BUFFER_FLUSH_SECONDS = float(os.getenv("UPVOTE_BUFFER_FLUSH_SECONDS", "5"))
+
+# Cache who a token's sub is for AUTH_CACHE_TTL_SECONDS instead of looking the user up on every request.
+# Off by default: it saves one indexed SELECT per request, but changes made through another worker process
+# (deactivation, role changes, deletion) reach this one's cache only when the entry expires, and until then
+# a deleted user's writes fail on their foreign keys rather than with a 401
+AUTH_CACHE_ENABLED = os.getenv("AUTH_CACHE_ENABLED", "false").lower() == "true"
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
@@ -0,0 +1,76 @@
+# src/utils/pagination.py
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, Float, Integer, String, literal, tuple_
+from sqlalchemy.orm import Query
+
+from src.core.exceptions import INVALID_CURSOR_EXCEPTION
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    payload = {"k": kind, "v": [v.isoformat() if isinstance(v, datetime) else v for v in values]}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str, key_columns: Sequence) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["v"]
+        if payload["k"] != kind or len(values) != len(key_columns):
+            raise INVALID_CURSOR_EXCEPTION
+        return [_decode_value(v, c) for v, c in zip(values, key_columns)]
+    except (ValueError, KeyError, TypeError):
+        raise INVALID_CURSOR_EXCEPTION
+
+
+def _decode_value(value: Any, column) -> Any:
+    """A cursor value as its column's Python type, so a tampered cursor is a 400 rather than a database error."""
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(value, bool):
+        raise TypeError("boolean cursor value")
+    if isinstance(column.type, Integer) and isinstance(value, int):
+        return value
+    if isinstance(column.type, Float) and isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(column.type, String) and isinstance(value, str):
+        return value
+    raise TypeError(f"cursor value {value!r} doesn't fit {column.type}")
+
+
+def paginate_keyset(
+        query: Query,
+        kind: str,
+        key_columns: Sequence,
+        cursor: Optional[str],
+        limit: int,
+        key_of: Callable[[Any], Sequence[Any]],
+        offset: int = 0,
+) -> Tuple[list, Optional[str]]:
+    """
+    Descending keyset pagination over key_columns, which must end in a unique column.
+    Returns the page and the cursor for the next one (None on the last page).
+    offset is only honoured for the first page, for clients that haven't moved to cursors yet.
+    """
+    if cursor:
+        values = decode_cursor(cursor, kind, key_columns)
+        query = query.filter(
+            tuple_(*key_columns) < tuple_(*[literal(v, type_=c.type) for v, c in zip(values, key_columns)])
+        )
+
+    query = query.order_by(*[c.desc() for c in key_columns])
+    if offset and not cursor:
+        query = query.offset(offset)
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], encode_cursor(kind, key_of(rows[limit - 1]))
@@ -0,0 +1,53 @@
+# src/utils/trending.py
+"""
+Trending scores are exponentially time-decayed vote counts, stored as log(sum(exp(rate * (t - epoch))))
+over a game's votes plus its creation. Every score decays by the same factor as time passes, so ordering
+by the stored value equals ordering by the decayed count and nothing has to be recomputed per request;
+working in log space keeps the growing exponents from overflowing.
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+
+from sqlalchemy import case, func
+
+from src.utils.config import TRENDING_HALF_LIFE_HOURS
+
+_EPOCH = datetime(2024, 1, 1)
+_RATE = math.log(2) / (TRENDING_HALF_LIFE_HOURS * 3600)
+
+
+def vote_weight(at: datetime) -> float:
+    """Log-space contribution of one vote (or the game's creation) at time at."""
+    if at.tzinfo is not None:
+        at = at.astimezone(timezone.utc).replace(tzinfo=None)
+    return _RATE * (at - _EPOCH).total_seconds()
+
+
+def add_vote(score: float, at: datetime) -> float:
+    weight = vote_weight(at)
+    high, low = max(score, weight), min(score, weight)
+    return high + math.log1p(math.exp(low - high))
+
+
+def remove_vote(score: float, at: datetime, floor: float) -> float:
+    """Takes back a vote cast at at, never going below floor (the game's creation alone)."""
+    remaining = -math.expm1(vote_weight(at) - score)
+    if remaining <= 0:
+        return floor
+    return max(floor, score + math.log(remaining))
+
+
+# The same updates as SQL expressions, so a vote can change a score in place without reading it first
+
+def add_vote_clause(score, weight: float):
+    return case(
+        (score >= weight, score + func.ln(1 + func.exp(weight - score))),
+        else_=weight + func.ln(1 + func.exp(score - weight)),
+    )
+
+
+def remove_vote_clause(score, weight: float, floor: float):
+    remaining = score + func.ln(1 - func.exp(weight - score))
+    return case((score <= weight, floor), (remaining < floor, floor), else_=remaining)
@@ -0,0 +1,23 @@
+from src.models.enums.role_enum import Role
+from tests.utils import valid_public_game_payload
+
+
+def test_get_cache_stats_requires_admin(client_with_auth):
+    response = client_with_auth.get("/admin/cache-stats")
+    assert response.status_code == 403
+
+
+def test_get_cache_stats(client_with_auth, client_no_auth, db, test_user):
+    test_user.role = Role.admin
+    db.commit()
+
+    game_id = client_with_auth.post("/games/", json=valid_public_game_payload()).json()["id"]
+    client_no_auth.get(f"/games/{game_id}")
+    client_no_auth.get(f"/games/{game_id}")
+
+    response = client_with_auth.get("/admin/cache-stats")
+    assert response.status_code == 200
+    stats = response.json()["game_detail"]
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
+    assert 0 < stats["hit_rate"] < 1
@@ -1,3 +1,16 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from src.api import favourites as favourites_api
+from src.api.users import get_current_active_user
+from src.db.tables import Game
+from src.main import app
+from src.models.enums.role_enum import Role
+from src.services.upvote_counts import reconcile_upvote_counts
+from src.utils import config
+from tests.api.games.helper import count_statements
 from tests.conftest import client_no_auth
 from tests.utils import valid_public_game_payload
 
@@ -88,6 +101,40 @@ def test_get_favourites_pagination(client_with_auth):
     assert len(response.json()) == 2
 
 
+def test_get_favourites_cursor_pagination(client_with_auth):
+    game_ids = []
+    for i in range(5):
+        game_response = client_with_auth.post("/games/", json=valid_public_game_payload({"name": f"Game {i}"}))
+        game_ids.append(game_response.json()["id"])
+        client_with_auth.post(f"/favourites/{game_ids[-1]}")
+
+    first_page = client_with_auth.get("/favourites/?limit=3")
+    assert [game["id"] for game in first_page.json()] == list(reversed(game_ids))[:3]
+
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = client_with_auth.get(f"/favourites/?limit=3&cursor={cursor}")
+    assert [game["id"] for game in second_page.json()] == list(reversed(game_ids))[3:]
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+def test_get_favourites_statement_count_is_independent_of_page_size(client_with_auth):
+    equipment = ["Pen", "Paper", "Coins", "Dice Cup", "Tokens"]
+    settings = ["Party", "Pub / Bar", "Chill", "Funny", "Team"]
+    for i in range(6):
+        game_response = client_with_auth.post("/games/", json=valid_public_game_payload(
+            {"name": f"Game {i}", "equipment": equipment, "game_setting": settings}))
+        client_with_auth.post(f"/favourites/{game_response.json()['id']}")
+    client_with_auth.get("/favourites/")  # reloads test_user, expired by the commits above
+
+    small_page, small_page_statements = count_statements(client_with_auth, "/favourites/?limit=2")
+    large_page, large_page_statements = count_statements(client_with_auth, "/favourites/?limit=6")
+
+    assert [game["name"] for game in large_page.json()] == [f"Game {i}" for i in reversed(range(6))]
+    assert all(len(game["equipment"]) == 5 and len(game["game_setting"]) == 5 for game in large_page.json())
+    # The favourites joined to their games, then equipment and settings
+    assert small_page_statements == large_page_statements == 3
+
+
 def test_get_favourites_unauthorized(client_no_auth):
     response = client_no_auth.get("/favourites/")
     assert response.status_code == 401
@@ -120,3 +167,131 @@ def test_remove_favourite_not_found(client_with_auth):
 def test_remove_favourite_unauthorized(client_no_auth):
     response = client_no_auth.delete("/favourites/some-game-id")
     assert response.status_code == 401
+
+
+def create_games(client, count):
+    return [client.post("/games/", json=valid_public_game_payload({"name": f"Game {i}"})).json()["id"]
+            for i in range(count)]
+
+
+def upvotes_of(client, game_ids):
+    return [client.get(f"/games/{game_id}").json()["upvotes"] for game_id in game_ids]
+
+
+def test_bulk_add_and_remove_favourites(client_with_auth):
+    game_ids = create_games(client_with_auth, 3)
+    client_with_auth.post("/favourites/bulk", json={"add": [game_ids[2]]})
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    response = client_with_auth.post("/favourites/bulk", json={"add": game_ids[:2] + [missing_id],
+                                                               "remove": [game_ids[2]]})
+    assert response.status_code == 200
+    assert response.json() == {"added": 2, "removed": 1, "not_found": [missing_id]}
+    assert {game["id"] for game in client_with_auth.get("/favourites/").json()} == set(game_ids[:2])
+    assert upvotes_of(client_with_auth, game_ids[:2]) == [1, 1]
+
+    # Already in the wanted state, so nothing changes
+    response = client_with_auth.post("/favourites/bulk", json={"add": game_ids[:2], "remove": [game_ids[2]]})
+    assert response.json() == {"added": 0, "removed": 0, "not_found": []}
+    assert upvotes_of(client_with_auth, game_ids[:2]) == [1, 1]
+
+
+def test_bulk_add_skips_existing_favourites(client_with_auth):
+    game_ids = create_games(client_with_auth, 3)
+    client_with_auth.post(f"/favourites/{game_ids[1]}")
+
+    response = client_with_auth.post("/favourites/bulk", json={"add": game_ids})
+    assert response.status_code == 200
+    assert response.json() == {"added": 2, "removed": 0, "not_found": []}
+    assert upvotes_of(client_with_auth, game_ids) == [1, 1, 1]
+
+
+def test_bulk_add_is_one_multi_row_insert_on_postgres():
+    postgres = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=postgresql.dialect()))
+    statement = favourites_api._insert_favourites(postgres, "user", ["a", "b", "c"], datetime.now(timezone.utc))
+
+    # A single statement rather than an executemany, whose RETURNING rows Postgres would have to match back
+    # to the parameter sets, failing when ON CONFLICT skips some
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.count("INSERT") == 1
+    assert sql.count("), (") == 2
+    assert "ON CONFLICT DO NOTHING RETURNING user_favourites.game_id" in sql
+
+
+def test_bulk_favourites_rejects_conflicting_and_oversized_requests(client_with_auth, monkeypatch):
+    game_ids = create_games(client_with_auth, 2)
+    response = client_with_auth.post("/favourites/bulk", json={"add": game_ids, "remove": game_ids[:1]})
+    assert response.status_code == 400
+
+    monkeypatch.setattr(favourites_api, "FAVOURITES_BULK_MAX_IDS", 1)
+    assert client_with_auth.post("/favourites/bulk", json={"add": game_ids}).status_code == 400
+    assert client_with_auth.put("/favourites/", json={"game_ids": game_ids}).status_code == 400
+
+
+def test_sync_favourites(client_with_auth):
+    game_ids = create_games(client_with_auth, 3)
+    client_with_auth.post("/favourites/bulk", json={"add": game_ids[:2]})
+
+    response = client_with_auth.put("/favourites/", json={"game_ids": game_ids[1:]})
+    assert response.status_code == 200
+    assert response.json() == {"added": 1, "removed": 1, "not_found": []}
+    assert {game["id"] for game in client_with_auth.get("/favourites/").json()} == set(game_ids[1:])
+    assert upvotes_of(client_with_auth, game_ids) == [0, 1, 1]
+
+    assert client_with_auth.put("/favourites/", json={"game_ids": []}).json() == {
+        "added": 0, "removed": 2, "not_found": []}
+    assert client_with_auth.get("/favourites/").json() == []
+
+
+def test_single_favourites_move_upvotes(client_with_auth):
+    game_id = create_games(client_with_auth, 1)[0]
+
+    client_with_auth.post(f"/favourites/{game_id}")
+    assert upvotes_of(client_with_auth, [game_id]) == [1]
+    client_with_auth.delete(f"/favourites/{game_id}")
+    assert upvotes_of(client_with_auth, [game_id]) == [0]
+
+
+def test_deleting_an_account_takes_its_votes_back(client_with_auth, second_user):
+    game_id = create_games(client_with_auth, 1)[0]
+    app.dependency_overrides[get_current_active_user] = lambda: second_user
+    client_with_auth.post(f"/favourites/{game_id}")
+    assert upvotes_of(client_with_auth, [game_id]) == [1]
+
+    assert client_with_auth.delete(f"/users/{second_user.id}").status_code == 204
+    assert upvotes_of(client_with_auth, [game_id]) == [0]
+
+
+def test_reconcile_upvotes_corrects_drift(client_with_auth, db, test_user):
+    favourited, untouched = create_games(client_with_auth, 2)
+    client_with_auth.post(f"/favourites/{favourited}")
+    test_user.role = Role.admin
+    db.commit()
+    # The first run has no watermark, so checks every game
+    assert client_with_auth.post("/admin/jobs/reconcile-upvotes").json() == {"job": "reconcile-upvotes", "rows": 0}
+
+    db.query(Game).filter(Game.id.in_([favourited, untouched])).update({"upvotes": 7}, synchronize_session=False)
+    db.commit()
+    # Only the favourited game was voted on since the watermark; full=true checks the other one too
+    assert client_with_auth.post("/admin/jobs/reconcile-upvotes").json()["rows"] == 1
+    assert upvotes_of(client_with_auth, [favourited, untouched]) == [1, 7]
+    assert client_with_auth.post("/admin/jobs/reconcile-upvotes", params={"full": True}).json()["rows"] == 1
+    assert upvotes_of(client_with_auth, [favourited, untouched]) == [1, 0]
+
+
+def test_reconcile_upvotes_reaches_the_catalog_snapshot(client_with_auth, client_no_auth, db, monkeypatch):
+    drifted, favourited = create_games(client_with_auth, 2)
+    client_with_auth.post(f"/favourites/{favourited}")
+    db.query(Game).filter(Game.id == drifted).update({"upvotes": 7}, synchronize_session=False)
+    db.commit()
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    monkeypatch.setattr(config, "CATALOG_VERSION_TTL_SECONDS", 0)
+    assert [g["id"] for g in client_no_auth.get("/games/", params={"sort": "top"}).json()] == [drifted, favourited]
+
+    # As scripts/reconcile_upvotes.py runs it, outside any API process
+    assert [row[:2] for row in reconcile_upvote_counts(db, full=True)] == [(drifted, 0)]
+    assert [g["id"] for g in client_no_auth.get("/games/", params={"sort": "top"}).json()] == [favourited, drifted]
+
+
+def test_reconcile_upvotes_requires_admin(client_with_auth):
+    assert client_with_auth.post("/admin/jobs/reconcile-upvotes").status_code == 403
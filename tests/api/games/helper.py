@@ -1,15 +1,18 @@
+from sqlalchemy import event
+
+from tests.conftest import engine
 from tests.utils import valid_public_game_payload, valid_private_game_payload
 
 
-def create_public_game(client):
-    payload = valid_public_game_payload()
+def create_public_game(client, overrides=None):
+    payload = valid_public_game_payload(overrides)
     response = client.post("/games/", json=payload)
     assert response.status_code == 201
     return response.json()
 
 
-def create_private_game(client):
-    payload = valid_private_game_payload()
+def create_private_game(client, overrides=None):
+    payload = valid_private_game_payload(overrides)
     response = client.post("/games/", json=payload)
     assert response.status_code == 201
     return response.json()
@@ -36,3 +39,22 @@ def get_user_token(client, user_login) -> str:
 
 def upvote_game(client, game_id):
     return client.post(f"/games/{game_id}/upvote")
+
+
+def record_statements(client, url, headers=None):
+    statements = []
+
+    def record_statement(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        response = client.get(url, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+    return response, statements
+
+
+def count_statements(client, url, headers=None):
+    response, statements = record_statements(client, url, headers)
+    return response, len(statements)
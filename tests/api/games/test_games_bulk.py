@@ -0,0 +1,105 @@
+from sqlalchemy import event
+
+from src.api import games
+from src.utils import config
+from tests.conftest import client_with_auth, client_no_auth, engine
+from tests.utils import valid_public_game_payload, valid_private_game_payload
+
+
+def test_bulk_create_games(client_with_auth, client_no_auth):
+    payloads = [valid_public_game_payload({"name": f"Bulk {i}"}) for i in range(3)]
+    payloads.append(valid_private_game_payload({"name": "Bulk private"}))
+
+    response = client_with_auth.post("/games/bulk", json=payloads)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["created"] == 4
+    assert data["failed"] == 0
+    assert [result["index"] for result in data["results"]] == [0, 1, 2, 3]
+    assert all(result["errors"] is None for result in data["results"])
+
+    game = client_no_auth.get(f"/games/{data['results'][0]['id']}").json()
+    assert game["name"] == "Bulk 0"
+    assert game["equipment"] == payloads[0]["equipment"]
+    assert set(game["game_setting"]) == set(payloads[0]["game_setting"])
+    assert game["contributor"]["username"] == "testuser"
+
+    listed = {game["name"] for game in client_no_auth.get("/games/").json()}
+    assert {"Bulk 0", "Bulk 1", "Bulk 2"} <= listed
+    assert "Bulk private" not in listed
+
+
+def test_bulk_create_reports_invalid_items_and_creates_the_rest(client_with_auth):
+    invalid = valid_public_game_payload({"age_rating": "not an age rating"})
+    del invalid["name"]
+    payloads = [valid_public_game_payload({"name": "Valid"}), invalid]
+
+    response = client_with_auth.post("/games/bulk", json=payloads)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["created"] == 1
+    assert data["failed"] == 1
+    valid_result, invalid_result = data["results"]
+    assert valid_result["id"] and valid_result["errors"] is None
+    assert invalid_result["id"] is None
+    assert {tuple(error["loc"]) for error in invalid_result["errors"]} == {("name",), ("age_rating",)}
+
+    assert client_with_auth.get(f"/games/{valid_result['id']}").status_code == 200
+
+
+def test_bulk_create_statement_count_does_not_grow_with_batch_size(client_with_auth):
+    def statements_for(count):
+        payloads = [valid_public_game_payload({"name": f"Counted {i}"}) for i in range(count)]
+        statements = []
+
+        def record(_conn, _cursor, statement, _parameters, _context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            assert client_with_auth.post("/games/bulk", json=payloads).status_code == 200
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        return len(statements)
+
+    assert statements_for(2) == statements_for(40)
+
+
+def test_bulk_create_reloads_games_only_for_built_in_process_state(client_with_auth, monkeypatch):
+    reloads, bumps = [], []
+    fetch_games_in_order = games.fetch_games_in_order
+    monkeypatch.setattr(games, "fetch_games_in_order", lambda db, ids, *args: reloads.append(ids) or
+                        fetch_games_in_order(db, ids, *args))
+    monkeypatch.setattr(games, "bump_catalog_version", lambda: bumps.append(1))
+
+    payloads = [valid_public_game_payload({"name": f"Bulk {i}"}) for i in range(3)]
+    assert client_with_auth.post("/games/bulk", json=payloads).status_code == 200
+    assert (reloads, bumps) == ([], [1])
+
+
+def test_bulk_created_games_reach_the_snapshot_and_search_index(client_with_auth, client_no_auth, monkeypatch):
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    assert client_no_auth.get("/games/").json() == []
+    assert client_no_auth.get("/games/", params={"q": "zebra"}).json() == []
+
+    payloads = [valid_public_game_payload({"name": f"Zebra {i}"}) for i in range(3)]
+    assert client_with_auth.post("/games/bulk", json=payloads).status_code == 200
+
+    assert {game["name"] for game in client_no_auth.get("/games/").json()} == {"Zebra 0", "Zebra 1", "Zebra 2"}
+    assert len(client_no_auth.get("/games/", params={"q": "zebra"}).json()) == 3
+
+
+def test_bulk_create_rejects_oversized_requests(client_with_auth, monkeypatch):
+    monkeypatch.setattr(games, "BULK_CREATE_MAX_GAMES", 2)
+    payloads = [valid_public_game_payload() for _ in range(3)]
+
+    response = client_with_auth.post("/games/bulk", json=payloads)
+    assert response.status_code == 400
+
+
+def test_bulk_create_requires_auth(client_no_auth):
+    response = client_no_auth.post("/games/bulk", json=[valid_public_game_payload()])
+    assert response.status_code == 401
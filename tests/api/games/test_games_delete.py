@@ -2,6 +2,7 @@ from starlette.testclient import TestClient
 
 from src.api.users import get_current_active_user
 from src.db.database import get_db
+from src.db.tables import UserFavourites
 from src.main import app
 from src.models import GameRead
 from tests.api.games.helper import create_public_game
@@ -67,3 +68,11 @@ def test_delete_game_not_owner(client_with_auth, db, second_user):
 
     # Optional: clear overrides after test
     app.dependency_overrides.clear()
+
+
+def test_delete_favourited_game(client_with_auth, db):
+    game_id = create_public_game(client_with_auth)["id"]
+    client_with_auth.post(f"/favourites/{game_id}")
+
+    assert client_with_auth.delete(f"/games/{game_id}").status_code == 204
+    assert db.query(UserFavourites).filter(UserFavourites.game_id == game_id).count() == 0
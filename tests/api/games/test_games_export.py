@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+from src.api import games
+from tests.api.games.helper import create_private_game, create_public_game
+from tests.conftest import client_with_auth, client_no_auth
+
+
+def export_ndjson(client, params=None):
+    response = client.get("/games/export", params=params)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_streams_every_public_game_across_batches(client_with_auth, client_no_auth, monkeypatch):
+    monkeypatch.setattr(games, "EXPORT_BATCH_SIZE", 2)
+    created = [create_public_game(client_with_auth, {"name": f"Export {i}"}) for i in range(5)]
+    create_private_game(client_with_auth)
+
+    exported = export_ndjson(client_no_auth)
+
+    assert [game["id"] for game in exported] == [game["id"] for game in created]
+    first = exported[0]
+    assert first["equipment"] == created[0]["equipment"]
+    assert set(first["game_setting"]) == set(created[0]["game_setting"])
+    assert first["contributor"] == created[0]["contributor"]
+    assert "last_updated" in first
+
+
+def test_export_since_returns_only_games_changed_afterwards(client_with_auth, client_no_auth):
+    unchanged = create_public_game(client_with_auth, {"name": "Unchanged"})
+    edited = create_public_game(client_with_auth, {"name": "Edited"})
+    since = datetime.now(timezone.utc).isoformat()
+
+    response = client_with_auth.patch(f"/games/{edited['id']}", json={"name": "Edited again"})
+    assert response.status_code == 200
+    added = create_public_game(client_with_auth, {"name": "Added"})
+
+    exported = export_ndjson(client_no_auth, {"since": since})
+
+    assert [game["id"] for game in exported] == [edited["id"], added["id"]]
+    assert exported[0]["name"] == "Edited again"
+    assert unchanged["id"] not in {game["id"] for game in exported}
+
+
+def test_export_since_reports_removals_and_votes(client_with_auth, client_no_auth):
+    voted, made_private, deleted = [create_public_game(client_with_auth, {"name": name})["id"]
+                                    for name in ("Voted", "Made private", "Deleted")]
+    since = datetime.now(timezone.utc).isoformat()
+
+    client_with_auth.post(f"/games/{voted}/upvote")
+    client_with_auth.patch(f"/games/{made_private}/visibility", json={"is_public": False})
+    client_with_auth.delete(f"/games/{deleted}")
+
+    exported = export_ndjson(client_no_auth, {"since": since})
+
+    assert [game["id"] for game in exported] == [voted, made_private, deleted]
+    assert exported[0]["upvotes"] == 1
+    assert [game.get("deleted") for game in exported] == [None, True, True]
+    assert set(exported[1]) == {"id", "deleted", "last_updated"}
+
+    rows = list(csv.DictReader(io.StringIO(
+        client_no_auth.get("/games/export", params={"format": "csv", "since": since}).text)))
+    assert [(row["id"], row["deleted"]) for row in rows] == [(voted, "False"), (made_private, "True"),
+                                                             (deleted, "True")]
+
+
+def test_export_csv(client_with_auth, client_no_auth, monkeypatch):
+    monkeypatch.setattr(games, "EXPORT_BATCH_SIZE", 1)
+    created = [create_public_game(client_with_auth, {"name": f"Export, {i}"}) for i in range(3)]
+
+    response = client_no_auth.get("/games/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["id"] for row in rows] == [game["id"] for game in created]
+    assert rows[0]["name"] == "Export, 0"
+    assert rows[0]["equipment"] == "|".join(created[0]["equipment"])
+    assert set(rows[0]["game_setting"].split("|")) == set(created[0]["game_setting"])
+    assert rows[0]["contributor_username"] == created[0]["contributor"]["username"]
+
+
+def test_export_csv_of_empty_catalog_is_just_the_header(client_no_auth):
+    response = client_no_auth.get("/games/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.text.splitlines() == [",".join(games.EXPORT_CSV_COLUMNS)]
@@ -0,0 +1,58 @@
+from tests.api.games.helper import create_private_game, create_public_game
+
+
+def test_get_facets_counts_every_facet(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {
+        "game_type": "Card", "equipment": ["Standard Deck of Cards"], "game_setting": ["Party", "Funny"],
+    })
+    create_public_game(client_with_auth, {
+        "game_type": "Dice", "difficulty": "Easy", "equipment": ["Six-Sided Dice", "Paper"],
+        "game_setting": ["Party"],
+    })
+    create_private_game(client_with_auth, {"game_type": "Dice"})
+
+    response = client_no_auth.get("/games/facets")
+    assert response.status_code == 200
+    facets = response.json()
+
+    assert facets["total"] == 2
+    assert facets["game_types"]["Card"] == 1
+    assert facets["game_types"]["Dice"] == 1
+    assert facets["game_types"]["Trivia"] == 0
+    assert facets["age_ratings"]["7+"] == 2
+    assert facets["difficulty"] == {"Easy": 1, "Medium": 1, "Hard": 0, "Expert": 0}
+    assert facets["durations"]["30-45 minutes"] == 2
+    assert facets["game_settings"]["Party"] == 2
+    assert facets["game_settings"]["Funny"] == 1
+    assert facets["game_equipment"]["Six-Sided Dice"] == 1
+    assert facets["game_equipment"]["Paper"] == 1
+
+
+def test_get_facets_applies_listing_filters(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {"game_type": "Card", "game_setting": ["Party"]})
+    create_public_game(client_with_auth, {"game_type": "Dice", "game_setting": ["Chill"]})
+
+    facets = client_no_auth.get("/games/facets", params={"setting": "party"}).json()
+
+    assert facets["total"] == 1
+    assert facets["game_types"]["Card"] == 1
+    assert facets["game_types"]["Dice"] == 0
+    # The setting facet itself ignores setting=, so the other settings still show what they would list
+    assert facets["game_settings"]["Party"] == 1
+    assert facets["game_settings"]["Chill"] == 1
+
+
+def test_get_facets_leave_out_their_own_filter(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {"game_type": "Card", "difficulty": "Easy", "equipment": ["Paper"]})
+    create_public_game(client_with_auth, {"game_type": "Card", "difficulty": "Hard", "equipment": ["Paper"]})
+    create_public_game(client_with_auth, {"game_type": "Dice", "difficulty": "Easy", "equipment": ["Pen"]})
+
+    facets = client_no_auth.get("/games/facets", params={"game_type": "Card", "difficulty": "Easy"}).json()
+
+    assert facets["total"] == 1
+    # Each facet is counted under the other facet's filter only
+    assert facets["game_types"] == {**facets["game_types"], "Card": 1, "Dice": 1}
+    assert facets["difficulty"] == {"Easy": 1, "Medium": 0, "Hard": 1, "Expert": 0}
+    # Facets without a filter of their own are counted under every filter
+    assert facets["game_equipment"]["Paper"] == 1
+    assert facets["game_equipment"]["Pen"] == 0
@@ -1,9 +1,24 @@
+import json
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+
+from pydantic import TypeAdapter
 from starlette.testclient import TestClient
 
+from src.api import games as games_api
+from src.api.games import fetch_games_in_order, game_list_response, map_game_to_read
 from src.api.users import get_current_user_optional
 from src.db.database import get_db
+from src.db.tables import Game
 from src.main import app
-from tests.api.games.helper import create_public_game, create_private_game, get_user_token
+from src.models.game_models.game import GameRead
+from src.services.votes import flush_votes
+from src.utils import config
+from src.utils.pagination import encode_cursor
+from tests.api.games.helper import (count_statements, create_public_game, create_private_game, get_user_token,
+                                    record_statements)
 from tests.conftest import client_with_auth, client_no_auth
 
 
@@ -67,3 +82,397 @@ def test_get_private_game_forbidden(client_with_auth, db, second_user):
         assert resp.status_code == 403
 
     app.dependency_overrides.clear()
+
+
+def test_search_games_ranks_by_relevance(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {"name": "Pirate Dice", "description": "Roll dice with pirates"})
+    create_public_game(client_with_auth, {"name": "Cheat", "description": "A bluffing game",
+                                   "rules": "Whoever is caught lying about their dice picks up the pile"})
+    create_public_game(client_with_auth, {"name": "Charades", "description": "Act it out"})
+
+    response = client_no_auth.get("/games/", params={"q": "dice"})
+    assert response.status_code == 200
+    assert [game["name"] for game in response.json()] == ["Pirate Dice", "Cheat"]
+
+
+def test_search_games_requires_every_term(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {"name": "Pirate Dice", "description": "Roll dice with pirates"})
+    create_public_game(client_with_auth, {"name": "Liar's Dice", "description": "Bluff about the dice"})
+
+    response = client_no_auth.get("/games/", params={"q": "pirates dice"})
+    assert [game["name"] for game in response.json()] == ["Pirate Dice"]
+
+    response = client_no_auth.get("/games/", params={"q": "chess"})
+    assert response.json() == []
+
+
+def test_search_index_follows_updates_and_deletes(client_with_auth, client_no_auth):
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+    assert len(client_no_auth.get("/games/", params={"q": "snap"}).json()) == 1
+
+    client_with_auth.patch(f"/games/{game['id']}", json={"name": "Slapjack"})
+    assert client_no_auth.get("/games/", params={"q": "snap"}).json() == []
+    assert len(client_no_auth.get("/games/", params={"q": "slapjack"}).json()) == 1
+
+    client_with_auth.delete(f"/games/{game['id']}")
+    assert client_no_auth.get("/games/", params={"q": "slapjack"}).json() == []
+
+
+def test_get_games_cursor_pagination_walks_every_game_once(client_with_auth, client_no_auth):
+    created_ids = [create_public_game(client_with_auth, {"name": f"Game {i}"})["id"] for i in range(5)]
+
+    seen = []
+    response = client_no_auth.get("/games/", params={"limit": 2})
+    while True:
+        assert response.status_code == 200
+        seen.extend(game["id"] for game in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        response = client_no_auth.get("/games/", params={"limit": 2, "cursor": next_cursor})
+
+    assert seen == list(reversed(created_ids))
+
+
+def test_get_games_sorted_by_upvotes(client_with_auth, client_no_auth):
+    quiet = create_public_game(client_with_auth, {"name": "Quiet"})
+    popular = create_public_game(client_with_auth, {"name": "Popular"})
+    client_with_auth.post(f"/games/{popular['id']}/upvote")
+
+    response = client_no_auth.get("/games/", params={"sort": "top", "limit": 1})
+    assert [game["id"] for game in response.json()] == [popular["id"]]
+
+    response = client_no_auth.get("/games/", params={"sort": "top", "cursor": response.headers["X-Next-Cursor"]})
+    assert [game["id"] for game in response.json()] == [quiet["id"]]
+
+
+def test_get_games_rejects_invalid_cursor(client_no_auth):
+    assert client_no_auth.get("/games/", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+@pytest.mark.parametrize("sort, values", [
+    ("top", ["7", "some-id"]),
+    ("top", [True, "some-id"]),
+    ("trending", ["hot", "some-id"]),
+    ("newest", [1700000000, "some-id"]),
+    ("newest", ["2024-01-01T00:00:00", 42]),
+])
+def test_get_games_rejects_cursor_values_of_the_wrong_type(client_no_auth, sort, values):
+    cursor = encode_cursor(sort, values)
+    assert client_no_auth.get("/games/", params={"sort": sort, "cursor": cursor}).status_code == 400
+
+
+def test_get_games_rejects_cursor_from_other_sort(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {"name": "Game 1"})
+    create_public_game(client_with_auth, {"name": "Game 2"})
+
+    cursor = client_no_auth.get("/games/", params={"limit": 1}).headers["X-Next-Cursor"]
+    assert client_no_auth.get("/games/", params={"sort": "top", "cursor": cursor}).status_code == 400
+
+
+def test_get_games_statement_count_is_independent_of_page_size(client_with_auth, client_no_auth):
+    equipment = ["Pen", "Paper", "Coins", "Dice Cup", "Tokens", "Timer", "Cups", "Table", "Voice", "Memory"]
+    settings = ["Party", "Pub / Bar", "Chill", "Funny", "Team", "Quick", "Casual", "Silly", "Game Night", "Outdoor"]
+    for i in range(6):
+        create_public_game(client_with_auth, {"name": f"Game {i}", "equipment": equipment, "game_setting": settings})
+    # Reads the catalog version, which is then reused for CATALOG_VERSION_TTL_SECONDS
+    client_no_auth.get("/games/")
+
+    small_page, small_page_statements = count_statements(client_no_auth, "/games/?limit=2&setting=party")
+    large_page, large_page_statements = count_statements(client_no_auth, "/games/?limit=6&setting=party")
+
+    assert len(small_page.json()) == 2
+    assert len(large_page.json()) == 6
+    assert all(len(game["equipment"]) == 10 and len(game["game_setting"]) == 10 for game in large_page.json())
+    assert small_page_statements == large_page_statements == 4
+
+
+def test_get_game_by_id_is_served_from_cache(client_with_auth, client_no_auth):
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+
+    first, first_statements = count_statements(client_no_auth, f"/games/{game['id']}")
+    second, second_statements = count_statements(client_no_auth, f"/games/{game['id']}")
+
+    assert first.json() == second.json() == game
+    # The catalog version the cache syncs against, then the game, its equipment and its settings
+    assert first_statements == 4
+    assert second_statements == 0
+
+
+def test_get_game_by_id_cache_is_invalidated_by_writes(client_with_auth, client_no_auth):
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+    client_no_auth.get(f"/games/{game['id']}")
+
+    client_with_auth.patch(f"/games/{game['id']}", json={"name": "Slapjack"})
+    assert client_no_auth.get(f"/games/{game['id']}").json()["name"] == "Slapjack"
+
+    client_with_auth.post(f"/games/{game['id']}/upvote")
+    assert client_no_auth.get(f"/games/{game['id']}").json()["upvotes"] == 1
+
+    client_with_auth.patch(f"/games/{game['id']}/visibility", json={"is_public": False})
+    assert client_no_auth.get(f"/games/{game['id']}").status_code == 403
+
+    client_with_auth.delete(f"/games/{game['id']}")
+    assert client_no_auth.get(f"/games/{game['id']}").status_code == 404
+
+
+def test_cached_private_game_still_checks_visibility(client_with_auth, db, test_user):
+    created_game = create_private_game(client_with_auth)
+
+    def override_get_current_user_optional():
+        return test_user
+
+    app.dependency_overrides[get_current_user_optional] = override_get_current_user_optional
+    assert client_with_auth.get(f"/games/{created_game['id']}").status_code == 200
+    del app.dependency_overrides[get_current_user_optional]
+
+    assert client_with_auth.get(f"/games/{created_game['id']}").status_code == 403
+
+
+def test_get_games_conditional_get(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {"name": "Snap"})
+
+    first = client_no_auth.get("/games/")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "public, max-age=0, must-revalidate"
+
+    not_modified, statements = count_statements(client_no_auth, "/games/", {"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert statements == 0
+
+    assert client_no_auth.get("/games/?limit=1", headers={"If-None-Match": etag}).status_code == 200
+
+    create_public_game(client_with_auth, {"name": "Slapjack"})
+    changed = client_no_auth.get("/games/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_get_games_etag_follows_writes_made_elsewhere(client_with_auth, client_no_auth, db, monkeypatch):
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+    monkeypatch.setattr(config, "CATALOG_VERSION_TTL_SECONDS", 0)
+    etag = client_no_auth.get("/games/").headers["ETag"]
+
+    # As another worker or an out-of-process job writes: straight to the database, nothing bumped here
+    db.query(Game).filter(Game.id == game["id"]).update({"upvotes": 3, "last_updated": datetime.now(timezone.utc)})
+    db.commit()
+
+    changed = client_no_auth.get("/games/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()[0]["upvotes"] == 3
+
+
+def test_get_game_by_id_conditional_get(client_with_auth, client_no_auth):
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+
+    etag = client_no_auth.get(f"/games/{game['id']}").headers["ETag"]
+    not_modified, statements = count_statements(client_no_auth, f"/games/{game['id']}", {"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert statements == 0
+
+    client_with_auth.patch(f"/games/{game['id']}", json={"name": "Slapjack"})
+    assert client_no_auth.get(f"/games/{game['id']}", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_game_list_response_is_wire_identical_to_fastapi_serialisation(client_with_auth, db):
+    create_public_game(client_with_auth, {"name": "Pétanque   \"quoted\"", "rules": "Line one\nLine two\t😀",
+                                   "difficulty": None, "game_setting": []})
+    create_public_game(client_with_auth, {"name": "Snap", "image_url": "https://example.com/snap.png"})
+    games = fetch_games_in_order(db, [game.id for game in db.query(Game).order_by(Game.name)])
+
+    validated = [GameRead.model_validate(map_game_to_read(game).model_dump()) for game in games]
+    expected = json.dumps(TypeAdapter(List[GameRead]).dump_python(validated, mode="json"),
+                          ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+    assert game_list_response([map_game_to_read(game, validate=False) for game in games]).body == expected
+
+
+def test_get_game_by_id_cache_follows_writes_made_elsewhere(client_with_auth, client_no_auth, db, monkeypatch):
+    monkeypatch.setattr(config, "CATALOG_VERSION_TTL_SECONDS", 0)
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+    assert client_no_auth.get(f"/games/{game['id']}").status_code == 200
+    assert client_no_auth.get("/games/batch", params={"ids": [game["id"]]}).json() == [game]
+
+    # Made private by another worker, which can't invalidate this process's cache
+    db.query(Game).filter(Game.id == game["id"]).update(
+        {"is_public": False, "last_updated": datetime.now(timezone.utc)}, synchronize_session=False)
+    db.commit()
+
+    assert client_no_auth.get(f"/games/{game['id']}").status_code == 403
+    assert client_no_auth.get("/games/batch", params={"ids": [game["id"]]}).json() == []
+
+
+def test_get_games_batch_preserves_requested_order(client_with_auth, client_no_auth):
+    games = [create_public_game(client_with_auth, {"name": f"Batch {i}"}) for i in range(4)]
+    ids = [games[2]["id"], "missing", games[0]["id"], games[3]["id"], games[0]["id"]]
+
+    response, statements = count_statements(client_no_auth, "/games/batch?" + "&".join(f"ids={i}" for i in ids))
+
+    assert response.status_code == 200
+    assert response.json() == [games[2], games[0], games[3]]
+    # The catalog version the cache syncs against, then the games, their equipment and their settings
+    assert statements == 4
+
+    # Found games are now in the detail cache; only the unknown id is looked up again
+    _, statements = count_statements(client_no_auth, "/games/batch?" + "&".join(f"ids={i}" for i in ids))
+    assert statements == 1
+
+
+def test_get_games_batch_applies_private_game_visibility(client_with_auth, db, test_user):
+    public_game = create_public_game(client_with_auth)
+    private_game = create_private_game(client_with_auth)
+    url = f"/games/batch?ids={private_game['id']}&ids={public_game['id']}"
+
+    assert [game["id"] for game in client_with_auth.get(url).json()] == [public_game["id"]]
+
+    app.dependency_overrides[get_current_user_optional] = lambda: test_user
+    assert [game["id"] for game in client_with_auth.get(url).json()] == [private_game["id"], public_game["id"]]
+    del app.dependency_overrides[get_current_user_optional]
+
+
+def test_get_games_batch_rejects_too_many_ids(client_no_auth, monkeypatch):
+    monkeypatch.setattr(games_api, "BATCH_FETCH_MAX_IDS", 2)
+    response = client_no_auth.get("/games/batch?ids=a&ids=b&ids=c")
+    assert response.status_code == 400
+
+
+def test_get_games_sparse_fields(client_with_auth, client_no_auth):
+    game = create_public_game(client_with_auth, {"name": "Sparse"})
+    # Reads the catalog version, which is then reused for CATALOG_VERSION_TTL_SECONDS
+    client_no_auth.get("/games/")
+
+    response, statements = record_statements(client_no_auth, "/games/?fields=name,game_type,player_count,upvotes")
+
+    assert response.status_code == 200
+    assert response.json() == [{
+        "name": "Sparse", "game_type": game["game_type"], "player_count": game["player_count"], "upvotes": 0,
+        "id": game["id"],
+    }]
+    # Page of ids, then the projected rows; no text columns and no child tables
+    assert len(statements) == 2
+    assert "games.rules" not in statements[1] and "games.setup" not in statements[1]
+
+
+def test_get_games_sparse_fields_with_children(client_with_auth, client_no_auth):
+    game = create_public_game(client_with_auth, {"name": "Sparse"})
+
+    response = client_no_auth.get("/games/", params={"fields": "equipment,contributor"})
+
+    assert response.json() == [{"equipment": game["equipment"], "id": game["id"],
+                                "contributor": game["contributor"]}]
+
+
+def test_get_games_rejects_unknown_fields(client_no_auth):
+    response = client_no_auth.get("/games/", params={"fields": "name,secret"})
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
+
+
+def test_get_games_filters_by_duration_range(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {"name": "Quick", "duration": "5-10 minutes"})
+    create_public_game(client_with_auth, {"name": "Medium", "duration": "30-45 minutes"})
+    epic = create_public_game(client_with_auth, {"name": "Epic", "duration": "Over 3 hours"})
+    create_public_game(client_with_auth, {"name": "Unknown", "duration": "As long as you like"})
+
+    def names(params):
+        return [game["name"] for game in client_no_auth.get("/games/", params=params).json()]
+
+    assert names({"max_duration": 30}) == ["Quick"]
+    assert names({"min_duration": 30}) == ["Epic", "Medium"]
+    assert names({"min_duration": 10, "max_duration": 60}) == ["Medium"]
+
+    client_with_auth.patch(f"/games/{epic['id']}", json={"duration": "10-15 minutes"})
+    assert names({"max_duration": 30}) == ["Epic", "Quick"]
+    assert names({"min_duration": 5, "max_duration": 45}) == ["Epic", "Medium", "Quick"]
+
+
+def test_get_games_filters_by_exact_player_count(client_with_auth, client_no_auth):
+    create_public_game(client_with_auth, {"name": "Duel", "player_count": {"min_players": 2, "max_players": 2}})
+    create_public_game(client_with_auth, {"name": "Party", "player_count": {"min_players": 4, "max_players": 12}})
+    create_public_game(client_with_auth, {"name": "Family", "player_count": {"min_players": 2, "max_players": 6}})
+
+    def names(players):
+        return [game["name"] for game in client_no_auth.get("/games/", params={"players": players}).json()]
+
+    assert names(2) == ["Family", "Duel"]
+    assert names(6) == ["Family", "Party"]
+    assert names(12) == ["Party"]
+    assert names(13) == []
+
+
+@pytest.fixture
+def signed_in(test_user):
+    """Makes the optional-auth endpoints see test_user, as if a token were sent."""
+    app.dependency_overrides[get_current_user_optional] = lambda: test_user
+    yield
+    app.dependency_overrides.pop(get_current_user_optional, None)
+
+
+def test_get_games_is_favourited_is_null_when_anonymous(client_with_auth, client_no_auth):
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+    client_with_auth.post(f"/games/{game['id']}/upvote")
+
+    response = client_no_auth.get("/games/")
+    assert [game["is_favourited"] for game in response.json()] == [None]
+    assert response.headers["Cache-Control"] == "public, max-age=0, must-revalidate"
+
+
+def test_get_games_flags_favourites_with_one_query(client_with_auth, signed_in):
+    games = [create_public_game(client_with_auth, {"name": f"Game {i}"}) for i in range(4)]
+    client_with_auth.post(f"/games/{games[1]['id']}/upvote")
+    client_with_auth.post(f"/favourites/{games[3]['id']}")
+    client_with_auth.get("/games/")  # reloads test_user, expired by the commits above
+
+    small, small_statements = count_statements(client_with_auth, "/games/?limit=2")
+    large, large_statements = count_statements(client_with_auth, "/games/?limit=4")
+
+    assert [game["is_favourited"] for game in large.json()] == [True, False, True, False]
+    assert large.headers["Cache-Control"] == "private, no-cache"
+    # The user's favourites version, the id page, the rows, equipment, settings and one user_favourites IN-query
+    assert small_statements == large_statements == 6
+
+
+def test_get_games_skips_favourites_when_not_selected(client_with_auth, signed_in):
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+    client_with_auth.post(f"/games/{game['id']}/upvote")
+
+    assert client_with_auth.get("/games/", params={"fields": "name"}).json() == [{"id": game["id"], "name": "Snap"}]
+    assert client_with_auth.get("/games/", params={"fields": "name,is_favourited"}).json() == [
+        {"id": game["id"], "name": "Snap", "is_favourited": True}]
+
+
+def test_get_games_etag_follows_buffered_favourites(client_with_auth, db, signed_in, monkeypatch):
+    monkeypatch.setattr(config, "UPVOTE_BUFFER_ENABLED", True)
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+    etag = client_with_auth.get("/games/").headers["ETag"]
+
+    # The vote waits in the buffer, leaving the catalog version where it was
+    client_with_auth.post(f"/games/{game['id']}/upvote")
+    favourited = client_with_auth.get("/games/", headers={"If-None-Match": etag})
+    assert favourited.status_code == 200
+    assert [game["is_favourited"] for game in favourited.json()] == [True]
+
+    client_with_auth.delete(f"/favourites/{game['id']}")
+    unfavourited = client_with_auth.get("/games/", headers={"If-None-Match": favourited.headers["ETag"]})
+    assert unfavourited.status_code == 200
+    assert [game["is_favourited"] for game in unfavourited.json()] == [False]
+    # Leaves nothing for the app's shutdown to flush
+    flush_votes(db)
+
+
+def test_get_game_by_id_flags_favourite(client_with_auth, client_no_auth, signed_in):
+    game = create_public_game(client_with_auth, {"name": "Snap"})
+    before = client_with_auth.get(f"/games/{game['id']}")
+    assert before.json()["is_favourited"] is False
+    assert before.headers["Cache-Control"] == "private, no-cache"
+
+    client_with_auth.post(f"/games/{game['id']}/upvote")
+    after = client_with_auth.get(f"/games/{game['id']}")
+    assert after.json()["is_favourited"] is True
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert client_with_auth.get(f"/games/{game['id']}",
+                                headers={"If-None-Match": after.headers["ETag"]}).status_code == 304
+
+    batch = client_with_auth.get("/games/batch", params={"ids": [game["id"]]})
+    assert [game["is_favourited"] for game in batch.json()] == [True]
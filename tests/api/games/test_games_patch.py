@@ -1,4 +1,7 @@
+import pytest
+
 from src.db.tables import Game, GameEquipment, GameSetting
+from src.utils import config
 from tests.utils import valid_public_game_payload
 
 
@@ -55,3 +58,24 @@ def test_patch_game_no_changes(client_with_auth, db):
     updated_game = patch_resp.json()
 
     assert updated_game == created_game
+
+
+@pytest.mark.parametrize("update", [{"max_players": 40000}, {"min_players": 1}, {"min_players": 9, "max_players": 3}])
+def test_patch_game_rejects_out_of_range_player_counts(client_with_auth, client_no_auth, monkeypatch, update):
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    game_id = client_with_auth.post("/games/", json=valid_public_game_payload()).json()["id"]
+    client_no_auth.get("/games/")
+
+    assert client_with_auth.patch(f"/games/{game_id}", json=update).status_code == 422
+
+    # Nothing was written, so every read path still works
+    assert client_no_auth.get(f"/games/{game_id}").json()["player_count"] == {"min_players": 2, "max_players": 6}
+    assert client_no_auth.get("/games/").status_code == 200
+    assert client_no_auth.get(f"/games/{game_id}/similar").status_code == 200
+
+
+def test_patch_game_checks_player_range_against_stored_counts(client_with_auth):
+    game_id = client_with_auth.post("/games/", json=valid_public_game_payload()).json()["id"]
+
+    assert client_with_auth.patch(f"/games/{game_id}", json={"min_players": 9}).status_code == 400
+    assert client_with_auth.get(f"/games/{game_id}").json()["player_count"]["min_players"] == 2
@@ -0,0 +1,110 @@
+import pytest
+
+from src.db.tables import Game
+from src.services.catalog_snapshot import get_catalog_snapshot
+from src.utils import config
+from tests.utils import valid_public_game_payload, valid_private_game_payload
+
+
+@pytest.fixture(autouse=True, params=[False, True], ids=["sql", "snapshot"])
+def snapshot_enabled(request, monkeypatch):
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", request.param)
+    return request.param
+
+
+def game(name, **overrides):
+    payload = {"name": name, "equipment": ["None"], "game_setting": ["Party"], "duration": "15-30 minutes",
+               "age_rating": "All Ages", "difficulty": "Easy", "player_count": {"min_players": 2, "max_players": 8}}
+    payload.update(overrides)
+    return valid_public_game_payload(payload)
+
+
+@pytest.fixture
+def catalog(client_with_auth):
+    games = [
+        game("Charades"),
+        game("Poker", equipment=["Standard Deck of Cards", "Poker Chips"], age_rating="18+", difficulty="Hard"),
+        game("Snap", equipment=["Standard Deck of Cards"], duration="5-10 minutes", age_rating="3+"),
+        game("Mafia", game_setting=["Party", "Large Group"], duration="30-45 minutes",
+             player_count={"min_players": 6, "max_players": 20}),
+        game("Risk", equipment=["Table"], duration="Over 3 hours", difficulty="Expert"),
+        game("Pictionary", equipment=["Paper", "Pen"], game_setting=["Game Night"], age_rating="7+",
+             difficulty="Medium"),
+    ]
+    created = {g["name"]: client_with_auth.post("/games/", json=g).json() for g in games}
+    client_with_auth.post("/games/", json=valid_private_game_payload({"name": "Secret", "equipment": ["None"]}))
+    # Upvotes set the ranking
+    client_with_auth.post(f"/games/{created['Snap']['id']}/upvote")
+    return created
+
+
+def plan(client, **body):
+    response = client.post("/games/plan", json={"players": 4, "time_available_minutes": 120, **body})
+    assert response.status_code == 200
+    data = response.json()
+    return [g["name"] for g in data["games"]], [g["name"] for g in data["schedule"]], data["schedule_minutes"]
+
+
+def test_plan_requires_only_equipment_on_hand(client_no_auth, catalog):
+    games, _, _ = plan(client_no_auth)
+    assert set(games) == {"Charades"}
+
+    games, _, _ = plan(client_no_auth, equipment=["Standard Deck of Cards", "Poker Chips", "Paper", "Pen"])
+    assert games[0] == "Snap"
+    assert set(games) == {"Snap", "Charades", "Poker", "Pictionary"}
+
+
+def test_plan_applies_group_constraints(client_no_auth, catalog):
+    everything = ["Standard Deck of Cards", "Poker Chips", "Paper", "Pen", "Table"]
+
+    assert "Mafia" not in plan(client_no_auth, equipment=everything)[0]
+    assert "Mafia" in plan(client_no_auth, players=6, equipment=everything)[0]
+    # An open-ended duration fits once its lower bound does
+    assert "Risk" not in plan(client_no_auth, equipment=everything, time_available_minutes=179)[0]
+    assert "Risk" in plan(client_no_auth, equipment=everything, time_available_minutes=180)[0]
+    assert set(plan(client_no_auth, equipment=everything, youngest_age=7)[0]) == {"Charades", "Snap", "Pictionary"}
+    assert set(plan(client_no_auth, equipment=everything, max_difficulty="Easy")[0]) == {"Charades", "Snap"}
+    assert set(plan(client_no_auth, equipment=everything, setting="Game Night")[0]) == {"Pictionary"}
+    assert set(plan(client_no_auth, equipment=everything, time_available_minutes=10)[0]) == {"Snap"}
+
+
+def test_plan_schedule_fits_time_budget(client_no_auth, catalog):
+    everything = ["Standard Deck of Cards", "Poker Chips", "Paper", "Pen"]
+
+    games, schedule, minutes = plan(client_no_auth, equipment=everything, time_available_minutes=45)
+
+    assert len(games) == 4
+    assert schedule[0] == "Snap"
+    assert len(schedule) == 2
+    assert minutes == 40
+    assert minutes <= 45
+
+
+def test_plan_schedule_gives_open_ended_games_the_rest_of_the_time(client_with_auth, client_no_auth, catalog):
+    client_with_auth.post(f"/games/{catalog['Charades']['id']}/upvote")
+
+    games, schedule, minutes = plan(client_no_auth, equipment=["Table"], time_available_minutes=240)
+
+    assert games == ["Charades", "Risk"]
+    assert schedule == ["Charades", "Risk"]
+    assert minutes == 240
+
+
+def test_plan_leaves_out_games_hidden_elsewhere(client_no_auth, catalog, db):
+    get_catalog_snapshot(db)
+    # Made private by another process, before this one's snapshot has caught up
+    db.query(Game).filter(Game.name == "Snap").update({"is_public": False}, synchronize_session=False)
+    db.commit()
+
+    games, schedule, _ = plan(client_no_auth, equipment=["Standard Deck of Cards"], limit=1)
+    assert games == ["Charades"]
+    assert schedule == ["Charades"]
+
+
+def test_plan_validates_request(client_no_auth):
+    response = client_no_auth.post("/games/plan", json={"players": 0, "time_available_minutes": 30})
+    assert response.status_code == 422
+
+    response = client_no_auth.post("/games/plan", json={"players": 4, "time_available_minutes": 30,
+                                                        "equipment": ["Spaceship"]})
+    assert response.status_code == 422
@@ -1,5 +1,13 @@
+import asyncio
+from contextlib import nullcontext
+
+from src.db.tables import Game, UserFavourites
+from src.main import flush_votes_periodically
 from src.models.enums.equipment_enum import GameEquipmentEnum
 from src.models.enums.game_setting_enum import GameSettingEnum
+from src.models.enums.role_enum import Role
+from src.services.trending import recompute_trending_scores
+from src.utils import config
 from tests.api.games.helper import create_public_game, upvote_game
 from tests.conftest import client_with_auth
 from tests.utils import valid_public_game_payload
@@ -49,3 +57,53 @@ def test_remove_upvote_game(client_with_auth):
 
     data = response.json()
     assert data["upvotes"] == 0
+
+
+def test_upvote_game_not_found(client_with_auth):
+    assert upvote_game(client_with_auth, "00000000-0000-0000-0000-000000000000").status_code == 404
+
+
+def test_upvote_counts_on_top_of_other_votes(client_with_auth, db, second_user):
+    game = create_public_game(client_with_auth)
+    db.add(UserFavourites(game_id=game["id"], user_id=second_user.id))
+    db.query(Game).filter(Game.id == game["id"]).update({"upvotes": Game.upvotes + 1})
+    db.commit()
+
+    assert upvote_game(client_with_auth, game["id"]).json()["upvotes"] == 2
+    assert upvote_game(client_with_auth, game["id"]).json()["upvotes"] == 1
+
+
+def test_buffered_upvotes_are_written_on_flush(client_with_auth, db, test_user, monkeypatch):
+    monkeypatch.setattr(config, "UPVOTE_BUFFER_ENABLED", True)
+    monkeypatch.setattr(config, "UPVOTE_BUFFER_FLUSH_SECONDS", 3600)
+    game = create_public_game(client_with_auth)
+
+    assert upvote_game(client_with_auth, game["id"]).json()["upvotes"] == 1
+    db.expire_all()
+    assert db.query(Game.upvotes).filter(Game.id == game["id"]).scalar() == 0
+
+    test_user.role = Role.admin
+    db.commit()
+    assert client_with_auth.post("/admin/jobs/flush-votes").json() == {"job": "flush-votes", "rows": 1}
+    db.expire_all()
+    assert db.query(Game.upvotes).filter(Game.id == game["id"]).scalar() == 1
+    # The buffered trending weight matches a recompute from the favourites
+    assert recompute_trending_scores(db) == 0
+
+
+def test_buffered_upvotes_are_flushed_without_further_votes(client_with_auth, db, monkeypatch):
+    monkeypatch.setattr(config, "UPVOTE_BUFFER_ENABLED", True)
+    monkeypatch.setattr(config, "UPVOTE_BUFFER_FLUSH_SECONDS", 3600)
+    game = create_public_game(client_with_auth)
+    upvote_game(client_with_auth, game["id"])
+
+    monkeypatch.setattr(config, "UPVOTE_BUFFER_FLUSH_SECONDS", 0.01)
+
+    async def run_flusher():
+        flusher = asyncio.create_task(flush_votes_periodically(lambda: nullcontext(db)))
+        await asyncio.sleep(0.1)
+        flusher.cancel()
+
+    asyncio.run(run_flusher())
+    db.expire_all()
+    assert db.query(Game.upvotes).filter(Game.id == game["id"]).scalar() == 1
@@ -0,0 +1,88 @@
+import pytest
+
+from src.db.tables import Game
+from src.services.catalog_snapshot import get_catalog_snapshot
+from src.utils import config
+from tests.utils import valid_public_game_payload, valid_private_game_payload
+
+
+@pytest.fixture(autouse=True, params=[False, True], ids=["sql", "snapshot"])
+def snapshot_enabled(request, monkeypatch):
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", request.param)
+    return request.param
+
+
+@pytest.fixture
+def catalog(client_with_auth):
+    games = [
+        valid_public_game_payload({"name": f"Card Game {i}", "game_type": "Card"}) for i in range(4)
+    ] + [
+        valid_public_game_payload({"name": "Liar's Dice", "game_type": "Dice"}),
+        valid_private_game_payload({"name": "Secret Dice", "game_type": "Dice"}),
+    ]
+    return [client_with_auth.post("/games/", json=game).json() for game in games]
+
+
+def test_random_game_is_public(client_no_auth, catalog):
+    public_ids = {game["id"] for game in catalog if game["is_public"]}
+    for _ in range(10):
+        response = client_no_auth.get("/games/random")
+        assert response.status_code == 200
+        assert response.json()["id"] in public_ids
+        assert response.headers["Cache-Control"] == "no-store"
+        assert "X-Next-Cursor" not in response.headers
+
+
+def test_random_game_honours_filters(client_no_auth, catalog):
+    for _ in range(5):
+        assert client_no_auth.get("/games/random", params={"game_type": "Dice"}).json()["name"] == "Liar's Dice"
+    assert client_no_auth.get("/games/random", params={"q": "liar"}).json()["name"] == "Liar's Dice"
+
+
+def test_random_game_not_found(client_no_auth, catalog):
+    assert client_no_auth.get("/games/random", params={"game_type": "Drinking"}).status_code == 404
+
+
+def test_seeded_walk_visits_every_game_once(client_no_auth, catalog):
+    public_ids = {game["id"] for game in catalog if game["is_public"]}
+
+    seen = []
+    params = {"seed": 7}
+    for _ in range(len(public_ids)):
+        response = client_no_auth.get("/games/random", params=params)
+        seen.append(response.json()["id"])
+        params = {"cursor": response.headers["X-Next-Cursor"]}
+
+    assert sorted(seen) == sorted(public_ids)
+    # The same seed replays the same order
+    assert client_no_auth.get("/games/random", params={"seed": 7}).json()["id"] == seen[0]
+
+
+def test_seeded_walk_with_filters(client_no_auth, catalog):
+    card_ids = {game["id"] for game in catalog if game["game_type"] == "Card"}
+
+    seen = set()
+    params = {"seed": 3, "game_type": "Card"}
+    for _ in range(len(card_ids)):
+        response = client_no_auth.get("/games/random", params=params)
+        seen.add(response.json()["id"])
+        params = {"cursor": response.headers["X-Next-Cursor"], "game_type": "Card"}
+
+    assert seen == card_ids
+
+
+def test_random_game_rejects_invalid_cursor(client_no_auth, catalog):
+    assert client_no_auth.get("/games/random", params={"cursor": "not-a-cursor"}).status_code == 400
+    cursor = client_no_auth.get("/games/", params={"limit": 1}).headers["X-Next-Cursor"]
+    assert client_no_auth.get("/games/random", params={"cursor": cursor}).status_code == 400
+
+
+def test_random_game_skips_games_hidden_elsewhere(client_no_auth, catalog, db):
+    get_catalog_snapshot(db)
+    # Made private by another process, before this one's snapshot has caught up
+    db.query(Game).filter(Game.game_type == "Card").update({"is_public": False}, synchronize_session=False)
+    db.commit()
+
+    for _ in range(10):
+        assert client_no_auth.get("/games/random").json()["name"] == "Liar's Dice"
+    assert client_no_auth.get("/games/random", params={"game_type": "Card"}).status_code == 404
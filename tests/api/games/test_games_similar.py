@@ -0,0 +1,76 @@
+import pytest
+
+from src.api.users import get_current_user_optional
+from src.db.tables import Game
+from src.main import app
+from src.services.catalog_snapshot import get_catalog_snapshot
+from tests.utils import valid_public_game_payload, valid_private_game_payload
+
+
+def game(name, **overrides):
+    payload = {"name": name, "game_type": "Card", "equipment": ["Standard Deck of Cards"],
+               "game_setting": ["Game Night"], "duration": "15-30 minutes", "difficulty": "Easy",
+               "player_count": {"min_players": 2, "max_players": 6}}
+    payload.update(overrides)
+    return payload
+
+
+@pytest.fixture
+def catalog(client_with_auth):
+    games = [
+        game("Snap"),
+        game("Slapjack", game_setting=["Game Night", "Party"]),
+        game("Poker", equipment=["Standard Deck of Cards", "Poker Chips"], difficulty="Hard",
+             duration="1-2 hours", player_count={"min_players": 2, "max_players": 10}),
+        game("Charades", game_type="Improv", equipment=["None"], game_setting=["Party"], difficulty=None,
+             duration="30-45 minutes", player_count={"min_players": 4, "max_players": 20}),
+    ]
+    created = {g["name"]: client_with_auth.post("/games/", json=valid_public_game_payload(g)).json() for g in games}
+    created["Hidden"] = client_with_auth.post("/games/", json=valid_private_game_payload(game("Hidden"))).json()
+    return created
+
+
+def similar_names(client, game_id, **params):
+    response = client.get(f"/games/{game_id}/similar", params=params)
+    assert response.status_code == 200
+    return [g["name"] for g in response.json()]
+
+
+def test_similar_games_ranked_by_feature_similarity(client_no_auth, catalog):
+    assert similar_names(client_no_auth, catalog["Snap"]["id"]) == ["Slapjack", "Poker", "Charades"]
+    assert similar_names(client_no_auth, catalog["Snap"]["id"], limit=1) == ["Slapjack"]
+    assert similar_names(client_no_auth, catalog["Charades"]["id"])[0] == "Slapjack"
+
+
+def test_similar_games_follow_writes(client_with_auth, client_no_auth, catalog):
+    assert similar_names(client_no_auth, catalog["Snap"]["id"])[0] == "Slapjack"
+
+    client_with_auth.patch(f"/games/{catalog['Poker']['id']}", json={
+        "difficulty": "Easy", "duration": "15-30 minutes", "max_players": 6, "equipment": ["Standard Deck of Cards"],
+        "game_setting": ["Game Night"],
+    })
+    client_with_auth.delete(f"/games/{catalog['Slapjack']['id']}")
+
+    assert similar_names(client_no_auth, catalog["Snap"]["id"]) == ["Poker", "Charades"]
+
+
+def test_similar_games_visibility(client_with_auth, client_no_auth, catalog, test_user):
+    hidden_id = catalog["Hidden"]["id"]
+    assert client_no_auth.get(f"/games/{hidden_id}/similar").status_code == 403
+    assert client_no_auth.get("/games/missing/similar").status_code == 404
+
+    # The owner can look up games similar to their private game, but only public games come back
+    app.dependency_overrides[get_current_user_optional] = lambda: test_user
+    assert similar_names(client_with_auth, hidden_id)[0] == "Snap"
+    assert "Hidden" not in similar_names(client_with_auth, catalog["Snap"]["id"])
+    del app.dependency_overrides[get_current_user_optional]
+
+
+def test_similar_games_leave_out_games_hidden_elsewhere(client_no_auth, catalog, db):
+    get_catalog_snapshot(db)
+    # Made private by another process, before this one's snapshot has caught up
+    db.query(Game).filter(Game.name == "Slapjack").update({"is_public": False}, synchronize_session=False)
+    db.commit()
+
+    assert similar_names(client_no_auth, catalog["Snap"]["id"], limit=1) == ["Poker"]
+    assert similar_names(client_no_auth, catalog["Snap"]["id"]) == ["Poker", "Charades"]
@@ -0,0 +1,153 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.db.tables import Game, GameEquipment, GameSetting, GameTombstone
+from src.utils import config
+from tests.utils import valid_public_game_payload, valid_private_game_payload
+
+LISTING_QUERIES = [
+    {},
+    {"limit": 2},
+    {"limit": 2, "offset": 1},
+    {"name": "dice"},
+    {"game_type": "Dice"},
+    {"age_rating": "12+"},
+    {"min_players": 3},
+    {"max_players": 6},
+    {"players": 3},
+    {"players": 9},
+    {"duration": "30"},
+    {"max_duration": 30},
+    {"min_duration": 30},
+    {"min_duration": 5, "max_duration": 45},
+    {"difficulty": "Hard"},
+    {"setting": "party"},
+    {"equipment": "deck"},
+    {"sort": "top"},
+    {"sort": "top", "limit": 1},
+    {"sort": "trending"},
+    {"sort": "trending", "limit": 1},
+]
+
+
+@pytest.fixture
+def catalog(client_with_auth):
+    games = [
+        valid_public_game_payload({"name": "Liar's Dice", "game_type": "Dice", "equipment": ["Six-Sided Dice"],
+                                   "player_count": {"min_players": 2, "max_players": 6}}),
+        valid_public_game_payload({"name": "Snap", "age_rating": "12+", "difficulty": "Hard",
+                                   "game_setting": ["Party"], "player_count": {"min_players": 3, "max_players": 8}}),
+        valid_public_game_payload({"name": "Pirate Dice", "game_type": "Dice", "duration": "Under 5 minutes",
+                                   "equipment": ["Multiple Dice", "Dice Cup"], "game_setting": ["House Party"]}),
+        valid_public_game_payload({"name": "Cheat", "player_count": {"min_players": 3, "max_players": 10}}),
+        valid_private_game_payload({"name": "Secret Dice", "game_type": "Dice"}),
+    ]
+    created = [client_with_auth.post("/games/", json=game).json() for game in games]
+    client_with_auth.post(f"/games/{created[1]['id']}/upvote")
+    return created
+
+
+def list_game_ids(client, params):
+    response = client.get("/games/", params=params)
+    assert response.status_code == 200
+    return [game["id"] for game in response.json()], response.headers.get("X-Next-Cursor")
+
+
+@pytest.mark.parametrize("params", LISTING_QUERIES)
+def test_snapshot_listing_matches_sql(client_no_auth, catalog, monkeypatch, params):
+    expected = list_game_ids(client_no_auth, params)
+
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    assert list_game_ids(client_no_auth, params) == expected
+
+    if expected[1]:
+        # Cursors are interchangeable between the two paths
+        next_page = {**params, "cursor": expected[1]}
+        monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", False)
+        expected_next = list_game_ids(client_no_auth, next_page)
+        monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+        assert list_game_ids(client_no_auth, next_page) == expected_next
+
+
+def test_snapshot_follows_writes(client_with_auth, client_no_auth, catalog, monkeypatch):
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    assert len(list_game_ids(client_no_auth, {"game_type": "Dice"})[0]) == 2
+
+    client_with_auth.patch(f"/games/{catalog[0]['id']}/visibility", json={"is_public": False})
+    client_with_auth.patch(f"/games/{catalog[3]['id']}", json={"game_type": "Dice"})
+    created = client_with_auth.post("/games/", json=valid_public_game_payload({"game_type": "Dice"})).json()
+    client_with_auth.delete(f"/games/{catalog[2]['id']}")
+
+    assert list_game_ids(client_no_auth, {"game_type": "Dice"})[0] == [created["id"], catalog[3]["id"]]
+
+
+def test_snapshot_follows_writes_made_elsewhere(client_no_auth, catalog, db, monkeypatch):
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    monkeypatch.setattr(config, "CATALOG_VERSION_TTL_SECONDS", 0)
+    assert len(list_game_ids(client_no_auth, {"game_type": "Dice"})[0]) == 2
+
+    # As another worker or an out-of-process job writes: straight to the database, no hooks run here
+    now = datetime.now(timezone.utc)
+    db.query(Game).filter(Game.id == catalog[0]["id"]).update({"is_public": False, "last_updated": now})
+    db.query(Game).filter(Game.id == catalog[3]["id"]).update({"upvotes": 5, "last_updated": now})
+    db.query(GameEquipment).filter(GameEquipment.game_id == catalog[2]["id"]).delete()
+    db.query(GameSetting).filter(GameSetting.game_id == catalog[2]["id"]).delete()
+    db.query(Game).filter(Game.id == catalog[2]["id"]).delete()
+    db.add(GameTombstone(game_id=catalog[2]["id"], deleted_at=now))
+    db.commit()
+
+    assert list_game_ids(client_no_auth, {"game_type": "Dice"})[0] == []
+    assert list_game_ids(client_no_auth, {"sort": "top"})[0] == [catalog[3]["id"], catalog[1]["id"]]
+
+
+def test_snapshot_verify_mode_returns_sql_result(client_no_auth, catalog, monkeypatch):
+    expected = list_game_ids(client_no_auth, {})
+
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_VERIFY", True)
+    assert list_game_ids(client_no_auth, {}) == expected
+
+
+@pytest.mark.parametrize("params", [
+    {"name": "%"},
+    {"name": "_"},
+    {"name": "0% d"},
+    {"name": "s_n"},
+    {"duration": "%"},
+    {"duration": "_"},
+    {"setting": "%"},
+    {"equipment": "_"},
+])
+def test_snapshot_listing_matches_sql_for_like_wildcards(client_with_auth, client_no_auth, monkeypatch, params):
+    # % and _ are plain characters to both paths, not LIKE wildcards
+    games = [
+        valid_public_game_payload({"name": "100% Dice"}),
+        valid_public_game_payload({"name": "Yes_No"}),
+        valid_public_game_payload({"name": "Yes-No"}),
+    ]
+    created = [client_with_auth.post("/games/", json=game).json() for game in games]
+    expected = list_game_ids(client_no_auth, params)
+
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    assert list_game_ids(client_no_auth, params) == expected
+    if "name" in params:
+        assert len(expected[0]) == 1 and expected[0][0] in {game["id"] for game in created}
+    else:
+        assert expected[0] == []
+
+
+@pytest.mark.parametrize("fields", [None, "name"])
+def test_snapshot_listing_drops_games_hidden_elsewhere(client_no_auth, catalog, db, monkeypatch, fields):
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    monkeypatch.setattr(config, "CATALOG_VERSION_TTL_SECONDS", 3600)
+    params = {"limit": 2, **({"fields": fields} if fields else {})}
+    assert list_game_ids(client_no_auth, params)[0] == [catalog[3]["id"], catalog[2]["id"]]
+
+    # Made private by another process, which the snapshot hasn't caught up with yet
+    db.query(Game).filter(Game.id == catalog[3]["id"]).update({"is_public": False})
+    db.commit()
+
+    ids, next_cursor = list_game_ids(client_no_auth, params)
+    assert ids == [catalog[2]["id"], catalog[1]["id"]]
+    assert next_cursor is not None
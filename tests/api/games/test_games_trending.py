@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.db.tables import Game, UserFavourites
+from src.models.enums.role_enum import Role
+from src.services.trending import recompute_trending_scores
+from src.utils import config
+from src.utils.trending import vote_weight
+from tests.api.games.helper import create_public_game
+
+
+def trending_ids(client, params=None):
+    response = client.get("/games/", params={"sort": "trending", **(params or {})})
+    assert response.status_code == 200
+    return [game["id"] for game in response.json()], response.headers.get("X-Next-Cursor")
+
+
+def trending_score(db, game_id):
+    db.expire_all()
+    return db.query(Game.trending_score).filter(Game.id == game_id).scalar()
+
+
+def test_new_games_start_with_their_creation_weight(client_with_auth, db):
+    game_id = create_public_game(client_with_auth, {"name": "Fresh"})["id"]
+    created_at = db.query(Game.created_at).filter(Game.id == game_id).scalar()
+
+    assert trending_score(db, game_id) == pytest.approx(vote_weight(created_at))
+
+
+def test_votes_lift_a_game_above_newer_ones(client_with_auth, client_no_auth):
+    voted = create_public_game(client_with_auth, {"name": "Voted"})["id"]
+    newer = create_public_game(client_with_auth, {"name": "Newer"})["id"]
+    client_with_auth.post(f"/games/{voted}/upvote")
+
+    first_page, cursor = trending_ids(client_no_auth, {"limit": 1})
+    assert first_page == [voted]
+    assert trending_ids(client_no_auth, {"cursor": cursor}) == ([newer], None)
+
+
+def test_removing_a_vote_takes_its_weight_back(client_with_auth, db):
+    game_id = create_public_game(client_with_auth, {"name": "Toggled"})["id"]
+    initial = trending_score(db, game_id)
+
+    client_with_auth.post(f"/games/{game_id}/upvote")
+    assert trending_score(db, game_id) > initial
+    client_with_auth.post(f"/games/{game_id}/upvote")
+    assert trending_score(db, game_id) == pytest.approx(initial)
+
+
+def test_favourites_count_as_votes(client_with_auth, db):
+    game_id = create_public_game(client_with_auth, {"name": "Favourite"})["id"]
+    initial = trending_score(db, game_id)
+
+    client_with_auth.post(f"/favourites/{game_id}")
+    assert trending_score(db, game_id) > initial
+    client_with_auth.delete(f"/favourites/{game_id}")
+    assert trending_score(db, game_id) == pytest.approx(initial)
+
+
+def test_old_votes_decay(client_with_auth, client_no_auth, db, test_user, second_user):
+    once_popular = create_public_game(client_with_auth, {"name": "Once popular"})["id"]
+    popular_now = create_public_game(client_with_auth, {"name": "Popular now"})["id"]
+
+    # Two votes three half-lives ago are worth a quarter of one vote now
+    three_days_ago = datetime.now(timezone.utc) - timedelta(days=3)
+    db.add_all([UserFavourites(game_id=once_popular, user_id=user.id, created_at=three_days_ago)
+                for user in (test_user, second_user)])
+    db.add(UserFavourites(game_id=popular_now, user_id=test_user.id, created_at=datetime.now(timezone.utc)))
+    db.commit()
+    recompute_trending_scores(db)
+
+    assert trending_ids(client_no_auth)[0] == [popular_now, once_popular]
+
+
+def test_recompute_agrees_with_incremental_scores(client_with_auth, db):
+    game_ids = [create_public_game(client_with_auth, {"name": f"Game {i}"})["id"] for i in range(3)]
+    client_with_auth.post(f"/games/{game_ids[0]}/upvote")
+    client_with_auth.post(f"/favourites/{game_ids[1]}")
+
+    assert recompute_trending_scores(db) == 0
+
+
+def test_admin_can_run_recompute(client_with_auth, client_no_auth, db, test_user):
+    game_id = create_public_game(client_with_auth, {"name": "Drifted"})["id"]
+    expected = trending_score(db, game_id)
+    db.query(Game).filter(Game.id == game_id).update({"trending_score": 0.0})
+    db.commit()
+
+    assert client_with_auth.post("/admin/jobs/recompute-trending").status_code == 403
+    test_user.role = Role.admin
+    db.commit()
+    response = client_with_auth.post("/admin/jobs/recompute-trending")
+    assert response.status_code == 200
+    assert response.json() == {"job": "recompute-trending", "rows": 1}
+    assert trending_score(db, game_id) == pytest.approx(expected)
+
+
+def test_recompute_reaches_the_catalog_snapshot(client_with_auth, client_no_auth, db, monkeypatch):
+    older, newer = [create_public_game(client_with_auth, {"name": name})["id"] for name in ("Older", "Newer")]
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+    monkeypatch.setattr(config, "CATALOG_VERSION_TTL_SECONDS", 0)
+    assert trending_ids(client_no_auth)[0] == [newer, older]
+
+    # A vote lost from the scores, as the job run from cron would find it
+    db.add(UserFavourites(game_id=older, user_id=db.query(Game.contributor_id).filter(Game.id == older).scalar(),
+                          created_at=datetime.now(timezone.utc)))
+    db.commit()
+    recompute_trending_scores(db)
+
+    assert trending_ids(client_no_auth)[0] == [older, newer]
@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.mark.parametrize("url", ["/metadata/metadata", "/metadata/countries"])
+def test_get_metadata_conditional_get(client_no_auth, url):
+    response = client_no_auth.get(url)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=86400"
+
+    etag = response.headers["ETag"]
+    assert client_no_auth.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert client_no_auth.get(url, headers={"If-None-Match": f'W/{etag}, "other"'}).status_code == 304
+    assert client_no_auth.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
@@ -0,0 +1,59 @@
+import pytest
+
+from src.core.security import create_access_token
+from src.services.auth_cache import auth_cache
+from src.utils import config
+from tests.api.games.helper import count_statements, create_user
+from tests.utils import valid_user_payload
+
+
+@pytest.fixture(autouse=True)
+def auth_cache_enabled(monkeypatch):
+    monkeypatch.setattr(config, "AUTH_CACHE_ENABLED", True)
+
+
+def bearer(username):
+    return {"Authorization": f"Bearer {create_access_token({'sub': username})}"}
+
+
+def test_repeat_requests_skip_the_user_lookup(client_no_auth, test_user):
+    headers = bearer(test_user.username.upper())
+    assert client_no_auth.get("/favourites/", headers=headers).status_code == 200
+
+    # Just the favourites listing: no user SELECT
+    response, statements = count_statements(client_no_auth, "/favourites/", headers)
+    assert response.status_code == 200
+    assert statements == 1
+    assert auth_cache.stats()["hits"] == 1
+
+
+def test_profile_update_invalidates_the_cached_user(client_no_auth, test_user):
+    headers = bearer(test_user.username)
+    client_no_auth.get("/users/me", headers=headers)
+    assert auth_cache.stats()["size"] == 1
+
+    response = client_no_auth.patch("/users/me", json={"firstname": "Renamed"}, headers=headers)
+    assert response.status_code == 200
+    assert auth_cache.stats()["size"] == 0
+    assert client_no_auth.get("/users/me", headers=headers).json()["firstname"] == "Renamed"
+
+
+def test_password_update_works_for_a_cached_user(client_no_auth):
+    payload = valid_user_payload()
+    create_user(client_no_auth, payload)
+    headers = bearer(payload["username"])
+    client_no_auth.get("/users/me", headers=headers)
+
+    response = client_no_auth.patch("/users/me/password", headers=headers, json={
+        "current_password": payload["password"], "new_password": "N3w-Passw0rd!"})
+    assert response.status_code == 200
+    assert auth_cache.stats()["size"] == 0
+
+
+def test_deleted_account_token_is_rejected_at_once(client_no_auth, test_user):
+    headers = bearer(test_user.username)
+    client_no_auth.get("/users/me", headers=headers)
+
+    assert client_no_auth.delete(f"/users/{test_user.id}", headers=headers).status_code == 204
+    assert client_no_auth.get("/users/me", headers=headers).status_code == 404
+
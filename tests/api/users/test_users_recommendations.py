@@ -0,0 +1,86 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.db.tables import GameNeighbour, User, UserFavourites
+from src.models.enums.role_enum import Role
+from src.services.recommendations import rebuild_game_neighbours
+from tests.utils import valid_public_game_payload, valid_private_game_payload
+
+
+def add_user(db, name):
+    user = User(id=str(uuid.uuid4()), firstname=name, lastname="User", username=name, email=f"{name}@example.com",
+                country_of_origin="GB", created_at=datetime.now(timezone.utc))
+    db.add(user)
+    return user
+
+
+def favourite(db, user, *games):
+    for game in games:
+        db.add(UserFavourites(user_id=user.id, game_id=game["id"]))
+
+
+@pytest.fixture
+def catalog(client_with_auth, db, test_user):
+    games = {name: client_with_auth.post("/games/", json=valid_public_game_payload({"name": name})).json()
+             for name in ("Snap", "Cheat", "Poker", "Uno", "Charades")}
+    games["Hidden"] = client_with_auth.post("/games/", json=valid_private_game_payload({"name": "Hidden"})).json()
+
+    alice, bob, carol = add_user(db, "alice"), add_user(db, "bob"), add_user(db, "carol")
+    favourite(db, alice, games["Snap"], games["Cheat"], games["Poker"], games["Hidden"])
+    favourite(db, bob, games["Snap"], games["Cheat"], games["Hidden"])
+    favourite(db, carol, games["Snap"], games["Uno"])
+    favourite(db, test_user, games["Snap"])
+    db.commit()
+    return games
+
+
+def recommended_names(client):
+    response = client.get("/users/me/recommendations")
+    assert response.status_code == 200
+    return [game["name"] for game in response.json()]
+
+
+def test_rebuild_game_neighbours_scores_by_jaccard(db, catalog):
+    rebuild_game_neighbours(db, top_n=2)
+
+    neighbours = db.query(GameNeighbour).filter(GameNeighbour.game_id == catalog["Snap"]["id"]).all()
+    scores = {n.neighbour_id: n.score for n in neighbours}
+    # Snap and Cheat share alice and bob out of {test user, alice, bob, carol}; Hidden ties on score and id
+    assert len(scores) == 2
+    assert scores[catalog["Cheat"]["id"]] == pytest.approx(2 / 4)
+
+
+def test_recommendations_blend_neighbours_of_favourites(client_with_auth, db, catalog):
+    assert recommended_names(client_with_auth) == []
+
+    rebuild_game_neighbours(db)
+
+    names = recommended_names(client_with_auth)
+    assert names[0] == "Cheat"
+    assert set(names) == {"Cheat", "Poker", "Uno"}
+    assert "Snap" not in names and "Hidden" not in names
+
+
+def test_recommendations_require_auth(client_no_auth):
+    assert client_no_auth.get("/users/me/recommendations").status_code == 401
+
+
+def test_admin_can_run_rebuild(client_with_auth, db, test_user, catalog):
+    assert client_with_auth.post("/admin/jobs/rebuild-recommendations").status_code == 403
+
+    test_user.role = Role.admin
+    db.commit()
+    response = client_with_auth.post("/admin/jobs/rebuild-recommendations")
+    assert response.status_code == 200
+    assert response.json() == {"job": "rebuild-recommendations", "rows": db.query(GameNeighbour).count()}
+
+
+def test_deleting_a_game_removes_its_neighbours(client_with_auth, db, catalog):
+    rebuild_game_neighbours(db)
+    cheat_id = catalog["Cheat"]["id"]
+
+    assert client_with_auth.delete(f"/games/{cheat_id}").status_code == 204
+    assert db.query(GameNeighbour).filter(
+        (GameNeighbour.game_id == cheat_id) | (GameNeighbour.neighbour_id == cheat_id)).count() == 0
@@ -10,6 +10,12 @@ from src.api.users import get_current_active_user
 from src.db.database import Base, get_db
 from src.db.tables import User
 from src.main import app
+from src.services.auth_cache import clear_auth_cache
+from src.services.catalog_snapshot import reset_catalog_snapshot
+from src.services.catalog_version import bump_catalog_version
+from src.services.game_cache import clear_game_cache
+from src.services.search_index import reset_search_index
+from src.services.votes import reset_vote_buffer
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
@@ -33,6 +39,18 @@ def create_test_database():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def reset_in_process_state():
+    # Each test rolls its data back, so in-process indexes must not outlive it
+    reset_search_index()
+    reset_catalog_snapshot()
+    bump_catalog_version()
+    clear_game_cache()
+    clear_auth_cache()
+    reset_vote_buffer()
+    yield
+
+
 @pytest.fixture()
 def db():
     connection = engine.connect()